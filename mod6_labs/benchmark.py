@@ -0,0 +1,157 @@
+# benchmark.py
+"""Latency and throughput benchmark for WeatherService.
+
+Starts the local stand-in API from ``mock_server.py`` (unless ``--url`` is
+given), drives a WeatherService with N concurrent clients and reports
+p50/p95/p99 latency, requests per second and connection counts.
+
+Examples:
+    python benchmark.py --clients 50 --requests 20
+    python benchmark.py --clients 10 --latency 0.1 --error-rate 0.05 --cache
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional
+
+os.environ.setdefault("OPENWEATHER_API_KEY", "benchmark")
+
+from config import Config  # noqa: E402
+from metrics import _percentile  # noqa: E402
+from mock_server import MockWeatherServer  # noqa: E402
+from weather_service import WeatherService, WeatherServiceError  # noqa: E402
+
+
+async def run_benchmark(
+    base_url: str,
+    clients: int = 10,
+    requests_per_client: int = 20,
+    cities: int = 50,
+    endpoint: str = "weather",
+    use_cache: bool = False,
+) -> Dict:
+    """Run the load test and return the measured results."""
+    service = WeatherService()
+    service.base_url = f"{base_url}/weather"
+    service.forecast_url = f"{base_url}/forecast"
+    fetch = service.get_forecast if endpoint == "forecast" else service.get_weather
+    names = [f"City{i:04d}" for i in range(cities)]
+
+    latencies: List[float] = []
+    errors = 0
+
+    async def client(index: int):
+        nonlocal errors
+        for i in range(requests_per_client):
+            # Spread clients over different cities so requests overlap
+            # only when there are fewer cities than clients
+            city = names[(index + i * clients) % len(names)]
+            started = time.perf_counter()
+            try:
+                await fetch(city, bypass_cache=not use_cache)
+            except WeatherServiceError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    async with service:
+        started = time.perf_counter()
+        await asyncio.gather(*(client(i) for i in range(clients)))
+        elapsed = time.perf_counter() - started
+        service_stats = service.stats()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed": elapsed,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": _percentile(latencies, 50),
+        "p95": _percentile(latencies, 95),
+        "p99": _percentile(latencies, 99),
+        "max": latencies[-1] if latencies else 0.0,
+        "service": service_stats,
+    }
+
+
+def print_report(results: Dict, server: Optional[MockWeatherServer]):
+    """Print the benchmark results as a small table."""
+    ms = 1000
+    print("=" * 50)
+    print(f"Requests:        {results['requests']} ({results['errors']} errors)")
+    print(f"Elapsed:         {results['elapsed']:.2f} s")
+    print(f"Throughput:      {results['rps']:.1f} req/s")
+    print(f"Latency p50:     {results['p50'] * ms:.1f} ms")
+    print(f"Latency p95:     {results['p95'] * ms:.1f} ms")
+    print(f"Latency p99:     {results['p99'] * ms:.1f} ms")
+    print(f"Latency max:     {results['max'] * ms:.1f} ms")
+    service = results["service"]
+    print(f"Upstream calls:  {service['upstream_requests']}")
+    print(f"Coalesced calls: {service['coalesced_requests']}")
+    print(f"Retried calls:   {service['retried_requests']}")
+    print(f"Cache hit ratio: {service['cache_hit_ratio']:.1%}")
+    if server is not None:
+        stats = server.stats()
+        print(f"Connections:     {stats['connections_opened']} opened, "
+              f"{stats['max_active_connections']} max concurrent")
+        print(f"Status codes:    {stats['status_counts']}")
+    print("=" * 50)
+
+
+async def main_async(args):
+    # Measure raw service behaviour: no quota throttling or disk cache
+    Config.RATE_LIMIT_PER_MINUTE = args.rate_limit
+    Config.DISK_CACHE_ENABLED = False
+    Config.OBSERVATIONS_ENABLED = False
+    Config.MAX_RETRIES = args.retries
+    Config.MAX_CONNECTIONS = args.max_connections
+    Config.MAX_KEEPALIVE_CONNECTIONS = args.max_connections
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = MockWeatherServer(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+        await server.start()
+        base_url = server.base_url
+
+    try:
+        results = await run_benchmark(
+            base_url,
+            clients=args.clients,
+            requests_per_client=args.requests,
+            cities=args.cities,
+            endpoint=args.endpoint,
+            use_cache=args.cache,
+        )
+        print_report(results, server)
+    finally:
+        if server is not None:
+            await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark WeatherService")
+    parser.add_argument("--url", help="API base URL (default: start a local mock server)")
+    parser.add_argument("--clients", type=int, default=10, help="concurrent clients")
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--cities", type=int, default=50, help="distinct cities to query")
+    parser.add_argument("--endpoint", choices=["weather", "forecast"], default="weather")
+    parser.add_argument("--cache", action="store_true", help="allow in-memory cache hits")
+    parser.add_argument("--latency", type=float, default=0.05, help="mock server delay (s)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="mock server jitter (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="mock 5xx fraction")
+    parser.add_argument("--retries", type=int, default=0, help="service retry attempts")
+    parser.add_argument("--rate-limit", type=float, default=0, help="requests/min, 0 = off")
+    parser.add_argument("--max-connections", type=int, default=Config.MAX_CONNECTIONS)
+    parser.add_argument("--seed", type=int, default=None)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
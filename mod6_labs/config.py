@@ -16,16 +16,93 @@ class Config:
         "OPENWEATHER_BASE_URL", 
         "https://api.openweathermap.org/data/2.5/weather"
     )
+    FORECAST_URL = os.getenv(
+        "OPENWEATHER_FORECAST_URL",
+        "https://api.openweathermap.org/data/2.5/forecast"
+    )
     
     # App Configuration
     APP_TITLE = "Weather App"
     APP_WIDTH = 400
     APP_HEIGHT = 600
+    CHART_POINT_SPACING = 10  # pixels per plotted point in the hourly charts
     
     # API Settings
-    UNITS = "metric"  # metric, imperial, or standard
+    UNITS = "metric"  # default display units: metric, imperial, or standard
     TIMEOUT = 10  # seconds
     
+    # HTTP Connection Pool Settings
+    MAX_CONNECTIONS = int(os.getenv("WEATHER_MAX_CONNECTIONS", "20"))
+    MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("WEATHER_MAX_KEEPALIVE", "10"))
+    KEEPALIVE_EXPIRY = float(os.getenv("WEATHER_KEEPALIVE_EXPIRY", "30"))  # seconds
+    HTTP2 = os.getenv("WEATHER_HTTP2", "false").lower() == "true"  # needs the h2 package
+    
+    # Response Cache Settings
+    CACHE_ENABLED = os.getenv("WEATHER_CACHE_ENABLED", "true").lower() == "true"
+    CACHE_MAX_ENTRIES = int(os.getenv("WEATHER_CACHE_MAX_ENTRIES", "256"))
+    WEATHER_CACHE_TTL = float(os.getenv("WEATHER_CACHE_TTL", "600"))  # seconds
+    FORECAST_CACHE_TTL = float(os.getenv("FORECAST_CACHE_TTL", "1800"))  # seconds
+    
+    # Persistent Cache Settings
+    DISK_CACHE_ENABLED = os.getenv("WEATHER_DISK_CACHE_ENABLED", "true").lower() == "true"
+    DISK_CACHE_PATH = os.getenv(
+        "WEATHER_DISK_CACHE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "weather_cache.db")
+    )
+    STALE_WHILE_REVALIDATE = float(os.getenv("WEATHER_STALE_WHILE_REVALIDATE", "21600"))  # seconds
+    DISK_CACHE_MAX_AGE = float(os.getenv("WEATHER_DISK_CACHE_MAX_AGE", "604800"))  # seconds
+    
+    # Spatial Cache Settings
+    GEO_CACHE_PRECISION = int(os.getenv("WEATHER_GEO_CACHE_PRECISION", "6"))  # geohash chars; 6 = ~1.2 x 0.6 km
+    GEO_CACHE_TOLERANCE = float(os.getenv("WEATHER_GEO_CACHE_TOLERANCE", "1000"))  # metres; 0 = same cell only
+    
+    # Observation History Settings
+    OBSERVATIONS_ENABLED = os.getenv("WEATHER_OBSERVATIONS_ENABLED", "true").lower() == "true"
+    OBSERVATIONS_DIR = os.getenv(
+        "WEATHER_OBSERVATIONS_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "observations")
+    )
+    
+    # Rate Limiting and Retry Settings
+    RATE_LIMIT_PER_MINUTE = float(os.getenv("WEATHER_RATE_LIMIT_PER_MINUTE", "60"))  # 0 disables
+    RATE_LIMIT_BURST = int(os.getenv("WEATHER_RATE_LIMIT_BURST", "10"))
+    MAX_RETRIES = int(os.getenv("WEATHER_MAX_RETRIES", "2"))
+    RETRY_BACKOFF_BASE = float(os.getenv("WEATHER_RETRY_BACKOFF_BASE", "0.5"))  # seconds
+    RETRY_BACKOFF_MAX = float(os.getenv("WEATHER_RETRY_BACKOFF_MAX", "8"))  # seconds
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("WEATHER_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RESET_TIMEOUT = float(os.getenv("WEATHER_CIRCUIT_RESET_TIMEOUT", "30"))  # seconds
+    
+    # Autocomplete Settings
+    GAZETTEER_PATH = os.getenv(
+        "WEATHER_GAZETTEER_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cities.tsv.gz")
+    )
+    SUGGESTION_LIMIT = 5
+    
+    # Search History Settings
+    HISTORY_MAX_ENTRIES = int(os.getenv("WEATHER_HISTORY_MAX_ENTRIES", "20"))
+    HISTORY_VISIBLE_ENTRIES = 8  # shown in the dropdown and kept refreshed
+    HISTORY_HALF_LIFE = float(os.getenv("WEATHER_HISTORY_HALF_LIFE", "604800"))  # seconds
+    
+    # Background Refresh Settings
+    BACKGROUND_REFRESH_ENABLED = os.getenv("WEATHER_BACKGROUND_REFRESH", "true").lower() == "true"
+    BACKGROUND_REFRESH_INTERVAL = float(os.getenv("WEATHER_BACKGROUND_REFRESH_INTERVAL", "480"))  # seconds
+    
+    # Batch Settings
+    BATCH_CONCURRENCY = int(os.getenv("WEATHER_BATCH_CONCURRENCY", "10"))
+    
+    # Icon Cache Settings
+    ASSETS_DIR = os.getenv(
+        "WEATHER_ASSETS_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+    )  # served by Flet; see ft.app(assets_dir=...)
+    ICON_ASSET_PATH = "icons"  # downloaded icons live in ASSETS_DIR/icons
+    ICON_BASE_URL = os.getenv("OPENWEATHER_ICON_URL", "https://openweathermap.org/img/wn")
+    
+    # Diagnostics Settings
+    METRICS_WINDOW = float(os.getenv("WEATHER_METRICS_WINDOW", "300"))  # seconds
+    DEBUG_PANEL = os.getenv("WEATHER_DEBUG_PANEL", "false").lower() == "true"
+    
     @classmethod
     def validate(cls):
         """Validate that required configuration is present."""
@@ -0,0 +1,320 @@
+# dashboard.py
+"""Multi-city dashboard rendered as a windowed (virtualized) list."""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+import flet as ft
+
+from gazetteer import City, Gazetteer
+from models import WeatherSnapshot
+from units import TEMP_SYMBOLS, convert_temp
+from update_batcher import UpdateBatcher, patch
+from weather_service import Query, WeatherService
+
+ROW_HEIGHT = 56  # every row has the same height, so offsets map to rows
+OVERSCAN = 4  # extra rows kept above and below the viewport
+REFRESH_UPDATE_INTERVAL = 0.2  # seconds between page updates while refreshing
+
+
+@dataclass(slots=True, eq=False)
+class DashboardEntry:
+    """One tracked city and its latest result."""
+
+    label: str
+    city: Optional[City] = None  # set when picked from the gazetteer
+    snapshot: Optional[WeatherSnapshot] = None
+    error: Optional[str] = None
+
+    @property
+    def query(self) -> Query:
+        if self.city is not None:
+            return (self.city.lat, self.city.lon)
+        return self.label
+
+
+class Dashboard:
+    """Tracks many cities and shows them in a list that stays fast at 500+.
+
+    Only the rows inside (or just around) the visible part of the list
+    exist as controls. They are recycled while scrolling: two spacers stand
+    in for the rows above and below, and the row controls are patched with
+    whichever entries come into view. Refreshes stream in through
+    ``WeatherService.get_weather_many`` with bounded concurrency, and a
+    result only touches the UI when its row is visible.
+    """
+
+    def __init__(
+        self,
+        page: ft.Page,
+        service: WeatherService,
+        gazetteer: Gazetteer,
+        updates: UpdateBatcher,
+        units: Callable[[], str],
+        set_icon: Callable[[ft.Image, str, int], bool],
+        on_select: Callable[[DashboardEntry], None],
+        concurrency: int = 10,
+    ):
+        self.page = page
+        self.service = service
+        self.gazetteer = gazetteer
+        self.updates = updates
+        self.units = units
+        self.set_icon = set_icon
+        self.on_select = on_select
+        self.concurrency = concurrency
+        self.entries: List[DashboardEntry] = []
+        self._by_label: Dict[str, DashboardEntry] = {}
+        self.refresh_future = None
+
+        # Scroll position reported by the client
+        self._offset = 0.0
+        self._viewport = 400.0
+        self._first = 0
+        self._rows: List[ft.Container] = []  # recycled row controls
+
+        self._top = ft.Container(height=0)
+        self._bottom = ft.Container(height=0)
+        self.list_view = ft.ListView(
+            controls=[self._top, self._bottom],
+            expand=True,
+            on_scroll=self.on_scroll,
+            on_scroll_interval=50,
+        )
+        self.add_input = ft.TextField(
+            label="Add cities",
+            hint_text="Separate several with ;",
+            dense=True,
+            expand=True,
+            on_submit=self.on_add,
+        )
+        self.status_text = ft.Text("", size=12, italic=True)
+        self.view = ft.Column(
+            [
+                ft.Row(
+                    [
+                        self.add_input,
+                        ft.IconButton(icon=ft.Icons.ADD, tooltip="Add", on_click=self.on_add),
+                        ft.IconButton(
+                            icon=ft.Icons.REFRESH,
+                            tooltip="Refresh all",
+                            on_click=self.on_refresh,
+                        ),
+                    ],
+                ),
+                self.status_text,
+                self.list_view,
+            ],
+            expand=True,
+            visible=False,
+        )
+
+    # ------------------ CITIES ------------------ #
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _entry_for(self, text: str) -> Optional[DashboardEntry]:
+        """Resolve typed text to an entry, using the gazetteer's coordinates
+        only when it knows a city by exactly that name ("name" or "name, CC").
+        """
+        text = " ".join(text.split())
+        if not text:
+            return None
+        city = self.gazetteer.lookup(text)
+        if city is not None:
+            return DashboardEntry(label=city.label, city=city)
+        return DashboardEntry(label=text)
+
+    def add(self, cities: Iterable[Union[str, City]]) -> List[DashboardEntry]:
+        """Track more cities (names or City objects); returns the new entries."""
+        added = []
+        for city in cities:
+            if isinstance(city, City):
+                entry = DashboardEntry(label=city.label, city=city)
+            else:
+                entry = self._entry_for(city)
+            if entry is None or entry.label in self._by_label:
+                continue
+            self.entries.append(entry)
+            self._by_label[entry.label] = entry
+            added.append(entry)
+        if added:
+            self.render()
+        return added
+
+    def remove(self, label: str):
+        entry = self._by_label.pop(label, None)
+        if entry is not None:
+            self.entries.remove(entry)
+            self.render()
+
+    async def on_add(self, e):
+        new = self.add(self.add_input.value.split(";"))
+        self.add_input.value = ""
+        self.updates.request()
+        if new:
+            self.start_refresh(new)
+
+    # ------------------ REFRESH ------------------ #
+
+    async def on_refresh(self, e):
+        self.start_refresh()
+
+    def start_refresh(self, entries: Optional[List[DashboardEntry]] = None):
+        """Refresh the given entries (default: all), replacing a full refresh."""
+        if entries is None and self.refresh_future and not self.refresh_future.done():
+            self.refresh_future.cancel()
+        future = self.page.run_task(self.refresh, entries)
+        if entries is None:
+            self.refresh_future = future
+
+    async def refresh(self, entries: Optional[List[DashboardEntry]] = None):
+        """Fetch current weather for entries, updating rows as results arrive."""
+        entries = list(self.entries if entries is None else entries)
+        by_query = {entry.query: entry for entry in entries}
+        done = failed = 0
+        self.status_text.value = f"Refreshing {len(entries)} cities…"
+        self.updates.request()
+
+        # Results arrive one by one; send them at most every interval
+        dirty = False
+        last_update = time.monotonic()
+        async for result in self.service.get_weather_many(by_query, self.concurrency):
+            entry = by_query[result.query]
+            done += 1
+            if result.ok:
+                entry.snapshot = WeatherSnapshot.from_api(result.data)
+                entry.error = None
+            else:
+                entry.error = str(result.error)
+                failed += 1
+            dirty |= self._render_entry(entry)
+            dirty |= patch(self.status_text, value=f"Updated {done}/{len(entries)}")
+            if dirty and time.monotonic() - last_update >= REFRESH_UPDATE_INTERVAL:
+                self.updates.request()
+                dirty = False
+                last_update = time.monotonic()
+
+        summary = f"Updated {done} cities"
+        if failed:
+            summary += f", {failed} failed"
+        self.status_text.value = summary
+        self.updates.request()
+
+    # ------------------ RENDERING ------------------ #
+
+    async def on_scroll(self, e: ft.OnScrollEvent):
+        self._offset = e.pixels or 0.0
+        if e.viewport_dimension:
+            self._viewport = e.viewport_dimension
+        self.render()
+
+    def render(self):
+        """Show the rows around the scroll position; patch what changed."""
+        total = len(self.entries)
+        window = math.ceil(self._viewport / ROW_HEIGHT) + 2 * OVERSCAN
+        first = int(self._offset // ROW_HEIGHT) - OVERSCAN
+        first = max(0, min(first, total - window))
+        count = min(window, total - first)
+
+        while len(self._rows) < count:
+            self._rows.append(self._create_row())
+
+        changed = patch(self._top, height=first * ROW_HEIGHT)
+        changed |= patch(self._bottom, height=(total - first - count) * ROW_HEIGHT)
+        if len(self.list_view.controls) != count + 2:
+            self.list_view.controls = [self._top, *self._rows[:count], self._bottom]
+            changed = True
+        self._first = first
+        for row, entry in zip(self._rows, self.entries[first:first + count]):
+            changed |= self._update_row(row, entry)
+
+        if changed:
+            self.updates.request()
+
+    def _render_entry(self, entry: DashboardEntry) -> bool:
+        """Patch the row of one entry if it is currently on screen."""
+        count = len(self.list_view.controls) - 2
+        try:
+            index = self.entries.index(entry, self._first, self._first + count)
+        except ValueError:
+            return False  # off screen: drawn when scrolled into view
+        return self._update_row(self._rows[index - self._first], entry)
+
+    def _create_row(self) -> ft.Container:
+        async def on_remove(e):
+            self.remove(row.data)
+
+        async def on_click(e):
+            self._select(row.data)
+
+        row = ft.Container(
+            height=ROW_HEIGHT,
+            padding=ft.padding.symmetric(horizontal=8),
+            border_radius=8,
+            content=ft.Row(
+                [
+                    ft.Image(
+                        width=40,
+                        height=40,
+                        error_content=ft.Icon(ft.Icons.CLOUD_OUTLINED, size=20),
+                    ),
+                    ft.Column(
+                        [
+                            ft.Text("", weight=ft.FontWeight.BOLD, no_wrap=True),
+                            ft.Text("", size=12, no_wrap=True),
+                        ],
+                        spacing=0,
+                        alignment=ft.MainAxisAlignment.CENTER,
+                        expand=True,
+                    ),
+                    ft.Text("", size=18, weight=ft.FontWeight.BOLD),
+                    ft.IconButton(
+                        icon=ft.Icons.CLOSE,
+                        icon_size=16,
+                        tooltip="Remove",
+                        on_click=on_remove,
+                    ),
+                ],
+            ),
+            on_click=on_click,
+        )
+        return row
+
+    def _update_row(self, row: ft.Container, entry: DashboardEntry) -> bool:
+        image, labels, temp_text, _ = row.content.controls
+        title, subtitle = labels.controls
+        snapshot = entry.snapshot
+
+        row.data = entry.label
+        changed = patch(title, value=entry.label)
+        if snapshot is not None:
+            units = self.units()
+            temp = convert_temp(snapshot.temp, units)
+            changed |= patch(image, visible=True)
+            changed |= self.set_icon(image, snapshot.icon, 1)
+            changed |= patch(temp_text, value=f"{temp:.0f}{TEMP_SYMBOLS[units]}")
+        else:
+            changed |= patch(image, visible=False)
+            changed |= patch(temp_text, value="–")
+        if entry.error:
+            description = entry.error
+        elif snapshot is not None:
+            description = snapshot.description
+        else:
+            description = "Loading…"
+        changed |= patch(subtitle, value=description)
+        return changed
+
+    def _select(self, label: str):
+        entry = self._by_label.get(label)
+        if entry is not None:
+            self.on_select(entry)
+
+    def cancel(self):
+        """Stop a running refresh."""
+        if self.refresh_future and not self.refresh_future.done():
+            self.refresh_future.cancel()
@@ -0,0 +1,96 @@
+# disk_cache.py
+"""Persistent SQLite cache for weather API responses."""
+
+import json
+import sqlite3
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class DiskCache:
+    """Stores the last response for each query in a local SQLite file.
+
+    Entries survive app restarts, so previously searched cities can be shown
+    immediately on launch and when the network is unavailable. Database
+    errors are swallowed and treated as cache misses; the cache must never
+    break a request.
+    """
+
+    def __init__(self, path: str, max_age: float = 7 * 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the table."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    fetched_at REAL NOT NULL,
+                    payload TEXT NOT NULL
+                )
+            ''')
+            conn.commit()
+            self._conn = conn
+            self.prune()
+        return self._conn
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        """Turn a cache key tuple into a stable string."""
+        if isinstance(key, tuple):
+            return "|".join(str(part) for part in key)
+        return str(key)
+
+    def get(self, key: Hashable) -> Optional[Tuple[Dict, float]]:
+        """Return ``(data, fetched_at)`` for a key, or None if not stored."""
+        try:
+            row = self._connect().execute(
+                "SELECT payload, fetched_at FROM responses WHERE key = ?",
+                (self._key(key),),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+        payload, fetched_at = row
+        if time.time() - fetched_at > self.max_age:
+            return None
+        return json.loads(payload), fetched_at
+
+    def set(self, key: Hashable, data: Dict, fetched_at: Optional[float] = None):
+        """Store the latest response for a key."""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, fetched_at, payload) "
+                "VALUES (?, ?, ?)",
+                (self._key(key), fetched_at, json.dumps(data, separators=(",", ":"))),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def prune(self):
+        """Delete entries older than ``max_age``."""
+        try:
+            conn = self._connect()
+            conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?",
+                (time.time() - self.max_age,),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
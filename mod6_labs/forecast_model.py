@@ -0,0 +1,273 @@
+# forecast_model.py
+"""Columnar NumPy representation of the 5-day / 3-hour forecast."""
+
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from models import ForecastPoint
+
+SECONDS_PER_DAY = 86400
+EPOCH = date(1970, 1, 1)
+
+
+class DailyForecast:
+    """Per-local-day aggregates, one array element per day."""
+
+    def __init__(
+        self,
+        days: np.ndarray,
+        temp_min: np.ndarray,
+        temp_max: np.ndarray,
+        temp_mean: np.ndarray,
+        humidity_mean: np.ndarray,
+        wind_max: np.ndarray,
+        condition_id: np.ndarray,
+        icons: List[str],
+        descriptions: List[str],
+    ):
+        self.days = days  # local days since the Unix epoch
+        self.temp_min = temp_min
+        self.temp_max = temp_max
+        self.temp_mean = temp_mean
+        self.humidity_mean = humidity_mean
+        self.wind_max = wind_max
+        self.condition_id = condition_id
+        self.icons = icons
+        self.descriptions = descriptions
+        self.dates = [EPOCH + timedelta(days=int(day)) for day in days]
+        self.labels = [d.strftime("%a") for d in self.dates]
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+
+class HourlySeries:
+    """Downsampled temperature and precipitation series for a chart.
+
+    X values are hours since the first forecast entry. Temperature and
+    precipitation are downsampled separately so each keeps its own peaks.
+    """
+
+    def __init__(
+        self,
+        temp_hours: np.ndarray,
+        temp: np.ndarray,
+        pop_hours: np.ndarray,
+        pop: np.ndarray,
+        day_ticks: List[Tuple[float, str]],
+        span: float,
+    ):
+        self.temp_hours = temp_hours
+        self.temp = temp
+        self.pop_hours = pop_hours
+        self.pop = pop  # probability of precipitation, 0..1
+        self.day_ticks = day_ticks  # (hour, weekday) at each local midnight
+        self.span = span  # hours covered by the forecast
+
+    def __len__(self) -> int:
+        return len(self.temp_hours)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of at most ``threshold`` points that keep the
+    visual shape of the series: the first and last points plus, for each
+    bucket in between, the point forming the largest triangle with the
+    previously chosen point and the average of the next bucket.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (threshold - 2)
+    chosen = np.empty(threshold, dtype=np.int64)
+    chosen[0] = a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        chosen[i + 1] = a
+    chosen[-1] = n - 1
+    return chosen
+
+
+class ForecastModel:
+    """Forecast entries converted once into parallel NumPy arrays.
+
+    Parsing the API response happens a single time per fetch; views read
+    the arrays (or the cached daily aggregates) on every redraw instead of
+    walking the raw JSON again.
+    """
+
+    def __init__(
+        self,
+        timestamps: np.ndarray,
+        temp: np.ndarray,
+        feels_like: np.ndarray,
+        humidity: np.ndarray,
+        wind_speed: np.ndarray,
+        pop: np.ndarray,
+        condition_id: np.ndarray,
+        icons: List[str],
+        descriptions: List[str],
+        tz_offset: int = 0,
+        city: str = "",
+        as_of: Optional[float] = None,
+    ):
+        self.timestamps = timestamps  # UTC seconds
+        self.temp = temp
+        self.feels_like = feels_like
+        self.humidity = humidity
+        self.wind_speed = wind_speed
+        self.pop = pop
+        self.condition_id = condition_id
+        self.icons = icons
+        self.descriptions = descriptions
+        self.tz_offset = tz_offset  # seconds east of UTC
+        self.city = city
+        self.as_of = as_of  # fetch time when served from saved data
+        self._daily: Optional[DailyForecast] = None
+        self._hourly: Dict[int, HourlySeries] = {}
+
+    @classmethod
+    def from_response(cls, data: Dict) -> "ForecastModel":
+        """Build the model from an OpenWeatherMap ``/forecast`` response."""
+        entries = data.get("list", [])
+        weather = [(entry.get("weather") or [{}])[0] for entry in entries]
+        return cls(
+            timestamps=np.fromiter((e.get("dt", 0) for e in entries), np.int64, len(entries)),
+            temp=np.fromiter(
+                (e.get("main", {}).get("temp", 0) for e in entries), np.float64, len(entries)
+            ),
+            feels_like=np.fromiter(
+                (e.get("main", {}).get("feels_like", 0) for e in entries), np.float64, len(entries)
+            ),
+            humidity=np.fromiter(
+                (e.get("main", {}).get("humidity", 0) for e in entries), np.float64, len(entries)
+            ),
+            wind_speed=np.fromiter(
+                (e.get("wind", {}).get("speed", 0) for e in entries), np.float64, len(entries)
+            ),
+            pop=np.fromiter((e.get("pop", 0) for e in entries), np.float64, len(entries)),
+            condition_id=np.fromiter((w.get("id", 800) for w in weather), np.int32, len(entries)),
+            icons=[w.get("icon", "01d") for w in weather],
+            descriptions=[w.get("description", "").title() for w in weather],
+            tz_offset=data.get("city", {}).get("timezone", 0),
+            city=data.get("city", {}).get("name", ""),
+            as_of=data.get("_as_of"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def point(self, i: int) -> ForecastPoint:
+        """Return entry ``i`` as a ForecastPoint."""
+        return ForecastPoint(
+            timestamp=int(self.timestamps[i]),
+            temp=float(self.temp[i]),
+            feels_like=float(self.feels_like[i]),
+            humidity=float(self.humidity[i]),
+            wind_speed=float(self.wind_speed[i]),
+            pop=float(self.pop[i]),
+            condition_id=int(self.condition_id[i]),
+            description=self.descriptions[i],
+            icon=self.icons[i],
+        )
+
+    def points(self) -> Iterator[ForecastPoint]:
+        """Iterate over the entries as ForecastPoint records."""
+        for i in range(len(self)):
+            yield self.point(i)
+
+    @property
+    def local_days(self) -> np.ndarray:
+        """Local calendar day (days since epoch) of every entry."""
+        return (self.timestamps + self.tz_offset) // SECONDS_PER_DAY
+
+    def daily(self) -> DailyForecast:
+        """Aggregate entries per local day (computed once, then cached)."""
+        if self._daily is None:
+            self._daily = self._aggregate()
+        return self._daily
+
+    def _aggregate(self) -> DailyForecast:
+        if len(self) == 0:
+            empty = np.empty(0)
+            return DailyForecast(
+                empty.astype(np.int64), empty, empty, empty, empty, empty,
+                empty.astype(np.int32), [], [],
+            )
+
+        # Entries are chronological, so each day is a contiguous run
+        days = self.local_days
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        counts = np.diff(np.r_[starts, len(days)])
+        day_index = np.repeat(np.arange(len(starts)), counts)
+
+        # Dominant condition: most frequent id per day, earliest on ties
+        keys = day_index.astype(np.int64) * 1000 + self.condition_id
+        unique_keys, first_index, key_counts = np.unique(
+            keys, return_index=True, return_counts=True
+        )
+        key_day = unique_keys // 1000
+        order = np.lexsort((first_index, -key_counts, key_day))
+        _, best = np.unique(key_day[order], return_index=True)
+        representative = first_index[order[best]]
+
+        return DailyForecast(
+            days=days[starts],
+            temp_min=np.minimum.reduceat(self.temp, starts),
+            temp_max=np.maximum.reduceat(self.temp, starts),
+            temp_mean=np.add.reduceat(self.temp, starts) / counts,
+            humidity_mean=np.add.reduceat(self.humidity, starts) / counts,
+            wind_max=np.maximum.reduceat(self.wind_speed, starts),
+            condition_id=self.condition_id[representative],
+            # Daily cards always use the daytime variant of the icon
+            icons=[self.icons[i][:2] + "d" for i in representative],
+            descriptions=[self.descriptions[i] for i in representative],
+        )
+
+    def hourly(self, max_points: int) -> HourlySeries:
+        """Chart series with at most ``max_points`` points (cached per size)."""
+        series = self._hourly.get(max_points)
+        if series is None:
+            series = self._hourly[max_points] = self._downsample(max_points)
+        return series
+
+    def _downsample(self, max_points: int) -> HourlySeries:
+        if len(self) == 0:
+            empty = np.empty(0)
+            return HourlySeries(empty, empty, empty, empty, [], 0.0)
+
+        hours = (self.timestamps - self.timestamps[0]) / 3600
+        temp_index = lttb(hours, self.temp, max_points)
+        pop_index = lttb(hours, self.pop, max_points)
+
+        # A tick at every local midnight inside the forecast range
+        days = self.local_days
+        midnights = days[np.flatnonzero(days[1:] != days[:-1]) + 1]
+        day_ticks = [
+            (
+                (int(day) * SECONDS_PER_DAY - self.tz_offset - int(self.timestamps[0])) / 3600,
+                (EPOCH + timedelta(days=int(day))).strftime("%a"),
+            )
+            for day in midnights
+        ]
+        return HourlySeries(
+            temp_hours=hours[temp_index],
+            temp=self.temp[temp_index],
+            pop_hours=hours[pop_index],
+            pop=self.pop[pop_index],
+            day_ticks=day_ticks,
+            span=float(hours[-1]),
+        )
@@ -0,0 +1,180 @@
+# gazetteer.py
+"""Offline city list with fast prefix search for autocomplete."""
+
+import bisect
+import gzip
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class City:
+    """A place that can be looked up by coordinates."""
+
+    name: str
+    country: str
+    lat: float
+    lon: float
+    population: int = 0
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}, {self.country}" if self.country else self.name
+
+
+def normalize(text: str) -> str:
+    """Fold case and strip accents so "sao" matches "São"."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.split()).casefold()
+
+
+class Gazetteer:
+    """Sorted-array index over a city list.
+
+    The file is read on first use. Names are normalized and sorted once, so
+    a prefix query is two binary searches plus a top-k pick by population
+    inside the matching range.
+
+    Two file formats are accepted, optionally gzip-compressed:
+    the bundled ``name, country, lat, lon, population`` TSV with a header
+    row, and GeoNames dumps such as ``cities15000.txt``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._keys: List[str] = []
+        self._names: List[str] = []
+        self._countries = np.empty(0, dtype="U3")
+        self._lat = np.empty(0, dtype=np.float32)
+        self._lon = np.empty(0, dtype=np.float32)
+        self._population = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self._keys)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self):
+        """Read and index the city file (only the first call does work)."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+
+            names, countries, lats, lons, populations = [], [], [], [], []
+            opener = gzip.open if self.path.endswith(".gz") else open
+            try:
+                with opener(self.path, "rt", encoding="utf-8") as f:
+                    for line in f:
+                        fields = line.rstrip("\n").split("\t")
+                        if len(fields) >= 15:  # GeoNames dump
+                            name, lat, lon = fields[1], fields[4], fields[5]
+                            country, population = fields[8], fields[14]
+                        elif len(fields) == 5:
+                            name, country, lat, lon, population = fields
+                        else:
+                            continue
+                        try:
+                            lats.append(float(lat))
+                            lons.append(float(lon))
+                            populations.append(int(population or 0))
+                        except ValueError:
+                            continue  # header row or malformed line
+                        names.append(name)
+                        countries.append(country)
+            except OSError:
+                pass  # no city list: autocomplete stays empty
+
+            keys = [normalize(name) for name in names]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self._keys = [keys[i] for i in order]
+            self._names = [names[i] for i in order]
+            index = np.asarray(order, dtype=np.int64)
+            self._countries = np.asarray(countries, dtype="U3")[index]
+            self._lat = np.asarray(lats, dtype=np.float32)[index]
+            self._lon = np.asarray(lons, dtype=np.float32)[index]
+            self._population = np.asarray(populations, dtype=np.int64)[index]
+            self._loaded = True
+
+    def _city(self, i: int) -> City:
+        return City(
+            name=self._names[i],
+            country=str(self._countries[i]),
+            lat=round(float(self._lat[i]), 4),
+            lon=round(float(self._lon[i]), 4),
+            population=int(self._population[i]),
+        )
+
+    def search(self, text: str, limit: int = 5) -> List[City]:
+        """
+        Return up to ``limit`` cities whose name starts with ``text``.
+
+        Args:
+            text: What the user typed; "name, CC" also filters by country
+            limit: Maximum number of suggestions
+
+        Returns:
+            Matching cities, most populous first
+        """
+        name, _, country = text.partition(",")
+        prefix = normalize(name)
+        country = country.strip().upper()
+        if not prefix or limit <= 0:
+            return []
+        self.load()
+
+        lo = bisect.bisect_left(self._keys, prefix)
+        hi = bisect.bisect_left(self._keys, prefix + "\uffff", lo)
+        if lo == hi:
+            return []
+
+        candidates = np.arange(lo, hi)
+        if country:
+            candidates = candidates[
+                np.char.startswith(self._countries[lo:hi], country)
+            ]
+            if len(candidates) == 0:
+                return []
+
+        population = self._population[candidates]
+        if len(candidates) > limit:
+            top = np.argpartition(-population, limit - 1)[:limit]
+            candidates, population = candidates[top], population[top]
+        ranked = candidates[np.argsort(-population, kind="stable")]
+        return [self._city(int(i)) for i in ranked]
+
+    def lookup(self, text: str) -> Optional[City]:
+        """
+        Return the city named exactly ``text`` ("name" or "name, CC").
+
+        Names are compared after normalization (case and accents ignored);
+        when several cities share the name, the most populous wins.
+        Returns None if there is no exact match.
+        """
+        name, _, country = text.partition(",")
+        key = normalize(name)
+        country = country.strip().upper()
+        if not key:
+            return None
+        self.load()
+
+        lo = bisect.bisect_left(self._keys, key)
+        hi = bisect.bisect_right(self._keys, key, lo)
+        candidates = np.arange(lo, hi)
+        if country:
+            candidates = candidates[self._countries[lo:hi] == country]
+        if len(candidates) == 0:
+            return None
+        best = candidates[int(np.argmax(self._population[candidates]))]
+        return self._city(int(best))
@@ -0,0 +1,142 @@
+# history.py
+"""Search history ranked by frecency and persisted in client storage."""
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from gazetteer import City, normalize
+
+
+@dataclass(slots=True)
+class HistoryEntry:
+    """A searched city with its decaying usage score."""
+
+    label: str
+    score: float = 0.0  # decayed visit count as of ``last_used``
+    last_used: float = 0.0  # Unix time
+    count: int = 0
+    city: Optional[City] = None  # exact location when picked from suggestions
+
+    def to_json(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["city"] = asdict(self.city) if self.city else None
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "HistoryEntry":
+        city = data.get("city")
+        return cls(
+            label=data["label"],
+            score=float(data.get("score", 0.0)),
+            last_used=float(data.get("last_used", 0.0)),
+            count=int(data.get("count", 0)),
+            city=City(**city) if city else None,
+        )
+
+
+class SearchHistory:
+    """Recently and frequently searched cities.
+
+    Each search adds one point to a city's score, and scores halve every
+    ``half_life`` seconds, so a city searched daily outranks one searched
+    many times last month. Only the ``max_entries`` best entries are kept.
+    Labels are matched ignoring case, accents and extra spaces, so
+    "london" counts towards "London"; an entry keeps its first label.
+
+    ``storage`` is Flet's ``page.client_storage`` (or anything with the
+    same ``get_async``/``set_async`` methods); the history is stored as
+    JSON under ``key``.
+    """
+
+    def __init__(
+        self,
+        storage,
+        key: str = "weather_app.history",
+        max_entries: int = 20,
+        half_life: float = 7 * 86400,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.storage = storage
+        self.key = key
+        self.max_entries = max_entries
+        self.half_life = half_life
+        self._clock = clock
+        self._entries: Dict[str, HistoryEntry] = {}  # normalized label -> entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, label: str) -> bool:
+        return normalize(label) in self._entries
+
+    def get(self, label: str) -> Optional[HistoryEntry]:
+        return self._entries.get(normalize(label))
+
+    def frecency(self, entry: HistoryEntry, now: Optional[float] = None) -> float:
+        """Score of an entry decayed to ``now``."""
+        now = self._clock() if now is None else now
+        return entry.score * 0.5 ** ((now - entry.last_used) / self.half_life)
+
+    def ranked(self, limit: Optional[int] = None) -> List[HistoryEntry]:
+        """Entries from highest to lowest frecency."""
+        now = self._clock()
+        entries = sorted(
+            self._entries.values(),
+            key=lambda entry: self.frecency(entry, now),
+            reverse=True,
+        )
+        return entries[:limit]
+
+    def labels(self, limit: Optional[int] = None) -> List[str]:
+        return [entry.label for entry in self.ranked(limit)]
+
+    def record(self, label: str, city: Optional[City] = None) -> HistoryEntry:
+        """Count a search for ``label``, evicting the weakest entry if full."""
+        now = self._clock()
+        key = normalize(label)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = HistoryEntry(label=label)
+        entry.score = self.frecency(entry, now) + 1
+        entry.last_used = now
+        entry.count += 1
+        if city is not None:
+            entry.city = city
+
+        while len(self._entries) > self.max_entries:
+            weakest = min(
+                (k for k, e in self._entries.items() if e is not entry),
+                key=lambda k: self.frecency(self._entries[k], now),
+            )
+            del self._entries[weakest]
+        return entry
+
+    def remove(self, label: str):
+        self._entries.pop(normalize(label), None)
+
+    # ------------------ PERSISTENCE ------------------ #
+
+    async def load(self):
+        """Read the saved history; a missing or corrupt value is ignored."""
+        try:
+            data = await self.storage.get_async(self.key)
+        except Exception:
+            return  # storage unavailable (e.g. the client disconnected)
+        if not isinstance(data, list):
+            return
+        for item in data:
+            try:
+                entry = HistoryEntry.from_json(item)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+            self._entries.setdefault(normalize(entry.label), entry)
+
+    async def save(self):
+        """Write the history to storage."""
+        try:
+            await self.storage.set_async(
+                self.key, [entry.to_json() for entry in self.ranked()]
+            )
+        except Exception:
+            pass  # best effort: the in-memory history still works
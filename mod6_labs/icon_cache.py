@@ -0,0 +1,121 @@
+# icon_cache.py
+"""Local cache for the OpenWeatherMap condition icons."""
+
+import asyncio
+import os
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import httpx
+
+# Every icon code the API uses: day ("d") and night ("n") variants
+ICON_CODES = tuple(
+    f"{number:02d}{variant}"
+    for number in (1, 2, 3, 4, 9, 10, 11, 13, 50)
+    for variant in "dn"
+)
+SCALES = (1, 2)  # plain and "@2x" images
+
+
+class IconCache:
+    """Serves weather icons from the app's assets instead of the web.
+
+    Icons are downloaded once into ``asset_path`` under Flet's
+    ``assets_dir`` and then referenced by their asset path (e.g.
+    ``/icons/01d.png``). The client loads each image once by URL, so page
+    updates carry only the short path, never the image bytes.
+    """
+
+    def __init__(self, assets_dir: str, asset_path: str, base_url: str):
+        self.asset_path = asset_path.strip("/")
+        self.directory = os.path.join(assets_dir, self.asset_path)
+        self.base_url = base_url.rstrip("/")
+        self._present: Set[Tuple[str, int]] = set()  # icons known to be on disk
+        self._downloads: Dict[Hashable, asyncio.Task] = {}
+
+    @staticmethod
+    def _filename(code: str, scale: int) -> str:
+        return f"{code}@2x.png" if scale == 2 else f"{code}.png"
+
+    def path(self, code: str, scale: int = 1) -> str:
+        return os.path.join(self.directory, self._filename(code, scale))
+
+    def url(self, code: str, scale: int = 1) -> str:
+        """Remote address of an icon, for when it is not cached yet."""
+        return f"{self.base_url}/{self._filename(code, scale)}"
+
+    def src(self, code: str, scale: int = 1) -> str:
+        """Asset path of an icon, for ``ft.Image(src=...)``."""
+        return f"/{self.asset_path}/{self._filename(code, scale)}"
+
+    def get(self, code: str, scale: int = 1) -> Optional[str]:
+        """Return an icon's asset path, or None if it is not on disk."""
+        if code not in ICON_CODES or scale not in SCALES:
+            return None
+        key = (code, scale)
+        if key not in self._present:
+            if not os.path.exists(self.path(code, scale)):
+                return None
+            self._present.add(key)
+        return self.src(code, scale)
+
+    def missing(self) -> List[Tuple[str, int]]:
+        """(code, scale) pairs that have not been downloaded yet."""
+        return [
+            (code, scale)
+            for code in ICON_CODES
+            for scale in SCALES
+            if not os.path.exists(self.path(code, scale))
+        ]
+
+    async def download(self, client: httpx.AsyncClient, code: str, scale: int = 1) -> bool:
+        """Fetch one icon into the directory; returns True if it is now cached."""
+        if code not in ICON_CODES or scale not in SCALES:
+            return False
+        if os.path.exists(self.path(code, scale)):
+            return True
+
+        # Concurrent requests for the same icon share one download
+        key = (code, scale)
+        task = self._downloads.get(key)
+        if task is None:
+            task = asyncio.create_task(self._download(client, code, scale))
+            self._downloads[key] = task
+            task.add_done_callback(lambda t: self._downloads.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _download(self, client: httpx.AsyncClient, code: str, scale: int) -> bool:
+        try:
+            response = await client.get(self.url(code, scale))
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return False  # offline: keep using the remote URL for now
+
+        path = self.path(code, scale)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary name first so readers never see half a file
+            partial = f"{path}.part"
+            with open(partial, "wb") as f:
+                f.write(response.content)
+            os.replace(partial, path)
+        except OSError:
+            return False
+        self._present.add((code, scale))
+        return True
+
+    async def prefetch(
+        self,
+        client: httpx.AsyncClient,
+        icons: Optional[Iterable] = None,
+        concurrency: int = 4,
+    ) -> int:
+        """Download every missing icon; returns how many are now cached."""
+        icons = list(self.missing() if icons is None else icons)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(code: str, scale: int) -> bool:
+            async with semaphore:
+                return await self.download(client, code, scale)
+
+        results = await asyncio.gather(*(fetch(code, scale) for code, scale in icons))
+        return sum(results)
@@ -1,6 +1,22 @@
 """Weather Application using Flet v0.28.3"""
 
+import asyncio
+import functools
 import flet as ft
+import numpy as np
+from datetime import datetime
+from dashboard import Dashboard, DashboardEntry
+from forecast_model import ForecastModel
+from gazetteer import City, Gazetteer
+from history import SearchHistory
+from icon_cache import IconCache
+from models import WeatherSnapshot
+from scheduler import RefreshScheduler
+from theme import Palette, classify_mood, get_palette, get_theme
+from units import (
+    SPEED_SYMBOLS, TEMP_SYMBOLS, convert_speed, convert_temp, next_units,
+)
+from update_batcher import batcher_for, patch
 from weather_service import WeatherService
 from config import Config
 
@@ -10,13 +26,43 @@ class WeatherApp:
 
     def __init__(self, page: ft.Page):
         self.page = page
+        self.updates = batcher_for(page)  # coalesces page.update() calls
         self.weather_service = WeatherService()
-        self.search_history = []
-        self.last_weather_data = None
-        self.current_unit = "metric"
+        self.gazetteer = Gazetteer(Config.GAZETTEER_PATH)
+        self.icon_cache = IconCache(
+            Config.ASSETS_DIR, Config.ICON_ASSET_PATH, Config.ICON_BASE_URL
+        )
+        self.selected_city = None  # City picked from the suggestions
+        self.history = SearchHistory(
+            page.client_storage,
+            max_entries=Config.HISTORY_MAX_ENTRIES,
+            half_life=Config.HISTORY_HALF_LIFE,
+        )
+        self.history_options = {}  # label -> dropdown option, reused across updates
+        self.pinned_cities = []  # pinned locations as searched: City or typed text
+        self.refresh_scheduler = RefreshScheduler(
+            self.weather_service, interval=Config.BACKGROUND_REFRESH_INTERVAL
+        )
+        self.current = None  # WeatherSnapshot
+        self.current_location = None  # City or typed text the current data is for
+        self.alerted_snapshot = None  # last reading that raised the heat alert
+        self.forecast_model = None
+        self.pending_sections = set()  # sections still loading for this search
+        self.section_renderers = {
+            "current": self.show_current,
+            "forecast": self.show_forecast,
+        }
+        self.current_unit = Config.UNITS  # display units; data stays metric
         self.current_mood = "default"  
+        self.search_generation = 0
+        self.search_future = None
         self.setup_page()
         self.build_ui()
+        if Config.BACKGROUND_REFRESH_ENABLED:
+            self.page.run_task(self.start_background_refresh)
+        if self.icon_cache.missing():
+            self.page.run_task(self.prefetch_icons)
+        self.page.run_task(self.load_history)
 
     # ------------------ BASIC UI SETUP ------------------ #
 
@@ -30,176 +76,209 @@ class WeatherApp:
         self.page.window.height = Config.APP_HEIGHT
         self.page.window.resizable = False
         self.page.window.center()
+        self.page.on_close = self.on_close
+        self.page.on_app_lifecycle_state_change = self.on_lifecycle_change
+        self.page.on_resized = self.on_resized
+
+    async def on_close(self, e):
+        """Stop background work and release pooled connections."""
+        self.dashboard.cancel()
+        await self.refresh_scheduler.stop()
+        await self.weather_service.aclose()
+
+    async def start_background_refresh(self):
+        """Start refreshing history and pinned cities in the background."""
+        self.refresh_scheduler.start()
+
+    async def prefetch_icons(self):
+        """Download any weather icons not yet cached locally."""
+        await self.icon_cache.prefetch(self.weather_service.client)
+
+    async def download_icon(self, code: str, scale: int):
+        await self.icon_cache.download(self.weather_service.client, code, scale)
+
+    async def on_resized(self, e):
+        """Re-fit the hourly charts to the new width.
+
+        Only the charts are redrawn, and only while they are on screen, so
+        a resize never brings back a view hidden by an error or a search.
+        """
+        if (
+            self.weather_container.visible
+            and self.forecast_body.visible
+            and self.forecast_model is not None
+            and len(self.forecast_model)
+        ):
+            if self.update_hourly_charts(self.current_unit, self.get_mood_colors()):
+                self.updates.request()
+
+    async def on_lifecycle_change(self, e):
+        """Pause background refreshes while the app is not visible."""
+        if e.state in (ft.AppLifecycleState.HIDE, ft.AppLifecycleState.PAUSE):
+            self.refresh_scheduler.pause()
+        elif e.state in (ft.AppLifecycleState.SHOW, ft.AppLifecycleState.RESUME):
+            self.refresh_scheduler.resume()
+
+    def is_dark(self) -> bool:
+        """Return True when the page is in dark mode."""
+        return self.page.theme_mode == ft.ThemeMode.DARK
 
     def get_theme_color(self):
         """Return background color based on current theme and mood."""
-        mood_colors = {
-            "sunny": ft.Colors.ORANGE_900 if self.page.theme_mode == ft.ThemeMode.DARK else ft.Colors.ORANGE_50,
-            "cloudy": ft.Colors.BLUE_GREY_900 if self.page.theme_mode == ft.ThemeMode.DARK else ft.Colors.BLUE_GREY_50,
-            "rainy": ft.Colors.BLUE_900 if self.page.theme_mode == ft.ThemeMode.DARK else ft.Colors.BLUE_100,
-            "snowy": ft.Colors.CYAN_900 if self.page.theme_mode == ft.ThemeMode.DARK else ft.Colors.CYAN_50,
-            "stormy": ft.Colors.PURPLE_900 if self.page.theme_mode == ft.ThemeMode.DARK else ft.Colors.PURPLE_50,
-            "foggy": ft.Colors.GREY_800 if self.page.theme_mode == ft.ThemeMode.DARK else ft.Colors.GREY_200,
-            "default": ft.Colors.BLUE_900 if self.page.theme_mode == ft.ThemeMode.DARK else ft.Colors.BLUE_50,
-        }
-        return mood_colors.get(self.current_mood, mood_colors["default"])
+        return self.get_mood_colors().background
 
-    def get_mood_colors(self):
+    def get_mood_colors(self) -> Palette:
         """Return color scheme based on current mood."""
-        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
-        
-        mood_schemes = {
-            "sunny": {
-                "primary": ft.Colors.ORANGE_700,
-                "secondary": ft.Colors.AMBER_700,
-                "text": ft.Colors.WHITE if is_dark else ft.Colors.BROWN_900,
-                "sub_text": ft.Colors.ORANGE_200 if is_dark else ft.Colors.BROWN_700,
-                "card": ft.Colors.ORANGE_800 if is_dark else ft.Colors.ORANGE_100,
-                "divider": ft.Colors.ORANGE_400 if is_dark else ft.Colors.ORANGE_300,
-            },
-            "cloudy": {
-                "primary": ft.Colors.BLUE_GREY_700,
-                "secondary": ft.Colors.GREY_700,
-                "text": ft.Colors.WHITE if is_dark else ft.Colors.BLUE_GREY_900,
-                "sub_text": ft.Colors.BLUE_GREY_300 if is_dark else ft.Colors.BLUE_GREY_700,
-                "card": ft.Colors.BLUE_GREY_800 if is_dark else ft.Colors.BLUE_GREY_100,
-                "divider": ft.Colors.BLUE_GREY_500 if is_dark else ft.Colors.BLUE_GREY_300,
-            },
-            "rainy": {
-                "primary": ft.Colors.BLUE_700,
-                "secondary": ft.Colors.LIGHT_BLUE_700,
-                "text": ft.Colors.WHITE if is_dark else ft.Colors.BLUE_900,
-                "sub_text": ft.Colors.BLUE_200 if is_dark else ft.Colors.BLUE_700,
-                "card": ft.Colors.BLUE_800 if is_dark else ft.Colors.BLUE_100,
-                "divider": ft.Colors.BLUE_400 if is_dark else ft.Colors.BLUE_300,
-            },
-            "snowy": {
-                "primary": ft.Colors.CYAN_700,
-                "secondary": ft.Colors.LIGHT_BLUE_400,
-                "text": ft.Colors.WHITE if is_dark else ft.Colors.CYAN_900,
-                "sub_text": ft.Colors.CYAN_200 if is_dark else ft.Colors.CYAN_700,
-                "card": ft.Colors.CYAN_800 if is_dark else ft.Colors.CYAN_50,
-                "divider": ft.Colors.CYAN_400 if is_dark else ft.Colors.CYAN_300,
-            },
-            "stormy": {
-                "primary": ft.Colors.PURPLE_700,
-                "secondary": ft.Colors.DEEP_PURPLE_700,
-                "text": ft.Colors.WHITE if is_dark else ft.Colors.PURPLE_900,
-                "sub_text": ft.Colors.PURPLE_200 if is_dark else ft.Colors.PURPLE_700,
-                "card": ft.Colors.PURPLE_800 if is_dark else ft.Colors.PURPLE_100,
-                "divider": ft.Colors.PURPLE_400 if is_dark else ft.Colors.PURPLE_300,
-            },
-            "foggy": {
-                "primary": ft.Colors.GREY_700,
-                "secondary": ft.Colors.BLUE_GREY_600,
-                "text": ft.Colors.WHITE if is_dark else ft.Colors.GREY_900,
-                "sub_text": ft.Colors.GREY_300 if is_dark else ft.Colors.GREY_700,
-                "card": ft.Colors.GREY_800 if is_dark else ft.Colors.GREY_100,
-                "divider": ft.Colors.GREY_500 if is_dark else ft.Colors.GREY_400,
-            },
-            "default": {
-                "primary": ft.Colors.BLUE_700,
-                "secondary": ft.Colors.LIGHT_BLUE_700,
-                "text": ft.Colors.WHITE if is_dark else ft.Colors.BLACK,
-                "sub_text": ft.Colors.GREY_400 if is_dark else ft.Colors.GREY_700,
-                "card": ft.Colors.BLUE_GREY_900 if is_dark else ft.Colors.BLUE_GREY_50,
-                "divider": ft.Colors.GREY_700 if is_dark else ft.Colors.GREY_300,
-            }
-        }
-        return mood_schemes.get(self.current_mood, mood_schemes["default"])
+        return get_palette(self.current_mood, self.is_dark())
 
-    def determine_weather_mood(self, weather_data: dict):
+    def determine_weather_mood(self, snapshot: WeatherSnapshot):
         """Determine the mood based on weather conditions."""
-        if not weather_data or "weather" not in weather_data:
+        if snapshot is None:
             return "default"
-            
-        weather_id = weather_data["weather"][0]["id"]
-        main_weather = weather_data["weather"][0]["main"].lower()
-        description = weather_data["weather"][0]["description"].lower()
-        
-        # Weather condition mapping based on OpenWeatherMap codes
-        if weather_id in [800]:  
-            return "sunny"
-        elif weather_id in [801, 802]:  # Few clouds, scattered clouds
-            return "sunny"  # Still mostly sunny
-        elif weather_id in [803, 804] or "overcast" in description:  # Broken clouds, overcast
-            return "cloudy"
-        elif weather_id in [300, 301, 302, 310, 311, 312, 313, 314, 321, 500, 501, 502, 503, 504, 511, 520, 521, 522, 531]:
-            return "rainy"
-        elif weather_id in [600, 601, 602, 611, 612, 613, 615, 616, 620, 621, 622]:
-            return "snowy"
-        elif weather_id in [200, 201, 202, 210, 211, 212, 221, 230, 231, 232]:
-            return "stormy"
-        elif weather_id in [701, 711, 721, 731, 741, 751, 761, 762, 771, 781]:
-            return "foggy"
-        elif "thunder" in description:
-            return "stormy"
-        elif "drizzle" in description or "rain" in description:
-            return "rainy"
-        elif "snow" in description:
-            return "snowy"
-        elif "fog" in description or "mist" in description:
-            return "foggy"
-        elif "cloud" in description:
-            return "cloudy"
-        else:
-            return "sunny"  # Default to sunny for unknown conditions
+        return classify_mood(snapshot.condition_id, snapshot.description)
 
-    def update_mood_theme(self, weather_data: dict):
+    def update_mood_theme(self, snapshot: WeatherSnapshot):
         """Update the app theme based on weather mood."""
-        new_mood = self.determine_weather_mood(weather_data)
-        
+        new_mood = self.determine_weather_mood(snapshot)
+
         if new_mood != self.current_mood:
             self.current_mood = new_mood
-            mood_primary_colors = {
-                "sunny": ft.Colors.ORANGE,
-                "cloudy": ft.Colors.BLUE_GREY,
-                "rainy": ft.Colors.BLUE,
-                "snowy": ft.Colors.CYAN,
-                "stormy": ft.Colors.PURPLE,
-                "foggy": ft.Colors.GREY,
-                "default": ft.Colors.BLUE,
-            }
-            
-            self.page.theme = ft.Theme(
-                color_scheme_seed=mood_primary_colors.get(new_mood, ft.Colors.BLUE)
-            )
+            self.page.theme = get_theme(new_mood)
             return True
         return False
 
-    def add_to_history(self, city: str):
-        """Add city to search history."""
-        if city not in self.search_history:
-            self.search_history.insert(0, city)
-            self.search_history = self.search_history[:5]  # Keep last 5
+    async def load_history(self):
+        """Restore the search history saved by a previous session."""
+        await self.history.load()
+        self.update_history_dropdown()
+        self.update_refresh_cities()
+
+    def add_to_history(self, city: str, location: City = None):
+        """Add city to search history and save it."""
+        self.history.record(city, location)
+        self.update_refresh_cities()
+        self.page.run_task(self.history.save)
+
+    def recent_cities(self):
+        """Top history entries by frecency."""
+        return self.history.labels(Config.HISTORY_VISIBLE_ENTRIES)
+
+    def recent_locations(self):
+        """Top history entries as searched: a City when picked, else the text."""
+        return [
+            entry.city or entry.label
+            for entry in self.history.ranked(Config.HISTORY_VISIBLE_ENTRIES)
+        ]
+
+    @staticmethod
+    def query_for(location):
+        """The service query for a City (its coordinates) or a typed name."""
+        if isinstance(location, City):
+            return (location.lat, location.lon)
+        return location
+
+    def update_refresh_cities(self):
+        """Keep the background refresher in sync with history and pins."""
+        self.refresh_scheduler.set_cities(
+            [self.query_for(location) for location in self.pinned_cities]
+            + [self.query_for(location) for location in self.recent_locations()]
+        )
+
+    def current_label(self) -> str:
+        """Return "City, CC" for the weather currently shown."""
+        return f"{self.current.city}, {self.current.country}"
+
+    def pinned_index(self):
+        """Position of the current location among the pins, or None."""
+        key = self.pin_key(self.current_location)
+        for i, location in enumerate(self.pinned_cities):
+            if self.pin_key(location) == key:
+                return i
+        return None
+
+    def pin_key(self, location):
+        """Compare pins the way the cache does (names case-insensitively)."""
+        query = self.query_for(location)
+        if isinstance(query, str):
+            return WeatherService.normalize_city(query)
+        return query
+
+    async def toggle_pin(self, e):
+        """Pin or unpin the current city for background refreshes.
+
+        The pin keeps the query the city was searched by (its coordinates
+        or the typed text), so refreshes warm the entries searches read.
+        """
+        if not self.current or self.current_location is None:
+            return
+        index = self.pinned_index()
+        if index is not None:
+            del self.pinned_cities[index]
+        else:
+            self.pinned_cities.append(self.current_location)
+        self.update_refresh_cities()
+        self.update_display()
 
     def build_history_dropdown(self):
         """Build dropdown with search history."""
         return ft.Dropdown(
             label="Recent Searches",
-            options=[ft.dropdown.Option(city) for city in self.search_history],
-            on_change=lambda e: self.load_from_history(e.control.value),
+            options=[self.history_option(city) for city in self.recent_cities()],
+            on_change=self.on_history_select,
             expand=True
         )
-    
+
+    def history_option(self, city: str) -> ft.dropdown.Option:
+        """Return the dropdown option for a city, creating it only once."""
+        option = self.history_options.get(city)
+        if option is None:
+            option = self.history_options[city] = ft.dropdown.Option(city)
+        return option
+
     def update_history_dropdown(self):
-        """Refresh the search history dropdown."""
+        """Reorder the history dropdown, reusing the existing options."""
         if hasattr(self, "history_dropdown"):
-            self.history_dropdown.options = [
-                ft.dropdown.Option(city) for city in self.search_history
-            ]
-            self.page.update()
+            cities = self.recent_cities()
+            options = [self.history_option(city) for city in cities]
+            # Same option objects in the same order: nothing to send
+            if options != self.history_dropdown.options:
+                self.history_dropdown.options = options
+                self.updates.request()
+            for city in set(self.history_options) - set(cities):
+                del self.history_options[city]
+
+    async def on_history_select(self, e):
+        # Async so the cache peeks run on the event loop, not a handler thread
+        self.load_from_history(e.control.value)
 
     def load_from_history(self, city: str):
-        """Load weather for a city from search history."""
-        if city:
-            self.city_input.value = city
-            self.page.update()
-            self.page.run_task(self.get_weather) 
+        """Show the saved weather for a history entry at once, then refresh it."""
+        if not city:
+            return
+        entry = self.history.get(city)
+        self.selected_city = entry.city if entry else None
+        self.city_input.value = city
+        shown = self.show_saved_weather(self.selected_city or city)
+        self.updates.request()
+        self.start_search(keep_visible=shown)
+
+    def show_saved_weather(self, location) -> bool:
+        """Render cached data for a city name or City without a network call."""
+        query = self.query_for(location)
+        data = self.weather_service.peek_weather(query)
+        if data is None:
+            return False
+        forecast = self.weather_service.peek_forecast(query)
+        self.forecast_model = ForecastModel.from_response(forecast) if forecast else None
+        snapshot = WeatherSnapshot.from_api(data)
+        self.current_location = location
+        self.update_mood_theme(snapshot)
+        self.display_weather(snapshot)
+        return True
 
     # ------------------ THEME TOGGLE ------------------ #
 
-    def toggle_theme(self, e):
+    async def toggle_theme(self, e):
         """Toggle between light and dark theme."""
         if self.page.theme_mode == ft.ThemeMode.LIGHT:
             self.page.theme_mode = ft.ThemeMode.DARK
@@ -210,18 +289,16 @@ class WeatherApp:
 
         self.weather_container.bgcolor = self.get_theme_color()
 
-        if self.last_weather_data:
-            self.display_weather(self.last_weather_data)
+        if self.current:
+            self.display_weather(self.current)
 
-        self.page.update()
+        self.updates.request()
 
     # ------------------ UI BUILD ------------------ #
 
     def build_ui(self):
         """Build the user interface."""
-        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
-        self.current_temp = 0.0
-        self.feels_like = 0.0
+        is_dark = self.is_dark()
 
         mood_colors = self.get_mood_colors()
 
@@ -239,26 +316,36 @@ class WeatherApp:
         )
 
         self.unit_button = ft.TextButton(
-            text="°C / °F",
+            text=self.unit_button_text(),
             on_click=self.toggle_units,
         )
 
+        self.pin_button = ft.IconButton(
+            icon=ft.Icons.PUSH_PIN_OUTLINED,
+            tooltip="Pin city (keep it refreshed)",
+            on_click=self.toggle_pin,
+        )
+
         self.city_input = ft.TextField(
             label="Enter city name",
             hint_text="e.g., London, Tokyo, New York",
-            border_color=mood_colors["primary"],  # Use mood-based color
+            border_color=mood_colors.primary,  # Use mood-based color
             prefix_icon=ft.Icons.LOCATION_CITY,
             autofocus=True,
             on_submit=self.on_search,
+            on_change=self.on_city_change,
+            on_focus=self.on_city_focus,
         )
 
+        self.suggestions = ft.Column(spacing=0, visible=False)
+
         self.search_button = ft.ElevatedButton(
             "Get Weather",
             icon=ft.Icons.SEARCH,
             on_click=self.on_search,
             style=ft.ButtonStyle(
                 color=ft.Colors.WHITE,
-                bgcolor=mood_colors["primary"],  # Use mood-based color
+                bgcolor=mood_colors.primary,  # Use mood-based color
             ),
         )
 
@@ -289,29 +376,77 @@ class WeatherApp:
 
         self.loading = ft.ProgressRing(visible=False)
 
+        self.build_weather_view()
+
+        # Request timings panel, only built when diagnostics are enabled
+        self.debug_text = ft.Text("", size=11, font_family="monospace", selectable=True)
+        self.debug_panel = ft.Container(
+            content=self.debug_text,
+            visible=False,
+            border=ft.border.all(1, mood_colors.divider),
+            border_radius=8,
+            padding=8,
+        )
+        self.dashboard = Dashboard(
+            self.page,
+            self.weather_service,
+            self.gazetteer,
+            self.updates,
+            units=lambda: self.current_unit,
+            set_icon=self.set_icon_image,
+            on_select=self.open_from_dashboard,
+            concurrency=Config.BATCH_CONCURRENCY,
+        )
+        self.dashboard_button = ft.IconButton(
+            icon=ft.Icons.DASHBOARD,
+            tooltip="All cities",
+            on_click=self.toggle_dashboard,
+        )
+
+        title_controls = [self.title, self.dashboard_button, self.theme_button]
+        if Config.DEBUG_PANEL:
+            title_controls.insert(1, ft.IconButton(
+                icon=ft.Icons.SPEED,
+                tooltip="Request timings",
+                on_click=self.toggle_debug_panel,
+            ))
+
         self.history_dropdown = self.build_history_dropdown()
 
+        # Single-city view; hidden while the dashboard is shown
+        self.single_view = ft.Column(
+            [
+                self.city_input,
+                self.suggestions,
+                ft.Row(
+                    [self.search_button, self.history_dropdown],
+                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+                ),
+                ft.Divider(height=10, color=ft.Colors.TRANSPARENT),
+                self.loading,
+                self.error_message,
+                self.debug_panel,
+                # Make the weather container expandable
+                ft.Container(
+                    content=self.weather_container,
+                    expand=True,
+                ),
+            ],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=5,
+            expand=True,
+        )
+
         self.page.add(
             ft.Column(
                 [
                     ft.Row(
-                        [self.title, self.theme_button],
+                        title_controls,
                         alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                     ),
                     ft.Divider(height=10, color=ft.Colors.TRANSPARENT),
-                    self.city_input,
-                    ft.Row(
-                        [self.search_button, self.history_dropdown],
-                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                    ),
-                    ft.Divider(height=10, color=ft.Colors.TRANSPARENT),
-                    self.loading,
-                    self.error_message,
-                    # Make the weather container expandable
-                    ft.Container(
-                        content=self.weather_container,
-                        expand=True,
-                    ),
+                    self.single_view,
+                    self.dashboard.view,
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=5,
@@ -321,64 +456,223 @@ class WeatherApp:
     
     # ----------------------- MISC ---------------------- #
 
-    def toggle_units(self, e):
-        """Toggle between Celsius and Fahrenheit."""
-        if self.current_unit == "metric":
-            self.current_unit = "imperial"
-            # Convert existing temperature
-            self.current_temp = (self.current_temp * 9/5) + 32
-            self.feels_like = (self.feels_like * 9/5) + 32
+    async def toggle_units(self, e):
+        """Cycle metric -> imperial -> standard without re-fetching."""
+        self.current_unit = next_units(self.current_unit)
+        self.unit_button.text = self.unit_button_text()
+        self.dashboard.render()
+        if self.current:
             self.update_display()
         else:
-            self.current_unit = "metric"
-            self.current_temp = (self.current_temp - 32) * 5/9
-            self.feels_like = (self.feels_like - 32) * 5/9
-            self.update_display()
+            self.updates.request()
+
+    def unit_button_text(self) -> str:
+        """Label showing the active unit and the one a click switches to."""
+        upcoming = next_units(self.current_unit)
+        return f"{TEMP_SYMBOLS[self.current_unit]} → {TEMP_SYMBOLS[upcoming]}"
+
+    async def toggle_debug_panel(self, e):
+        """Show or hide the request timings panel."""
+        self.debug_panel.visible = not self.debug_panel.visible
+        self.refresh_debug_panel()
+        self.updates.request()
+
+    def refresh_debug_panel(self):
+        """Redraw the request timings from the service metrics."""
+        if self.debug_panel.visible:
+            lines = self.weather_service.metrics.report()
+            lines.append(
+                f"page updates {self.updates.sent}  coalesced {self.updates.saved}"
+            )
+            self.debug_text.value = "\n".join(lines)
+
+    # ------------------ DASHBOARD ------------------ #
+
+    async def toggle_dashboard(self, e):
+        """Switch between the single-city view and the all-cities dashboard."""
+        self.show_dashboard(not self.dashboard.view.visible)
+
+    def show_dashboard(self, showing: bool):
+        """Show the dashboard (True) or the single-city view (False)."""
+        self.dashboard.view.visible = showing
+        self.single_view.visible = not showing
+        self.dashboard_button.icon = ft.Icons.VIEW_AGENDA if showing else ft.Icons.DASHBOARD
+        self.dashboard_button.tooltip = "Single city" if showing else "All cities"
+
+        # Start from the pinned and recent cities the first time
+        if showing and not len(self.dashboard):
+            if self.dashboard.add(self.pinned_cities + self.recent_locations()):
+                self.dashboard.start_refresh()
+        self.updates.request()
+
+    def open_from_dashboard(self, entry: DashboardEntry):
+        """Show the full weather view for a dashboard row."""
+        self.show_dashboard(False)
+        if entry.city is not None:
+            self.select_city(entry.city)
+        else:
+            self.city_input.value = entry.label
+            self.start_search()
 
     # ------------------ WEATHER LOGIC ------------------ #
 
-    def on_search(self, e):
+    async def on_search(self, e):
         """Handle search button click or enter key press."""
-        self.page.run_task(self.get_weather)
+        self.start_search()
+
+    async def on_city_focus(self, e):
+        """Load the city list in the background the first time it is needed."""
+        if not self.gazetteer.loaded:
+            self.page.run_task(asyncio.to_thread, self.gazetteer.load)
+
+    async def on_city_change(self, e):
+        """Suggest matching cities from the offline list as the user types."""
+        self.selected_city = None
+        matches = self.gazetteer.search(self.city_input.value, Config.SUGGESTION_LIMIT)
+
+        self.suggestions.controls = [
+            ft.ListTile(
+                leading=ft.Icon(ft.Icons.PLACE),
+                title=ft.Text(city.label),
+                dense=True,
+                on_click=functools.partial(self.on_suggestion_click, city),
+            )
+            for city in matches
+        ]
+        self.suggestions.visible = bool(matches)
+        self.updates.request()
+
+    async def on_suggestion_click(self, city: City, e):
+        self.select_city(city)
+
+    def select_city(self, city: City):
+        """Search a suggested city by its coordinates."""
+        self.selected_city = city
+        self.city_input.value = city.label
+        self.suggestions.visible = False
+        self.updates.request()
+        self.start_search()
+
+    def start_search(self, keep_visible: bool = False):
+        """Start a new search, cancelling any search still in flight."""
+        if self.search_future and not self.search_future.done():
+            self.search_future.cancel()
+        self.search_generation += 1
+        self.search_future = self.page.run_task(
+            self.get_weather, self.search_generation, keep_visible
+        )
+
+    async def get_weather(self, generation: int = None, keep_visible: bool = False):
+        """Fetch and display weather + forecast data.
+
+        The sections are fetched concurrently and each is rendered as soon
+        as it arrives, so the current conditions appear without waiting for
+        the forecast, which shows skeleton placeholders until then.
+
+        Each search is tagged with a generation number; results that arrive
+        after a newer search has started are discarded. With
+        ``keep_visible`` the weather already on screen (e.g. saved data for
+        a history entry) stays up while loading.
+        """
+        if generation is None:
+            self.search_generation += 1
+            generation = self.search_generation
 
-    async def get_weather(self):
-        """Fetch and display weather + forecast data."""
         city = self.city_input.value.strip()
 
         if not city:
             self.show_error("Please enter a city name")
             return
 
+        # Use exact coordinates when the text is still a picked suggestion
+        location = self.selected_city
+        if location is not None and location.label != city:
+            location = None
+
+        self.suggestions.visible = False
         self.loading.visible = True
         self.error_message.visible = False
-        self.weather_container.visible = False
-        self.page.update()
-
+        if not keep_visible:
+            self.weather_container.visible = False
+            self.forecast_model = None  # don't show the last city's forecast
+        self.updates.request()
+
+        # Fetch every section concurrently and render each one as it arrives
+        fetches = self.section_fetches(city, location)
+        self.pending_sections = set(fetches)
+        tasks = {asyncio.ensure_future(fetch): name for name, fetch in fetches.items()}
         try:
-            # Fetch current weather and forecast data
-            weather_data = await self.weather_service.get_weather(city)
-            self.forecast_data = await self.weather_service.get_forecast(city)
-
-            # Update mood theme based on weather
-            theme_changed = self.update_mood_theme(weather_data)
-            
-            # Update display with both
-            self.display_weather(weather_data)
-            self.update_display()
-
-            # Add to history
-            self.add_to_history(city)
-            self.update_history_dropdown()
-
-            # Show mood change notification
-            if theme_changed:
-                self.show_mood_notification()
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if generation != self.search_generation:
+                    return  # superseded by a newer search
+                for task in done:
+                    name = tasks[task]
+                    self.pending_sections.discard(name)
+                    try:
+                        result = task.result()
+                    except Exception:
+                        if name == "current":
+                            raise
+                        result = None  # optional sections just disappear
+                    if name == "current":
+                        self.current_location = location if location is not None else city
+                    self.section_renderers[name](result)
+
+                    if name == "current":
+                        # The main reading is on screen; skeletons cover the rest
+                        self.loading.visible = False
+                        self.add_to_history(city, location)
+                        self.update_history_dropdown()
 
         except Exception as e:
-            self.show_error(str(e))
+            if generation == self.search_generation:
+                self.show_error(str(e))
         finally:
-            self.loading.visible = False
-            self.page.update()
+            for task in tasks:
+                task.cancel()
+            if generation == self.search_generation:
+                self.pending_sections.clear()
+                self.loading.visible = False
+                self.refresh_debug_panel()
+                self.updates.request()
+
+    def section_fetches(self, city: str, location: City = None) -> dict:
+        """One fetch per section of the weather view, keyed by section name.
+
+        Each name needs a matching entry in ``section_renderers``; a new
+        endpoint is added by registering both.
+        """
+        service = self.weather_service
+        if location is not None:
+            return {
+                "current": service.get_weather_snapshot_by_coordinates(
+                    location.lat, location.lon
+                ),
+                "forecast": service.get_forecast_model_by_coordinates(
+                    location.lat, location.lon
+                ),
+            }
+        return {
+            "current": service.get_weather_snapshot(city),
+            "forecast": service.get_forecast_model(city),
+        }
+
+    def show_current(self, snapshot: WeatherSnapshot):
+        """Render the current conditions (the first paint of a search)."""
+        theme_changed = self.update_mood_theme(snapshot)
+        self.display_weather(snapshot)
+        if theme_changed:
+            self.show_mood_notification()
+
+    def show_forecast(self, forecast_model: ForecastModel = None):
+        """Stream the forecast into the view; None if it failed to load."""
+        self.forecast_model = forecast_model
+        if self.current is not None and self.weather_container.visible:
+            self.update_display()
 
     def show_mood_notification(self):
         """Show a notification about the mood change."""
@@ -396,196 +690,224 @@ class WeatherApp:
         # Simple notification (you could enhance this with a proper snackbar)
         print(f"Mood changed: {message}")
 
-    def display_weather(self, data: dict):
+    def display_weather(self, snapshot: WeatherSnapshot):
         """Display weather information with dynamic theming."""
-        self.last_weather_data = data
-
-        city_name = data.get("name", "Unknown")
-        country = data.get("sys", {}).get("country", "")
-        temp = data.get("main", {}).get("temp", 0)
-        feels_like = data.get("main", {}).get("feels_like", 0)
-        humidity = data.get("main", {}).get("humidity", 0)
-        description = data.get("weather", [{}])[0].get("description", "").title()
-        icon_code = data.get("weather", [{}])[0].get("icon", "01d")
-        wind_speed = data.get("wind", {}).get("speed", 0)
-
-        # ✅ Convert API data based on current unit before displaying
-        if self.current_unit == "imperial":
-            temp = (temp * 9 / 5) + 32
-            feels_like = (feels_like * 9 / 5) + 32
-        elif self.current_unit == "metric":
-            # OpenWeather usually returns Kelvin if no unit param — convert to °C
-            if temp > 200:  # crude check for Kelvin
-                temp -= 273.15
-                feels_like -= 273.15
-
-        self.current_temp = temp
-        self.city_name = city_name
-        self.country = country
-        self.feels_like = feels_like
-        self.humidity = humidity
-        self.description = description
-        self.icon_code = icon_code
-        self.wind_speed = wind_speed
-
+        self.current = snapshot
         self.update_display()
 
-        
-    def update_display(self):
-        # Get mood-based colors
-        mood_colors = self.get_mood_colors()
-        text_color = mood_colors["text"]
-        sub_text_color = mood_colors["sub_text"]
-        container_color = self.get_theme_color()
-        divider_color = mood_colors["divider"]
-        card_color = mood_colors["card"]
-        unit_symbol = "°C" if self.current_unit == 'metric' else '°F'
+    def build_weather_view(self):
+        """Create the weather controls once; update_display patches them."""
+        self.city_text = ft.Text("", size=24, weight=ft.FontWeight.BOLD)
+        self.condition_icon = self.create_icon_image(80)
+        self.description_text = ft.Text("", size=18, italic=True)
+        self.temp_text = ft.Text("", size=42, weight=ft.FontWeight.BOLD)
+        self.feels_like_text = ft.Text("", size=14)
+        self.as_of_text = ft.Text("", size=12, italic=True, visible=False)
+        self.weather_divider = ft.Divider(height=10)
+        self.humidity_card = self.create_info_card(ft.Icons.WATER_DROP, "Humidity")
+        self.wind_card = self.create_info_card(ft.Icons.AIR, "Wind Speed")
+
+        self.forecast_divider = ft.Divider(height=10)
+        self.forecast_title = ft.Text("5-Day Forecast", size=16, weight=ft.FontWeight.BOLD)
+        self.forecast_cards = [self.create_forecast_card() for _ in range(5)]
+
+        # 3-hourly temperature and chance-of-rain charts
+        self.chart_title = ft.Text("Temperature · chance of rain", size=14, weight=ft.FontWeight.BOLD)
+        self.temp_chart = ft.LineChart(
+            height=120,
+            min_x=0,
+            left_axis=ft.ChartAxis(labels_size=32),
+            bottom_axis=ft.ChartAxis(labels_size=20),
+        )
+        self.pop_chart = ft.LineChart(
+            height=60,
+            min_x=0,
+            min_y=0,
+            max_y=100,
+            left_axis=ft.ChartAxis(labels_size=32, labels_interval=50),
+        )
+        self.chart_key = None  # what the charts were last drawn from
+        self.forecast_body = ft.Column(
+            [
+                ft.Container(
+                    content=ft.Row(
+                        controls=self.forecast_cards,
+                        alignment=ft.MainAxisAlignment.CENTER,
+                        scroll=ft.ScrollMode.ALWAYS,
+                    ),
+                    height=120,
+                ),
+                self.chart_title,
+                self.temp_chart,
+                self.pop_chart,
+            ],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=10,
+        )
 
-        # Clear previous content
-        self.weather_content.controls.clear()
+        # Placeholder blocks shown in the same space while the forecast loads
+        self.skeleton_blocks = [
+            self.create_skeleton_block(width=90, height=110) for _ in range(5)
+        ] + [self.create_skeleton_block(height=200)]
+        self.forecast_skeleton = ft.Column(
+            [
+                ft.Container(
+                    content=ft.Row(
+                        controls=self.skeleton_blocks[:5],
+                        alignment=ft.MainAxisAlignment.CENTER,
+                        scroll=ft.ScrollMode.HIDDEN,
+                    ),
+                    height=120,
+                ),
+                self.skeleton_blocks[5],
+            ],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=10,
+            visible=False,
+        )
+        self.forecast_section = ft.Column(
+            [
+                self.forecast_divider,
+                self.forecast_title,
+                self.forecast_skeleton,
+                self.forecast_body,
+            ],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=10,
+            visible=False,
+        )
 
-        # --- MAIN WEATHER DISPLAY ---
-        weather_controls = [
-            self.unit_button,
-            ft.Text(
-                f"{self.city_name}, {self.country}",
-                size=24,
-                weight=ft.FontWeight.BOLD,
-                color=text_color,
-            ),
+        self.weather_content.controls = [
             ft.Row(
-                [
-                    ft.Image(
-                        src=f"https://openweathermap.org/img/wn/{self.icon_code}@2x.png",
-                        width=80,
-                        height=80,
-                    ),
-                    ft.Text(
-                        self.description,
-                        size=18,
-                        italic=True,
-                        color=text_color,
-                    ),
-                ],
+                [self.unit_button, self.pin_button],
                 alignment=ft.MainAxisAlignment.CENTER,
             ),
-            ft.Text(
-                f"{self.current_temp:.1f}{unit_symbol}",
-                size=42,
-                weight=ft.FontWeight.BOLD,
-                color=text_color,
-            ),
-            ft.Text(
-                f"Feels like {self.feels_like:.1f}{unit_symbol}",
-                size=14,
-                color=sub_text_color,
+            self.city_text,
+            ft.Row(
+                [self.condition_icon, self.description_text],
+                alignment=ft.MainAxisAlignment.CENTER,
             ),
-            ft.Divider(color=divider_color, height=10),
+            self.temp_text,
+            self.feels_like_text,
+            self.as_of_text,
+            self.weather_divider,
             ft.Row(
-                [
-                    self.create_info_card(
-                        ft.Icons.WATER_DROP,
-                        "Humidity",
-                        f"{self.humidity}%",
-                        card_color=card_color,
-                        text_color=text_color,
-                        sub_color=sub_text_color,
-                    ),
-                    self.create_info_card(
-                        ft.Icons.AIR,
-                        "Wind Speed",
-                        f"{self.wind_speed} m/s",
-                        card_color=card_color,
-                        text_color=text_color,
-                        sub_color=sub_text_color,
-                    ),
-                ],
+                [self.humidity_card, self.wind_card],
                 alignment=ft.MainAxisAlignment.SPACE_EVENLY,
             ),
+            self.forecast_section,
         ]
 
-        # Add main weather controls to content
-        self.weather_content.controls.extend(weather_controls)
+    def update_display(self):
+        """Patch the weather controls to match the current data and mood.
+
+        Only properties whose value differs are assigned, and the page is
+        not updated at all when nothing changed, so Flet sends just the
+        changed properties to the client.
+        """
+        current = self.current
+
+        # Get mood-based colors
+        mood_colors = self.get_mood_colors()
+        text_color = mood_colors.text
+        sub_text_color = mood_colors.sub_text
+        container_color = self.get_theme_color()
+        divider_color = mood_colors.divider
+        card_color = mood_colors.card
+        # Convert the stored metric values for display only
+        units = self.current_unit
+        unit_symbol = TEMP_SYMBOLS[units]
+        temp = convert_temp(current.temp, units)
+        feels_like = convert_temp(current.feels_like, units)
+        wind_speed = convert_speed(current.wind_speed, units)
+
+        # --- MAIN WEATHER DISPLAY ---
+        pinned = self.pinned_index() is not None
+        changed = patch(
+            self.pin_button,
+            icon=ft.Icons.PUSH_PIN if pinned else ft.Icons.PUSH_PIN_OUTLINED,
+        )
+        changed |= patch(self.city_text, value=self.current_label(), color=text_color)
+        changed |= self.set_icon_image(self.condition_icon, current.icon, scale=2)
+        changed |= patch(self.description_text, value=current.description, color=text_color)
+        changed |= patch(self.temp_text, value=f"{temp:.1f}{unit_symbol}", color=text_color)
+        changed |= patch(
+            self.feels_like_text,
+            value=f"Feels like {feels_like:.1f}{unit_symbol}",
+            color=sub_text_color,
+        )
+
+        if current.as_of:
+            as_of_time = datetime.fromtimestamp(current.as_of).strftime("%b %d, %H:%M")
+            changed |= patch(
+                self.as_of_text,
+                value=f"Showing saved data as of {as_of_time}",
+                color=sub_text_color,
+                visible=True,
+            )
+        else:
+            changed |= patch(self.as_of_text, visible=False)
+
+        changed |= patch(self.weather_divider, color=divider_color)
+        changed |= self.update_info_card(
+            self.humidity_card, f"{current.humidity}%", mood_colors
+        )
+        changed |= self.update_info_card(
+            self.wind_card, f"{wind_speed:.1f} {SPEED_SYMBOLS[units]}", mood_colors
+        )
 
         # --- 5-DAY FORECAST INTEGRATION ---
-        if hasattr(self, "forecast_data") and self.forecast_data:
-            forecasts = []
-            for entry in self.forecast_data.get("list", []):
-                if "12:00:00" in entry["dt_txt"]:
-                    forecasts.append(entry)
-                if len(forecasts) >= 5:
-                    break
-
-            if not forecasts:
-                forecasts = self.forecast_data["list"][:5]  # fallback
-
-            forecast_cards = []
-            from datetime import datetime
-
-            for entry in forecasts:
-                date = entry["dt_txt"].split(" ")[0]
-                day_name = datetime.strptime(date, "%Y-%m-%d").strftime("%a")
-                temp = entry["main"]["temp"]
-                description = entry["weather"][0]["description"].title()
-                icon_code = entry["weather"][0]["icon"]
-
-                forecast_cards.append(
-                    ft.Container(
-                        bgcolor=card_color,
-                        border_radius=8,
-                        padding=8,
-                        width=90,
-                        content=ft.Column(
-                            [
-                                ft.Text(day_name, size=14, weight=ft.FontWeight.BOLD, color=text_color),
-                                ft.Image(
-                                    src=f"https://openweathermap.org/img/wn/{icon_code}.png",
-                                    width=40,
-                                    height=40,
-                                ),
-                                ft.Text(f"{temp:.1f}{unit_symbol}", size=16, color=text_color),
-                                ft.Text(
-                                    description, 
-                                    size=10,
-                                    color=sub_text_color, 
-                                    text_align=ft.TextAlign.CENTER,
-                                ),
-                            ],
-                            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                            spacing=3,
-                        ),
-                    )
+        days = 0
+        if self.forecast_model is not None and len(self.forecast_model):
+            # Daily min/max per local day in the city's timezone
+            daily = self.forecast_model.daily()
+            days = min(len(self.forecast_cards), len(daily))
+            temp_max_values = convert_temp(daily.temp_max[:days], units)
+            temp_min_values = convert_temp(daily.temp_min[:days], units)
+
+            for i in range(days):
+                changed |= self.update_forecast_card(
+                    self.forecast_cards[i],
+                    daily.labels[i],
+                    daily.icons[i],
+                    f"{temp_max_values[i]:.0f} / {temp_min_values[i]:.0f}{unit_symbol}",
+                    daily.descriptions[i],
+                    mood_colors,
                 )
-
-            # Add forecast section to content
-            self.weather_content.controls.extend([
-                ft.Divider(color=divider_color, height=10),
-                ft.Text("5-Day Forecast", size=16, weight=ft.FontWeight.BOLD, color=text_color),
-                ft.Container(
-                    content=ft.Row(
-                        controls=forecast_cards,
-                        alignment=ft.MainAxisAlignment.CENTER,
-                        scroll=ft.ScrollMode.ALWAYS,
-                    ),
-                    height=120,
-                ),
-            ])
+            changed |= patch(self.chart_title, color=text_color)
+            changed |= self.update_hourly_charts(units, mood_colors)
+
+        for i, card in enumerate(self.forecast_cards):
+            changed |= patch(card, visible=i < days)
+
+        # Skeletons hold the forecast's place until it arrives
+        loading = days == 0 and "forecast" in self.pending_sections
+        if loading:
+            for block in self.skeleton_blocks:
+                changed |= patch(block, bgcolor=card_color)
+        changed |= patch(self.forecast_divider, color=divider_color)
+        changed |= patch(self.forecast_title, color=text_color)
+        changed |= patch(self.forecast_skeleton, visible=loading)
+        changed |= patch(self.forecast_body, visible=days > 0)
+        changed |= patch(self.forecast_section, visible=days > 0 or loading)
 
         # --- Final Layout ---
-        self.weather_container.bgcolor = container_color
-        self.weather_container.visible = True
-        self.error_message.visible = False
-        
-        self.search_button.style.bgcolor = mood_colors["primary"]
-        
-        self.city_input.border_color = mood_colors["primary"]
-        
-        self.weather_container.height = 550
-        self.page.update()
+        changed |= patch(
+            self.weather_container,
+            bgcolor=container_color,
+            visible=True,
+            height=550,
+        )
+        changed |= patch(self.error_message, visible=False)
+        changed |= patch(self.search_button.style, bgcolor=mood_colors.primary)
+        changed |= patch(self.city_input, border_color=mood_colors.primary)
+
+        if changed:
+            self.updates.request()
 
-        # --- High Temperature Alert ---
-        if (self.current_unit == "metric" and self.current_temp > 35) or \
-            (self.current_unit == "imperial" and self.current_temp > 95):
+        # --- High Temperature Alert (once per new reading) ---
+        if current.temp > 35 and current is not self.alerted_snapshot:  # °C
+            self.alerted_snapshot = current
             alert = ft.Banner(
                 bgcolor=ft.Colors.AMBER_100 if self.page.theme_mode == ft.ThemeMode.LIGHT else ft.Colors.AMBER_900,
                 leading=ft.Icon(ft.Icons.WARNING, color=ft.Colors.AMBER, size=40),
@@ -599,29 +921,154 @@ class WeatherApp:
 
     # ------------------ HELPERS ------------------ #
 
-    def create_info_card(self, icon, label, value, card_color, text_color, sub_color):
+    def update_hourly_charts(self, units: str, colors: Palette) -> bool:
+        """Redraw the hourly charts if the forecast, width, units or colors changed.
+
+        The number of plotted points follows the available width, and the
+        downsampled series is cached on the ForecastModel, so redraws for
+        other reasons (pinning, unit toggles elsewhere) cost nothing.
+        """
+        width = (self.page.width or Config.APP_WIDTH) - 80  # minus paddings
+        max_points = max(8, int(width // Config.CHART_POINT_SPACING))
+        key = (self.forecast_model, max_points, units, colors)
+        if key == self.chart_key:
+            return False
+        self.chart_key = key
+
+        series = self.forecast_model.hourly(max_points)
+        temps = convert_temp(series.temp, units)
+        self.temp_chart.data_series = [
+            ft.LineChartData(
+                data_points=[
+                    ft.LineChartDataPoint(float(x), round(float(y), 1))
+                    for x, y in zip(series.temp_hours, temps)
+                ],
+                curved=True,
+                prevent_curve_over_shooting=True,
+                stroke_width=2,
+                color=colors.primary,
+            )
+        ]
+        self.temp_chart.min_y = float(np.floor(temps.min())) - 1
+        self.temp_chart.max_y = float(np.ceil(temps.max())) + 1
+        self.temp_chart.max_x = series.span
+        self.temp_chart.bottom_axis.labels = [
+            ft.ChartAxisLabel(value=x, label=ft.Text(day, size=10, color=colors.sub_text))
+            for x, day in series.day_ticks
+        ]
+
+        self.pop_chart.data_series = [
+            ft.LineChartData(
+                data_points=[
+                    ft.LineChartDataPoint(float(x), round(float(y) * 100))
+                    for x, y in zip(series.pop_hours, series.pop)
+                ],
+                stroke_width=1,
+                color=ft.Colors.BLUE_400,
+                below_line_bgcolor=ft.Colors.with_opacity(0.3, ft.Colors.BLUE_400),
+            )
+        ]
+        self.pop_chart.max_x = series.span
+        return True
+
+    def create_icon_image(self, size: int) -> ft.Image:
+        """Empty image for a condition icon; see set_icon_image."""
+        return ft.Image(
+            width=size,
+            height=size,
+            error_content=ft.Icon(ft.Icons.CLOUD_OUTLINED, size=size / 2),
+        )
+
+    def set_icon_image(self, image: ft.Image, code: str, scale: int) -> bool:
+        """Point an image at a condition icon, served from the local assets."""
+        src = self.icon_cache.get(code, scale)
+        if src is not None:
+            return patch(image, src=src)
+
+        # Not downloaded yet: show the remote image and cache it for next time
+        url = self.icon_cache.url(code, scale)
+        if image.src == url:
+            return False
+        self.page.run_task(self.download_icon, code, scale)
+        return patch(image, src=url)
+
+    def create_skeleton_block(self, width: float = None, height: float = None) -> ft.Container:
+        """Grey placeholder for content that is still loading."""
+        return ft.Container(
+            width=width,
+            height=height,
+            border_radius=8,
+            opacity=0.5,
+        )
+
+    def create_info_card(self, icon, label):
         """Create a small info card with icon, label, and value that adapts to theme."""
         return ft.Container(
-            bgcolor=card_color,
             border_radius=8,
             padding=8,
             content=ft.Column(
                 [
-                    ft.Icon(icon, color=text_color, size=20),
-                    ft.Text(label, size=12, color=sub_color),
-                    ft.Text(value, size=14, weight=ft.FontWeight.BOLD, color=text_color),
+                    ft.Icon(icon, size=20),
+                    ft.Text(label, size=12),
+                    ft.Text("", size=14, weight=ft.FontWeight.BOLD),
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=2,
             ),
         )
 
+    def update_info_card(self, card: ft.Container, value: str, colors: Palette) -> bool:
+        """Patch an info card's value and colors."""
+        icon, label, value_text = card.content.controls
+        changed = patch(card, bgcolor=colors.card)
+        changed |= patch(icon, color=colors.text)
+        changed |= patch(label, color=colors.sub_text)
+        changed |= patch(value_text, value=value, color=colors.text)
+        return changed
+
+    def create_forecast_card(self) -> ft.Container:
+        """Create an empty day card for the forecast row."""
+        return ft.Container(
+            border_radius=8,
+            padding=8,
+            width=90,
+            visible=False,
+            content=ft.Column(
+                [
+                    ft.Text("", size=14, weight=ft.FontWeight.BOLD),
+                    self.create_icon_image(40),
+                    ft.Text("", size=14),
+                    ft.Text("", size=10, text_align=ft.TextAlign.CENTER),
+                ],
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                spacing=3,
+            ),
+        )
+
+    def update_forecast_card(
+        self,
+        card: ft.Container,
+        day_name: str,
+        icon_code: str,
+        temps: str,
+        description: str,
+        colors: Palette,
+    ) -> bool:
+        """Patch a forecast day card with one day's summary."""
+        day_text, image, temps_text, description_text = card.content.controls
+        changed = patch(card, bgcolor=colors.card)
+        changed |= patch(day_text, value=day_name, color=colors.text)
+        changed |= self.set_icon_image(image, icon_code, scale=1)
+        changed |= patch(temps_text, value=temps, color=colors.text)
+        changed |= patch(description_text, value=description, color=colors.sub_text)
+        return changed
+
     def show_error(self, message: str):
         """Display error message."""
         self.error_message.value = f"❌ {message}"
         self.error_message.visible = True
         self.weather_container.visible = False
-        self.page.update()
+        self.updates.request()
 
 
 def main(page: ft.Page):
@@ -630,4 +1077,4 @@ def main(page: ft.Page):
 
 
 if __name__ == "__main__":
-    ft.app(target=main)
\ No newline at end of file
+    ft.app(target=main, assets_dir=Config.ASSETS_DIR)
\ No newline at end of file
@@ -0,0 +1,190 @@
+# metrics.py
+"""Rolling request timings, sizes, cache outcomes and error counts."""
+
+import bisect
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+# Bucket upper bounds: milliseconds for timings, bytes for response sizes
+TIME_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+SIZE_BUCKETS = (512, 1024, 2048, 4096, 8192, 16384, 32768, 65536)
+
+# Request phases in the order they happen
+PHASES = ("queue", "connect", "tls", "send", "wait", "receive", "parse", "total")
+
+# httpcore trace event name -> phase ("connect" includes the DNS lookup)
+_TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "wait",
+    "receive_response_body": "receive",
+}
+
+
+class RollingHistogram:
+    """Bucketed histogram over the samples of the last ``window`` seconds.
+
+    At most ``maxlen`` samples are kept, so memory stays bounded under load.
+    """
+
+    def __init__(
+        self,
+        bounds: Sequence[float],
+        window: float = 300,
+        maxlen: int = 2048,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.bounds = tuple(bounds)
+        self.window = window
+        self._clock = clock
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=maxlen)
+
+    def _expire(self):
+        cutoff = self._clock() - self.window
+        samples = self._samples
+        while samples and samples[0][0] < cutoff:
+            samples.popleft()
+
+    def record(self, value: float):
+        self._samples.append((self._clock(), value))
+
+    def values(self) -> List[float]:
+        """Samples still inside the window, oldest first."""
+        self._expire()
+        return [value for _, value in self._samples]
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._samples)
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Return (upper bound, count) pairs; the last bound is infinity."""
+        counts = [0] * (len(self.bounds) + 1)
+        for value in self.values():
+            counts[bisect.bisect_left(self.bounds, value)] += 1
+        return list(zip(self.bounds + (float("inf"),), counts))
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean and p50/p95/max of the samples in the window."""
+        values = sorted(self.values())
+        if not values:
+            return {"count": 0}
+        return {
+            "count": len(values),
+            "mean": sum(values) / len(values),
+            "p50": _percentile(values, 50),
+            "p95": _percentile(values, 95),
+            "max": values[-1],
+        }
+
+    def clear(self):
+        self._samples.clear()
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, int(round(pct / 100 * len(sorted_values))) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class RequestTrace:
+    """Collects per-phase timings of a single HTTP request.
+
+    Pass ``trace`` as the httpx ``"trace"`` request extension; httpcore
+    then reports when each connection and HTTP phase starts and ends.
+    Phases that do not happen (e.g. connect on a reused connection) are
+    simply absent.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}  # phase -> milliseconds
+        self._started: Dict[str, float] = {}
+
+    async def trace(self, event: str, info: Dict[str, Any]):
+        _, _, name = event.partition(".")
+        step, _, state = name.rpartition(".")
+        phase = _TRACE_PHASES.get(step)
+        if phase is None:
+            return
+        if state == "started":
+            self._started[step] = time.perf_counter()
+        elif step in self._started:
+            elapsed = (time.perf_counter() - self._started.pop(step)) * 1000
+            self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
+
+
+class RequestMetrics:
+    """Rolling statistics for the requests made by a WeatherService.
+
+    Timings are in milliseconds and only cover the last ``window`` seconds.
+    """
+
+    def __init__(self, window: float = 300, clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self.phases = {
+            phase: RollingHistogram(TIME_BUCKETS_MS, window, clock=clock)
+            for phase in PHASES
+        }
+        self.response_bytes = RollingHistogram(SIZE_BUCKETS, window, clock=clock)
+        self.cache_outcomes: Counter = Counter()
+        self.errors: Counter = Counter()
+
+    def record_request(self, phases: Dict[str, float], size: Optional[int] = None):
+        """Record the phase timings (and body size) of one upstream request."""
+        for phase, elapsed in phases.items():
+            self.phases[phase].record(elapsed)
+        if size is not None:
+            self.response_bytes.record(size)
+
+    def record_cache(self, outcome: str):
+        """Count a cache outcome: memory, disk, stale, fallback or miss."""
+        self.cache_outcomes[outcome] += 1
+
+    def record_error(self, kind: str):
+        """Count a failed upstream request by error class."""
+        self.errors[kind] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return every statistic as plain data (for logs or a UI)."""
+        return {
+            "phases": {phase: h.summary() for phase, h in self.phases.items()},
+            "response_bytes": self.response_bytes.summary(),
+            "cache": dict(self.cache_outcomes),
+            "errors": dict(self.errors),
+        }
+
+    def report(self) -> List[str]:
+        """Format the snapshot as short fixed-width lines."""
+        lines = [f"{'phase':<8}{'n':>5}{'p50':>8}{'p95':>8}{'max':>8}  (ms)"]
+        for phase, h in self.phases.items():
+            s = h.summary()
+            if s["count"]:
+                lines.append(
+                    f"{phase:<8}{s['count']:>5}{s['p50']:>8.1f}"
+                    f"{s['p95']:>8.1f}{s['max']:>8.1f}"
+                )
+        size = self.response_bytes.summary()
+        if size["count"]:
+            lines.append(f"bytes   p50 {size['p50']:.0f}  max {size['max']:.0f}")
+        if self.cache_outcomes:
+            lines.append("cache   " + "  ".join(
+                f"{k} {v}" for k, v in sorted(self.cache_outcomes.items())
+            ))
+        if self.errors:
+            lines.append("errors  " + "  ".join(
+                f"{k} {v}" for k, v in sorted(self.errors.items())
+            ))
+        return lines
+
+    def clear(self):
+        for h in self.phases.values():
+            h.clear()
+        self.response_bytes.clear()
+        self.cache_outcomes.clear()
+        self.errors.clear()
@@ -0,0 +1,332 @@
+# mock_server.py
+"""Local stand-in for the OpenWeatherMap current weather and forecast API.
+
+Serves ``/data/2.5/weather`` and ``/data/2.5/forecast`` with deterministic
+fake data, so the app and the benchmark can run offline. Latency, error
+rate and error codes are configurable, and the server counts connections
+so connection reuse can be measured.
+
+Run standalone:
+    python mock_server.py --port 8081 --latency 0.05 --error-rate 0.01
+
+then point the app at it:
+    OPENWEATHER_BASE_URL=http://127.0.0.1:8081/data/2.5/weather
+    OPENWEATHER_FORECAST_URL=http://127.0.0.1:8081/data/2.5/forecast
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# (id, main, description, icon) for a spread of OpenWeatherMap conditions
+CONDITIONS = [
+    (800, "Clear", "clear sky", "01"),
+    (801, "Clouds", "few clouds", "02"),
+    (802, "Clouds", "scattered clouds", "03"),
+    (804, "Clouds", "overcast clouds", "04"),
+    (500, "Rain", "light rain", "10"),
+    (502, "Rain", "heavy intensity rain", "10"),
+    (300, "Drizzle", "light intensity drizzle", "09"),
+    (211, "Thunderstorm", "thunderstorm", "11"),
+    (601, "Snow", "snow", "13"),
+    (741, "Fog", "fog", "50"),
+]
+
+STATUS_TEXT = {
+    200: "OK",
+    401: "Unauthorized",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+}
+
+
+class MockWeatherServer:
+    """Minimal HTTP/1.1 keep-alive server mimicking OpenWeatherMap."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_codes: Iterable[int] = (500, 502, 503),
+        api_key: Optional[str] = None,
+        not_found: Iterable[str] = (),
+        seed: Optional[int] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_codes = tuple(error_codes)
+        self.api_key = api_key
+        self.not_found = {city.casefold() for city in not_found}
+        self._random = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.reset_stats()
+
+    # ------------------ LIFECYCLE ------------------ #
+
+    async def start(self) -> "MockWeatherServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "MockWeatherServer":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/data/2.5"
+
+    # ------------------ STATS ------------------ #
+
+    def reset_stats(self):
+        self.connections_opened = 0
+        self.active_connections = 0
+        self.max_active_connections = 0
+        self.requests = 0
+        self.status_counts: Counter = Counter()
+
+    def stats(self) -> Dict:
+        return {
+            "connections_opened": self.connections_opened,
+            "max_active_connections": self.max_active_connections,
+            "requests": self.requests,
+            "status_counts": dict(self.status_counts),
+        }
+
+    # ------------------ HTTP ------------------ #
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections_opened += 1
+        self.active_connections += 1
+        self.max_active_connections = max(
+            self.max_active_connections, self.active_connections
+        )
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                _, target, version = request_line.decode("latin-1").split()
+                status, payload = await self._route(target)
+                self.requests += 1
+                self.status_counts[status] += 1
+
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    and version == "HTTP/1.1"
+                )
+                body = json.dumps(payload, separators=(",", ":")).encode()
+                head = (
+                    f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Error')}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n"
+                )
+                writer.write(head.encode() + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active_connections -= 1
+            writer.close()
+
+    async def _route(self, target: str) -> Tuple[int, Dict]:
+        url = urlsplit(target)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.api_key is not None and params.get("appid") != self.api_key:
+            return 401, {"cod": 401, "message": "Invalid API key."}
+        if self._random.random() < self.error_rate:
+            status = self._random.choice(self.error_codes)
+            return status, {"cod": str(status), "message": "Internal error"}
+
+        location = self._resolve(params)
+        if location is None:
+            return 404, {"cod": "404", "message": "city not found"}
+
+        units = params.get("units", "standard")
+        if url.path.endswith("/weather"):
+            return 200, fake_weather(*location, units)
+        if url.path.endswith("/forecast"):
+            return 200, fake_forecast(*location, units)
+        return 404, {"cod": "404", "message": "Not found"}
+
+    def _resolve(self, params: Dict) -> Optional[Tuple[str, float, float]]:
+        """Return (name, lat, lon) for the query, or None if not found."""
+        if "q" in params:
+            name = params["q"].split(",")[0].strip()
+            if not name or name.casefold() in self.not_found or "invalid" in name.casefold():
+                return None
+            seed = zlib.crc32(name.casefold().encode())
+            lat = (seed % 14000) / 100 - 70
+            lon = (seed // 14000 % 36000) / 100 - 180
+            return name.title(), lat, lon
+        try:
+            lat, lon = float(params["lat"]), float(params["lon"])
+        except (KeyError, ValueError):
+            return None
+        return f"Place {lat:.2f},{lon:.2f}", lat, lon
+
+
+# ------------------ FAKE PAYLOADS ------------------ #
+
+def _convert(celsius: float, units: str) -> float:
+    if units == "imperial":
+        return round(celsius * 9 / 5 + 32, 2)
+    if units == "metric":
+        return round(celsius, 2)
+    return round(celsius + 273.15, 2)
+
+
+def _sample(name: str, lat: float, step: int) -> Dict:
+    """Deterministic conditions for a place at a 3-hour step."""
+    seed = zlib.crc32(f"{name}:{step}".encode())
+    base = 28 - abs(lat) * 0.5
+    temp = base + (seed % 100) / 10 - 5
+    condition = CONDITIONS[seed % len(CONDITIONS)]
+    return {
+        "temp": temp,
+        "humidity": 30 + seed % 70,
+        "wind": (seed % 150) / 10,
+        "condition": condition,
+        "pop": (seed % 10) / 10 if condition[0] < 700 else 0,
+    }
+
+
+def fake_weather(name: str, lat: float, lon: float, units: str = "metric") -> Dict:
+    """Build a current-weather payload shaped like OpenWeatherMap's."""
+    now = int(time.time())
+    sample = _sample(name, lat, now // 10800)
+    cid, main, description, icon = sample["condition"]
+    return {
+        "coord": {"lon": round(lon, 4), "lat": round(lat, 4)},
+        "weather": [{"id": cid, "main": main, "description": description, "icon": icon + "d"}],
+        "main": {
+            "temp": _convert(sample["temp"], units),
+            "feels_like": _convert(sample["temp"] - 1.5, units),
+            "temp_min": _convert(sample["temp"] - 2, units),
+            "temp_max": _convert(sample["temp"] + 2, units),
+            "pressure": 1013,
+            "humidity": sample["humidity"],
+        },
+        "wind": {"speed": sample["wind"], "deg": zlib.crc32(name.encode()) % 360},
+        "dt": now,
+        "sys": {"country": "XX", "sunrise": now - 21600, "sunset": now + 21600},
+        "timezone": int(round(lon / 15)) * 3600,
+        "id": zlib.crc32(name.encode()) % 10_000_000,
+        "name": name,
+        "cod": 200,
+    }
+
+
+def fake_forecast(name: str, lat: float, lon: float, units: str = "metric") -> Dict:
+    """Build a 5-day / 3-hour forecast payload shaped like OpenWeatherMap's."""
+    start = (int(time.time()) // 10800 + 1) * 10800
+    entries = []
+    for i in range(40):
+        dt = start + i * 10800
+        sample = _sample(name, lat, dt // 10800)
+        cid, main, description, icon = sample["condition"]
+        entries.append({
+            "dt": dt,
+            "main": {
+                "temp": _convert(sample["temp"], units),
+                "feels_like": _convert(sample["temp"] - 1.5, units),
+                "humidity": sample["humidity"],
+            },
+            "weather": [{"id": cid, "main": main, "description": description, "icon": icon + "d"}],
+            "wind": {"speed": sample["wind"]},
+            "pop": sample["pop"],
+            "dt_txt": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(dt)),
+        })
+    return {
+        "cod": "200",
+        "cnt": len(entries),
+        "list": entries,
+        "city": {
+            "id": zlib.crc32(name.encode()) % 10_000_000,
+            "name": name,
+            "coord": {"lat": round(lat, 4), "lon": round(lon, 4)},
+            "country": "XX",
+            "timezone": int(round(lon / 15)) * 3600,
+        },
+    }
+
+
+async def serve(args):
+    server = MockWeatherServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_codes=args.error_codes,
+        api_key=args.api_key,
+        not_found=args.not_found,
+    )
+    await server.start()
+    print(f"Mock OpenWeatherMap API listening on {server.base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.05, help="base delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 5xx responses")
+    parser.add_argument("--error-codes", type=int, nargs="+", default=[500, 502, 503])
+    parser.add_argument("--api-key", help="reject other keys with 401")
+    parser.add_argument("--not-found", nargs="*", default=[], help="cities that return 404")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
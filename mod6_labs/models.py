@@ -0,0 +1,65 @@
+# models.py
+"""Compact typed weather records parsed from API responses."""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class WeatherSnapshot:
+    """Current conditions for one place, holding only what the UI uses."""
+
+    city: str
+    country: str
+    lat: float
+    lon: float
+    temp: float
+    feels_like: float
+    humidity: int
+    wind_speed: float
+    condition_id: int
+    main: str
+    description: str
+    icon: str
+    observed_at: int  # UTC seconds
+    tz_offset: int  # seconds east of UTC
+    as_of: Optional[float] = None  # fetch time when served from saved data
+
+    @classmethod
+    def from_api(cls, data: Dict) -> "WeatherSnapshot":
+        """Extract the fields the app needs from a ``/weather`` response."""
+        main = data.get("main", {})
+        weather = (data.get("weather") or [{}])[0]
+        coord = data.get("coord", {})
+        return cls(
+            city=data.get("name", "Unknown"),
+            country=data.get("sys", {}).get("country", ""),
+            lat=coord.get("lat", 0.0),
+            lon=coord.get("lon", 0.0),
+            temp=main.get("temp", 0.0),
+            feels_like=main.get("feels_like", 0.0),
+            humidity=main.get("humidity", 0),
+            wind_speed=data.get("wind", {}).get("speed", 0.0),
+            condition_id=weather.get("id", 800),
+            main=weather.get("main", ""),
+            description=weather.get("description", "").title(),
+            icon=weather.get("icon", "01d"),
+            observed_at=data.get("dt", 0),
+            tz_offset=data.get("timezone", 0),
+            as_of=data.get("_as_of"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ForecastPoint:
+    """One 3-hour step of the forecast."""
+
+    timestamp: int  # UTC seconds
+    temp: float
+    feels_like: float
+    humidity: float
+    wind_speed: float
+    pop: float  # probability of precipitation, 0..1
+    condition_id: int
+    description: str
+    icon: str
@@ -0,0 +1,250 @@
+# observations.py
+"""Append-only columnar store of observed weather, read via memory maps."""
+
+import json
+import os
+import re
+from collections import OrderedDict
+from typing import BinaryIO, Dict, List, Optional
+
+import numpy as np
+
+import geohash
+from forecast_model import lttb
+from gazetteer import normalize
+
+# One raw little-endian file per column; row i of every file is one reading
+COLUMNS = {
+    "time": np.dtype("<i8"),  # observation time, UTC seconds
+    "temp": np.dtype("<f4"),  # °C
+    "feels_like": np.dtype("<f4"),
+    "humidity": np.dtype("<f4"),  # %
+    "pressure": np.dtype("<f4"),  # hPa
+    "wind_speed": np.dtype("<f4"),  # m/s
+    "condition_id": np.dtype("<i2"),
+}
+DECIMATE_FACTOR = 32  # stride long ranges down to this many points per output point
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", normalize(text)).strip("-")
+
+
+def series_id(city: str, country: str = "") -> str:
+    """File-system safe id of a city's series, e.g. ``"sao-paulo-br"``.
+
+    Empty when the name has no Latin letters or digits (e.g. "東京"), so
+    such cities never share a series that is only their country code.
+    """
+    name = _slug(city)
+    if not name:
+        return ""
+    return f"{name}-{_slug(country)}".strip("-")
+
+
+class ObservationStore:
+    """Every current-weather reading, kept per city for trend charts.
+
+    Each city gets a directory holding one file per column (see
+    ``COLUMNS``). Appending writes a few bytes to the end of each file, so
+    it costs the same however long the history is. Reads memory-map the
+    files: range queries binary-search the time column and return views,
+    and only the pages actually touched are read from disk.
+
+    Readings arrive as OpenWeatherMap ``/weather`` responses in metric
+    units. A reading that is not newer than the last one stored for the
+    city (the API serves the same observation for ~10 minutes) is skipped.
+    Write errors and malformed responses are swallowed like in the disk
+    cache: the store must never break a request.
+    """
+
+    def __init__(self, directory: str, max_open: int = 32):
+        self.directory = directory
+        self.max_open = max_open
+        self._files: "OrderedDict[str, Dict[str, BinaryIO]]" = OrderedDict()
+        self._last: Dict[str, int] = {}  # newest stored time per series
+
+    # ------------------ WRITING ------------------ #
+
+    def append(self, data: Dict) -> bool:
+        """Store a ``/weather`` response; returns False if it was skipped."""
+        try:
+            sid = self.series_for(data)
+            observed_at = int(data.get("dt", 0))
+            if not sid or not observed_at:
+                return False
+            main = data.get("main", {})
+            weather = (data.get("weather") or [{}])[0]
+            row = {
+                "time": observed_at,
+                "temp": main.get("temp", np.nan),
+                "feels_like": main.get("feels_like", np.nan),
+                "humidity": main.get("humidity", np.nan),
+                "pressure": main.get("pressure", np.nan),
+                "wind_speed": data.get("wind", {}).get("speed", np.nan),
+                "condition_id": weather.get("id", 0),
+            }
+            # Convert before writing so a bad value cannot leave a partial row
+            values = [np.array(row[name], dtype).tobytes() for name, dtype in COLUMNS.items()]
+            files = self._open(sid, data)
+            if observed_at <= self._last[sid]:
+                return False
+            for f, value in zip(files.values(), values):
+                f.write(value)
+            for f in files.values():
+                f.flush()
+        except (OSError, AttributeError, TypeError, ValueError):
+            return False
+        self._last[sid] = observed_at
+        return True
+
+    def series_for(self, data: Dict) -> str:
+        """Series id of a response: city and country, else its geohash."""
+        name = data.get("name", "")
+        if name:
+            sid = series_id(name, data.get("sys", {}).get("country", ""))
+            if sid:
+                return sid
+        coord = data.get("coord", {})
+        if "lat" in coord and "lon" in coord:
+            return "geo-" + geohash.encode(coord["lat"], coord["lon"], 5)
+        return ""
+
+    def _open(self, sid: str, data: Dict) -> Dict[str, BinaryIO]:
+        """Append handles for a series, creating it on first use."""
+        files = self._files.get(sid)
+        if files is not None:
+            self._files.move_to_end(sid)
+            return files
+
+        path = os.path.join(self.directory, sid)
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, "meta.json")
+        if not os.path.exists(meta_path):
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "city": data.get("name", ""),
+                        "country": data.get("sys", {}).get("country", ""),
+                        "coord": data.get("coord", {}),
+                    },
+                    f,
+                )
+
+        # Drop a partly written last row (e.g. after a crash)
+        rows = self._rows(sid)
+        for name, dtype in COLUMNS.items():
+            column = self._column_path(sid, name)
+            if os.path.exists(column) and os.path.getsize(column) != rows * dtype.itemsize:
+                os.truncate(column, rows * dtype.itemsize)
+        self._last[sid] = int(self._map(sid, "time", rows)[-1]) if rows else 0
+
+        files = {name: open(self._column_path(sid, name), "ab") for name in COLUMNS}
+        self._files[sid] = files
+        while len(self._files) > self.max_open:
+            _, oldest = self._files.popitem(last=False)
+            for f in oldest.values():
+                f.close()
+        return files
+
+    def close(self):
+        """Close every open file."""
+        for files in self._files.values():
+            for f in files.values():
+                f.close()
+        self._files.clear()
+
+    # ------------------ READING ------------------ #
+
+    def series(self) -> List[str]:
+        """Ids of every stored series."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            entry.name for entry in os.scandir(self.directory)
+            if entry.is_dir() and os.path.exists(self._column_path(entry.name, "time"))
+        )
+
+    def metadata(self, sid: str) -> Dict:
+        """City, country and coordinates recorded for a series."""
+        try:
+            with open(os.path.join(self.directory, sid, "meta.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def __len__(self) -> int:
+        return len(self.series())
+
+    def count(self, sid: str) -> int:
+        """Number of readings stored for a series."""
+        return self._rows(sid)
+
+    def read(
+        self,
+        sid: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Readings with ``start <= time <= end`` as read-only column views."""
+        rows = self._rows(sid)
+        if rows == 0:
+            return {name: np.empty(0, dtype) for name, dtype in COLUMNS.items()}
+        times = self._map(sid, "time", rows)
+        lo = 0 if start is None else int(np.searchsorted(times, start, "left"))
+        hi = rows if end is None else int(np.searchsorted(times, end, "right"))
+        return {
+            name: times[lo:hi] if name == "time" else self._map(sid, name, rows)[lo:hi]
+            for name in COLUMNS
+        }
+
+    def downsample(
+        self,
+        sid: str,
+        max_points: int,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        column: str = "temp",
+    ) -> Dict[str, np.ndarray]:
+        """At most ``max_points`` readings of a range, for a chart.
+
+        Points are picked with LTTB so the shape of ``column`` survives;
+        the returned arrays are in-memory copies. Very long ranges are
+        first thinned to an even stride, so the cost stays proportional to
+        ``max_points`` rather than to the range.
+        """
+        columns = self.read(sid, start, end)
+        n = len(columns["time"])
+        if n <= max_points:
+            return {name: np.array(values) for name, values in columns.items()}
+
+        index = np.arange(n)
+        if n > max_points * DECIMATE_FACTOR:
+            index = np.linspace(0, n - 1, max_points * DECIMATE_FACTOR).astype(np.int64)
+        times = columns["time"][index].astype(np.float64)
+        values = np.nan_to_num(columns[column][index].astype(np.float64))
+        index = index[lttb(times, values, max_points)]
+        return {name: np.asarray(values[index]) for name, values in columns.items()}
+
+    # ------------------ FILES ------------------ #
+
+    def _column_path(self, sid: str, name: str) -> str:
+        return os.path.join(self.directory, sid, f"{name}.bin")
+
+    def _rows(self, sid: str) -> int:
+        """Complete rows in a series (the shortest column wins)."""
+        rows = None
+        for name, dtype in COLUMNS.items():
+            try:
+                size = os.path.getsize(self._column_path(sid, name))
+            except OSError:
+                return 0
+            count = size // dtype.itemsize
+            rows = count if rows is None else min(rows, count)
+        return rows or 0
+
+    def _map(self, sid: str, name: str, rows: int) -> np.ndarray:
+        """Memory-map the first ``rows`` values of a column."""
+        return np.memmap(
+            self._column_path(sid, name), dtype=COLUMNS[name], mode="r", shape=(rows,)
+        )
@@ -0,0 +1,170 @@
+# scheduler.py
+"""Background refresh of recently searched and pinned cities."""
+
+import asyncio
+import random
+import time
+from typing import Dict, Iterable, Optional
+
+from resilience import CircuitBreaker
+from weather_service import Query, WeatherService, WeatherServiceError
+
+
+class RefreshScheduler:
+    """Keeps cached weather for a set of cities fresh in the background.
+
+    Cities are given as the query the app searches them by: a name or a
+    (lat, lon) pair, so the refresh warms exactly the cache entries that
+    later searches read.
+
+    Each city is refreshed roughly every ``interval`` seconds (randomized by
+    ``jitter`` so refreshes do not line up), one at a time and at least
+    ``spacing`` seconds apart. A refresh is skipped while the service's
+    rate limiter has fewer than ``reserve`` tokens or its circuit breaker
+    is open, so background work never eats into interactive searches.
+    """
+
+    def __init__(
+        self,
+        service: WeatherService,
+        interval: float = 480,
+        jitter: float = 0.2,
+        spacing: float = 2.0,
+        reserve: float = 3,
+    ):
+        self.service = service
+        self.interval = interval
+        self.jitter = jitter
+        self.spacing = spacing
+        self.reserve = reserve
+        self._due: Dict[Query, float] = {}  # city -> monotonic time of next refresh
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._resumed: Optional[asyncio.Event] = None
+        self.refreshes = 0
+        self.skipped = 0
+
+    # ------------------ CITIES ------------------ #
+
+    def _next_due(self) -> float:
+        spread = random.uniform(1 - self.jitter, 1 + self.jitter)
+        return time.monotonic() + self.interval * spread
+
+    def set_cities(self, cities: Iterable[Query]):
+        """Replace the tracked cities, keeping schedules of existing ones."""
+        cities = list(dict.fromkeys(cities))
+        self._due = {city: self._due.get(city) or self._next_due() for city in cities}
+        self._notify()
+
+    def add(self, city: Query):
+        if city not in self._due:
+            self._due[city] = self._next_due()
+            self._notify()
+
+    def remove(self, city: Query):
+        if self._due.pop(city, None) is not None:
+            self._notify()
+
+    @property
+    def cities(self):
+        return list(self._due)
+
+    # ------------------ LIFECYCLE ------------------ #
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def paused(self) -> bool:
+        return self._resumed is not None and not self._resumed.is_set()
+
+    def start(self):
+        """Start the refresh loop on the running event loop."""
+        if self.running:
+            return
+        self._wake = asyncio.Event()
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        self._task = asyncio.create_task(self._run())
+
+    def pause(self):
+        """Stop refreshing until ``resume()`` (e.g. while the app is hidden)."""
+        if self._resumed is not None:
+            self._resumed.clear()
+
+    def resume(self):
+        if self._resumed is not None:
+            self._resumed.set()
+
+    async def stop(self):
+        """Cancel the refresh loop and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _notify(self):
+        if self._wake is not None:
+            self._wake.set()
+
+    # ------------------ LOOP ------------------ #
+
+    def _has_budget(self) -> bool:
+        return (
+            self.service.rate_limiter.available() >= self.reserve
+            and self.service.circuit_breaker.state != CircuitBreaker.OPEN
+        )
+
+    async def _run(self):
+        while True:
+            await self._resumed.wait()
+
+            if not self._due:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+
+            city, due = min(self._due.items(), key=lambda item: item[1])
+            delay = due - time.monotonic()
+            if delay > 0:
+                # Sleep until the next city is due, or the set changes
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            if self._has_budget():
+                await self._refresh(city)
+                next_due = self._next_due()
+            else:
+                # Out of spare quota: try this city again a little later
+                self.skipped += 1
+                next_due = time.monotonic() + self.interval * self.jitter
+            if city in self._due:
+                self._due[city] = next_due
+            await asyncio.sleep(self.spacing)
+
+    async def _refresh(self, city: Query):
+        """Re-fetch a city so the caches hold fresh data."""
+        if isinstance(city, str):
+            fetches = (
+                self.service.get_weather(city, bypass_cache=True),
+                self.service.get_forecast(city, bypass_cache=True),
+            )
+        else:
+            lat, lon = city
+            fetches = (
+                self.service.get_weather_by_coordinates(lat, lon, bypass_cache=True),
+                self.service.get_forecast_by_coordinates(lat, lon, bypass_cache=True),
+            )
+        try:
+            await asyncio.gather(*fetches)
+            self.refreshes += 1
+        except WeatherServiceError:
+            pass  # try again at the next interval
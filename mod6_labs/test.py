@@ -1,9 +1,21 @@
 # test_weather_service.py
-"""Simple tests for weather service."""
+"""Simple tests for weather service.
+
+Live-only check: calls the real OpenWeatherMap API with the key from
+``.env``. Run it by hand with ``python test.py``; the automated tests in
+``tests/`` use the local mock server instead.
+"""
 
 import asyncio
+from config import Config
 from weather_service import WeatherService, WeatherServiceError
 
+__test__ = False  # not collected by pytest: needs the network and a real key
+
+# Check the API itself, and leave the app's cache and history files alone
+Config.DISK_CACHE_ENABLED = False
+Config.OBSERVATIONS_ENABLED = False
+
 
 async def test_valid_city():
     """Test fetching weather for a valid city."""
@@ -0,0 +1,69 @@
+# conftest.py
+"""Shared fixtures: an isolated Config and a service wired to the mock server.
+
+Tests never reach the real API or the app's cache files. Async scenarios
+run with ``asyncio.run`` so no pytest plugin is needed.
+"""
+
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENWEATHER_API_KEY", "test-key")  # config validates on import
+
+from config import Config  # noqa: E402
+from mock_server import MockWeatherServer  # noqa: E402
+from weather_service import WeatherService  # noqa: E402
+
+
+class FakeClock:
+    """Settable stand-in for ``time.monotonic`` / ``time.time``."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """Point every persistent store at tmp_path and make retries fast."""
+    # Settings that code under test (e.g. the CLI) may overwrite
+    monkeypatch.setattr(Config, "BASE_URL", Config.BASE_URL)
+    monkeypatch.setattr(Config, "FORECAST_URL", Config.FORECAST_URL)
+    monkeypatch.setattr(Config, "DISK_CACHE_ENABLED", True)
+    monkeypatch.setattr(Config, "DISK_CACHE_PATH", str(tmp_path / "weather_cache.db"))
+    monkeypatch.setattr(Config, "OBSERVATIONS_ENABLED", False)
+    monkeypatch.setattr(Config, "OBSERVATIONS_DIR", str(tmp_path / "observations"))
+    monkeypatch.setattr(Config, "CACHE_ENABLED", True)
+    monkeypatch.setattr(Config, "RATE_LIMIT_PER_MINUTE", 0)
+    monkeypatch.setattr(Config, "MAX_RETRIES", 2)
+    monkeypatch.setattr(Config, "RETRY_BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(Config, "RETRY_BACKOFF_MAX", 0.05)
+    monkeypatch.setattr(Config, "TIMEOUT", 2)
+    return tmp_path
+
+
+@asynccontextmanager
+async def _mock_service(**server_options):
+    server_options.setdefault("latency", 0)
+    async with MockWeatherServer(**server_options) as server:
+        async with WeatherService() as service:
+            service.base_url = f"{server.base_url}/weather"
+            service.forecast_url = f"{server.base_url}/forecast"
+            yield server, service
+
+
+@pytest.fixture
+def mock_service():
+    """``async with mock_service(**server_options) as (server, service)``."""
+    return _mock_service
@@ -0,0 +1,68 @@
+# test_cache.py
+"""TTLCache expiry and least-recently-used eviction."""
+
+import pytest
+
+from cache import TTLCache
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.get("b") == 2
+    assert cache.get("missing", "default") == "default"
+
+
+def test_the_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(maxsize=3, clock=clock)
+    for key in "abc":
+        cache.set(key, key.upper())
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("d", "D")
+    assert "b" not in cache
+    assert [key for key in "acd" if key in cache] == ["a", "c", "d"]
+    assert cache.evictions == 1
+
+    cache.set("c", "C2")  # re-setting also counts as a use
+    cache.set("e", "E")
+    assert "a" not in cache
+    assert cache.get("c") == "C2"
+
+
+def test_peek_does_not_count_or_reorder(clock):
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.peek("a") == 1
+    cache.set("c", 3)  # "a" was only peeked, so it is still the oldest
+    assert "a" not in cache
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+    clock.now = 10
+    assert cache.peek("b") is None
+
+
+def test_stats(clock):
+    cache = TTLCache(maxsize=2, clock=clock)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    stats = cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_ratio"] == 0.5
+
+    cache.invalidate("a")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 1  # counters survive a clear
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0)
@@ -0,0 +1,112 @@
+# test_forecast_model.py
+"""Daily aggregates, chart downsampling and LTTB of the forecast model."""
+
+from datetime import date
+
+import numpy as np
+
+from forecast_model import ForecastModel, lttb
+
+MIDNIGHT = 1_699_920_000  # 2023-11-14 00:00 UTC, a Tuesday
+STEP = 3 * 3600
+
+
+def forecast_response(temps, conditions=None, pops=None, tz=0, icon="10n"):
+    """A ``/forecast`` response with one entry every 3 hours from MIDNIGHT."""
+    conditions = conditions or [800] * len(temps)
+    pops = pops or [0.0] * len(temps)
+    return {
+        "city": {"name": "Testville", "timezone": tz},
+        "list": [
+            {
+                "dt": MIDNIGHT + i * STEP,
+                "main": {"temp": temp, "feels_like": temp - 1, "humidity": 50 + i},
+                "wind": {"speed": float(i)},
+                "pop": pop,
+                "weather": [{"id": cid, "description": f"cond {cid}", "icon": icon}],
+            }
+            for i, (temp, cid, pop) in enumerate(zip(temps, conditions, pops))
+        ],
+    }
+
+
+def test_from_response_parses_columns():
+    data = forecast_response([1.0, 2.0])
+    data["_as_of"] = 123.0
+    model = ForecastModel.from_response(data)
+    assert len(model) == 2
+    assert model.city == "Testville"
+    assert model.as_of == 123.0
+    point = model.point(1)
+    assert (point.temp, point.humidity, point.wind_speed) == (2.0, 51.0, 1.0)
+    assert point.description == "Cond 800"
+
+
+def test_daily_aggregates_each_local_day():
+    temps = [float(t) for t in range(8)] + [float(t) for t in range(10, 18)]
+    conditions = [800, 800, 500, 500, 500, 800, 801, 801] + [500] * 7 + [800]
+    model = ForecastModel.from_response(forecast_response(temps, conditions))
+    daily = model.daily()
+
+    assert len(daily) == 2
+    assert daily.dates == [date(2023, 11, 14), date(2023, 11, 15)]
+    assert daily.labels == ["Tue", "Wed"]
+    np.testing.assert_allclose(daily.temp_min, [0, 10])
+    np.testing.assert_allclose(daily.temp_max, [7, 17])
+    np.testing.assert_allclose(daily.temp_mean, [3.5, 13.5])
+    np.testing.assert_allclose(daily.wind_max, [7, 15])
+    # 800 and 500 both appear three times on day one: the earlier one wins
+    assert list(daily.condition_id) == [800, 500]
+    assert daily.icons == ["10d", "10d"]  # always the daytime icon
+    assert model.daily() is daily
+
+
+def test_days_follow_the_city_timezone():
+    model = ForecastModel.from_response(forecast_response([0.0] * 16, tz=-4 * 3600))
+    daily = model.daily()
+    # UTC midnight is 20:00 the day before, so the runs are 2 + 8 + 6 entries
+    assert daily.dates == [date(2023, 11, 13), date(2023, 11, 14), date(2023, 11, 15)]
+
+
+def test_hourly_downsamples_each_series():
+    temps = [10.0] * 40
+    temps[17] = 30.0
+    pops = [0.0] * 40
+    pops[25] = 1.0
+    model = ForecastModel.from_response(forecast_response(temps, pops=pops))
+    series = model.hourly(10)
+
+    assert len(series) == 10
+    assert series.temp_hours[0] == 0 and series.temp_hours[-1] == 39 * 3
+    assert series.span == 39 * 3
+    assert 30.0 in series.temp  # each series keeps its own peak
+    assert 1.0 in series.pop
+    assert series.day_ticks == [(24.0, "Wed"), (48.0, "Thu"), (72.0, "Fri"), (96.0, "Sat")]
+    assert model.hourly(10) is series
+    assert len(model.hourly(100)) == 40
+
+
+def test_empty_forecast():
+    model = ForecastModel.from_response({})
+    assert len(model) == 0
+    assert len(model.daily()) == 0
+    assert len(model.hourly(10)) == 0
+
+
+def test_lttb_keeps_the_ends_and_the_peaks():
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50)
+    y[333] = 10.0
+    y[777] = -10.0
+    index = lttb(x, y, 50)
+    assert len(index) == 50
+    assert index[0] == 0 and index[-1] == 999
+    assert np.all(np.diff(index) > 0)
+    assert 333 in index and 777 in index
+
+
+def test_lttb_returns_everything_when_no_reduction_is_possible():
+    x = np.arange(5, dtype=float)
+    assert list(lttb(x, x, 5)) == [0, 1, 2, 3, 4]
+    assert list(lttb(x, x, 10)) == [0, 1, 2, 3, 4]
+    assert list(lttb(x, x, 2)) == [0, 1, 2, 3, 4]
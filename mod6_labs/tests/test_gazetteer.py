@@ -0,0 +1,85 @@
+# test_gazetteer.py
+"""Prefix search and exact lookup in the offline city list."""
+
+import gzip
+
+import pytest
+
+from config import Config
+from gazetteer import Gazetteer, normalize
+
+CITIES = """name\tcountry\tlat\tlon\tpopulation
+London\tGB\t51.5085\t-0.1257\t8961989
+London\tCA\t42.9834\t-81.2330\t346765
+Londonderry\tGB\t54.9975\t-7.3086\t83652
+Paris\tFR\t48.8534\t2.3488\t2138551
+Paris\tUS\t33.6609\t-95.5555\t24782
+São Paulo\tBR\t-23.5475\t-46.6361\t10021295
+Santos\tBR\t-23.9608\t-46.3336\t433966
+"""
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    path = tmp_path / "cities.tsv.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(CITIES)
+    return Gazetteer(str(path))
+
+
+def test_normalize():
+    assert normalize("  São   PAULO ") == "sao paulo"
+
+
+def test_search_returns_prefix_matches_most_populous_first(gazetteer):
+    assert not gazetteer.loaded
+    labels = [city.label for city in gazetteer.search("lon")]
+    assert labels == ["London, GB", "London, CA", "Londonderry, GB"]
+    assert gazetteer.loaded
+    assert len(gazetteer) == 7
+
+
+def test_search_limit_and_country_filter(gazetteer):
+    assert [c.label for c in gazetteer.search("lon", limit=1)] == ["London, GB"]
+    assert [c.label for c in gazetteer.search("lon, ca")] == ["London, CA"]
+    assert [c.label for c in gazetteer.search("par, u")] == ["Paris, US"]
+    assert gazetteer.search("lon", limit=0) == []
+    assert gazetteer.search("   ") == []
+    assert gazetteer.search("xyz") == []
+
+
+def test_search_ignores_accents(gazetteer):
+    [city] = gazetteer.search("sao p")
+    assert (city.name, city.country) == ("São Paulo", "BR")
+    assert (city.lat, city.lon) == (-23.5475, -46.6361)
+    assert city.population == 10021295
+
+
+def test_lookup_needs_an_exact_name(gazetteer):
+    assert gazetteer.lookup("london").label == "London, GB"
+    assert gazetteer.lookup("London, CA").label == "London, CA"
+    assert gazetteer.lookup("SAO PAULO").label == "São Paulo, BR"
+    assert gazetteer.lookup("Lond") is None  # a prefix is not a match
+    assert gazetteer.lookup("London, FR") is None
+    assert gazetteer.lookup("") is None
+
+
+def test_geonames_dumps_are_read(tmp_path):
+    fields = ["2988507", "Paris", "Paris", "", "48.85341", "2.3488", "P", "PPLC",
+              "FR", "", "11", "75", "751", "75056", "2138551", "", "42", "Europe/Paris", ""]
+    path = tmp_path / "cities15000.txt"
+    path.write_text("\t".join(fields) + "\n", encoding="utf-8")
+    [city] = Gazetteer(str(path)).search("par")
+    assert (city.label, city.population) == ("Paris, FR", 2138551)
+
+
+def test_missing_file_means_no_suggestions(tmp_path):
+    gazetteer = Gazetteer(str(tmp_path / "missing.tsv"))
+    assert gazetteer.search("lon") == []
+    assert len(gazetteer) == 0
+
+
+def test_bundled_city_list_loads():
+    gazetteer = Gazetteer(Config.GAZETTEER_PATH)
+    assert len(gazetteer) > 200
+    assert gazetteer.lookup("Tokyo").country == "JP"
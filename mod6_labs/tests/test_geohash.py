@@ -0,0 +1,41 @@
+# test_geohash.py
+"""Geohash cells and distances used by the spatial cache."""
+
+import pytest
+
+import geohash
+
+
+def test_encode_matches_a_known_geohash():
+    assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert geohash.encode(57.64911, 10.40744) == "u4pruy"
+
+
+def test_decode_is_inside_the_cell_bounds():
+    min_lat, min_lon, max_lat, max_lon = geohash.bounds("u4pruy")
+    lat, lon = geohash.decode("u4pruy")
+    assert min_lat < 57.64911 < max_lat and min_lon < 10.40744 < max_lon
+    assert (lat, lon) == ((min_lat + max_lat) / 2, (min_lon + max_lon) / 2)
+    assert geohash.encode(lat, lon, 6) == "u4pruy"
+
+
+def test_neighbors_surround_the_cell():
+    cells = geohash.neighbors("gcpvj0")
+    assert len(cells) == len(set(cells)) == 8
+    assert "gcpvj0" not in cells
+    lat, lon = geohash.decode("gcpvj0")
+    for cell in cells:
+        n_lat, n_lon = geohash.decode(cell)
+        assert abs(n_lat - lat) < 0.01 and abs(n_lon - lon) < 0.02
+
+
+def test_neighbors_wrap_at_the_antimeridian():
+    cell = geohash.encode(0.01, 179.999, 4)
+    west_of_dateline = {geohash.decode(c)[1] < 0 for c in geohash.neighbors(cell)}
+    assert west_of_dateline == {True, False}
+
+
+def test_distance():
+    assert geohash.distance(51.5074, -0.1278, 51.5074, -0.1278) == 0
+    # London to Paris is about 344 km
+    assert geohash.distance(51.5074, -0.1278, 48.8566, 2.3522) == pytest.approx(343_600, rel=0.01)
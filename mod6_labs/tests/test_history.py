@@ -0,0 +1,100 @@
+# test_history.py
+"""Frecency ranking, eviction and persistence of the search history."""
+
+import asyncio
+
+from gazetteer import City
+from history import SearchHistory
+
+DAY = 86400
+
+
+class MemoryStorage:
+    """Stand-in for ``page.client_storage``."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get_async(self, key):
+        return self.values.get(key)
+
+    async def set_async(self, key, value):
+        self.values[key] = value
+
+
+def test_recent_searches_outrank_old_frequent_ones(clock):
+    history = SearchHistory(MemoryStorage(), half_life=DAY, clock=clock)
+    for _ in range(3):
+        history.record("London")
+    clock.now = 3 * DAY  # London has decayed to 3 * 1/8
+    history.record("Paris")
+    assert history.labels() == ["Paris", "London"]
+
+    history.record("London")  # 0.375 + 1 beats Paris's 1
+    assert history.labels() == ["London", "Paris"]
+    assert history.get("London").count == 4
+
+
+def test_labels_differing_in_case_or_accents_share_an_entry(clock):
+    history = SearchHistory(MemoryStorage(), clock=clock)
+    history.record("London")
+    history.record("  london ")
+    history.record("SAO PAULO")
+    history.record("São Paulo")
+    assert history.labels() == ["London", "SAO PAULO"]
+    assert history.get("LONDON").count == 2
+    assert "sao paulo" in history
+
+    history.remove("LONDON")
+    assert history.labels() == ["SAO PAULO"]
+
+
+def test_scores_decay_with_the_half_life(clock):
+    history = SearchHistory(MemoryStorage(), half_life=DAY, clock=clock)
+    entry = history.record("London")
+    history.record("London")
+    assert history.frecency(entry) == 2
+    clock.now = DAY
+    assert history.frecency(entry) == 1
+
+
+def test_the_weakest_entry_is_evicted_when_full(clock):
+    history = SearchHistory(MemoryStorage(), max_entries=2, half_life=DAY, clock=clock)
+    history.record("London")
+    history.record("London")
+    clock.now = 1
+    history.record("Paris")
+    clock.now = 2
+    history.record("Tokyo")  # the new entry is kept even though it ties Paris
+    assert len(history) == 2
+    assert "Paris" not in history
+    assert history.labels() == ["London", "Tokyo"]
+
+
+def test_history_round_trips_through_storage(clock):
+    clock.now = 1000
+    storage = MemoryStorage()
+    history = SearchHistory(storage, clock=clock)
+    paris = City("Paris", "FR", 48.85, 2.35, 2_100_000)
+    history.record("London")
+    history.record("Paris, FR", city=paris)
+    history.record("Paris, FR")
+
+    async def reload():
+        await history.save()
+        restored = SearchHistory(storage, clock=clock)
+        await restored.load()
+        return restored
+
+    restored = asyncio.run(reload())
+    assert restored.labels() == ["Paris, FR", "London"]
+    assert restored.get("Paris, FR").city == paris
+    assert restored.get("Paris, FR").count == 2
+
+
+def test_corrupt_storage_is_ignored():
+    storage = MemoryStorage()
+    storage.values["weather_app.history"] = [{"label": "London"}, {"score": 1}, "junk"]
+    history = SearchHistory(storage)
+    asyncio.run(history.load())
+    assert history.labels() == ["London"]
@@ -0,0 +1,26 @@
+# test_metrics.py
+"""Rolling request metrics and percentiles."""
+
+from metrics import RollingHistogram, _percentile
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert _percentile(values, 50) == 50
+    assert _percentile(values, 95) == 95
+    assert _percentile(values, 100) == 100
+    assert _percentile([7.0], 99) == 7.0
+    assert _percentile([], 50) == 0.0
+
+
+def test_histogram_forgets_samples_outside_the_window(clock):
+    histogram = RollingHistogram(bounds=(10, 100), window=60, clock=clock)
+    for value in (5, 50, 500):
+        histogram.record(value)
+    assert histogram.buckets() == [(10, 1), (100, 1), (float("inf"), 1)]
+
+    clock.now = 30
+    histogram.record(20)
+    clock.now = 61
+    assert histogram.values() == [20]
+    assert histogram.summary() == {"count": 1, "mean": 20, "p50": 20, "p95": 20, "max": 20}
@@ -0,0 +1,144 @@
+# test_observations.py
+"""Appending to and reading from the memory-mapped observation store."""
+
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from config import Config
+from observations import ObservationStore, series_id
+
+
+def reading(dt, temp=10.0, name="London", country="GB"):
+    """A minimal ``/weather`` response."""
+    return {
+        "name": name,
+        "sys": {"country": country},
+        "coord": {"lat": 51.51, "lon": -0.13},
+        "dt": dt,
+        "main": {"temp": temp, "feels_like": temp - 1, "humidity": 80, "pressure": 1012},
+        "wind": {"speed": 3.5},
+        "weather": [{"id": 800}],
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ObservationStore(str(tmp_path / "observations"))
+    yield store
+    store.close()
+
+
+def test_series_id():
+    assert series_id("São Paulo", "BR") == "sao-paulo-br"
+    assert series_id("London", "GB") == "london-gb"
+    assert series_id("Zürich") == "zurich"
+    assert series_id("東京", "JP") == ""  # never just the country code
+
+
+def test_names_without_latin_letters_use_a_geohash_series(store):
+    tokyo = reading(100, name="東京", country="JP")
+    tokyo["coord"] = {"lat": 35.68, "lon": 139.69}
+    osaka = reading(100, name="大阪", country="JP")
+    osaka["coord"] = {"lat": 34.69, "lon": 135.50}
+    assert store.append(tokyo) and store.append(osaka)
+    assert store.series() == ["geo-xn0m7", "geo-xn76f"]
+
+
+def test_repeated_observations_are_skipped(store):
+    assert store.append(reading(100))
+    assert not store.append(reading(100))  # same observation served again
+    assert not store.append(reading(50))
+    assert store.append(reading(200))
+    assert store.series() == ["london-gb"]
+    assert store.count("london-gb") == 2
+    assert store.metadata("london-gb")["city"] == "London"
+
+
+def test_readings_without_a_name_use_a_geohash_series(store):
+    data = reading(100, name="")
+    assert store.series_for(data).startswith("geo-gcpv")
+    assert store.append(data)
+
+
+@pytest.mark.parametrize("bad", [
+    {"dt": "soon"},
+    {"dt": None},
+    {"main": None},
+    {"main": {"temp": "hot"}},
+    {"weather": [None]},
+    {"sys": None},
+])
+def test_malformed_responses_are_skipped(store, bad):
+    assert not store.append({**reading(100), **bad})
+    assert store.count("london-gb") == 0
+    assert store.append(reading(200))
+
+
+def test_range_reads_are_inclusive(store):
+    for i in range(10):
+        store.append(reading(1000 + i * 600, temp=float(i)))
+    columns = store.read("london-gb", start=1600, end=3400)
+    assert list(columns["time"]) == [1600, 2200, 2800, 3400]
+    assert list(columns["temp"]) == [1.0, 2.0, 3.0, 4.0]
+    assert columns["condition_id"].dtype == np.int16
+    assert len(store.read("london-gb", start=10**9)["time"]) == 0
+    assert len(store.read("missing")["time"]) == 0
+
+
+def test_downsample_keeps_the_shape(store):
+    for i in range(500):
+        store.append(reading(1000 + i * 600, temp=30.0 if i == 250 else 10.0))
+    columns = store.downsample("london-gb", 50)
+    times = columns["time"]
+    assert len(times) == 50
+    assert times[0] == 1000 and times[-1] == 1000 + 499 * 600
+    assert np.all(np.diff(times) > 0)
+    assert 30.0 in columns["temp"]  # the spike survives
+
+    short = store.downsample("london-gb", 50, end=1000 + 9 * 600)
+    assert len(short["time"]) == 10
+
+
+def test_a_reopened_store_continues_the_series(store):
+    store.append(reading(100))
+    store.close()
+    reopened = ObservationStore(store.directory)
+    assert not reopened.append(reading(100))
+    assert reopened.append(reading(200))
+    assert reopened.count("london-gb") == 2
+    reopened.close()
+
+
+def test_a_partly_written_row_is_dropped(store):
+    store.append(reading(100))
+    store.append(reading(200))
+    store.close()
+    with open(os.path.join(store.directory, "london-gb", "temp.bin"), "ab") as f:
+        f.write(b"\x00\x00")  # crash half-way through a row
+    with open(os.path.join(store.directory, "london-gb", "time.bin"), "ab") as f:
+        f.write(np.array(300, "<i8").tobytes())
+    assert store.count("london-gb") == 2
+
+    reopened = ObservationStore(store.directory)
+    assert reopened.append(reading(300, temp=12.0))
+    columns = reopened.read("london-gb")
+    assert list(columns["time"]) == [100, 200, 300]
+    assert list(columns["temp"]) == [10.0, 10.0, 12.0]
+    reopened.close()
+
+
+def test_the_service_records_current_weather(mock_service, monkeypatch):
+    monkeypatch.setattr(Config, "OBSERVATIONS_ENABLED", True)
+
+    async def scenario():
+        async with mock_service() as (server, service):
+            await service.get_weather("London")
+            await service.get_forecast("London")
+            return service.observations
+
+    observations = asyncio.run(scenario())
+    assert observations.series() == ["london-xx"]  # forecasts are not recorded
+    assert observations.count("london-xx") == 1
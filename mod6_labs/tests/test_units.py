@@ -0,0 +1,37 @@
+# test_units.py
+"""Display-unit conversion from the stored metric values."""
+
+import numpy as np
+import pytest
+
+from units import UNIT_SYSTEMS, convert_speed, convert_temp, next_units
+
+
+@pytest.mark.parametrize("units, expected", [
+    ("metric", 20.0),
+    ("imperial", 68.0),
+    ("standard", 293.15),
+])
+def test_convert_temp(units, expected):
+    assert convert_temp(20.0, units) == pytest.approx(expected)
+
+
+def test_convert_temp_handles_arrays():
+    values = convert_temp(np.array([-40.0, 0.0, 100.0]), "imperial")
+    np.testing.assert_allclose(values, [-40.0, 32.0, 212.0])
+
+
+@pytest.mark.parametrize("units, expected", [
+    ("metric", 10.0),
+    ("imperial", 22.369),
+    ("standard", 10.0),
+])
+def test_convert_speed(units, expected):
+    assert convert_speed(10.0, units) == pytest.approx(expected, abs=1e-3)
+
+
+def test_next_units_cycles_through_every_system():
+    seen = ["metric"]
+    while len(seen) <= len(UNIT_SYSTEMS):
+        seen.append(next_units(seen[-1]))
+    assert seen == ["metric", "imperial", "standard", "metric"]
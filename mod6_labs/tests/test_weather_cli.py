@@ -0,0 +1,137 @@
+# test_weather_cli.py
+"""Query parsing, streamed output and exit codes of the batch CLI."""
+
+import asyncio
+import csv
+import io
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+import weather_cli
+from config import Config
+from mock_server import MockWeatherServer
+from weather_cli import format_query, parse_query, read_queries
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("London", "London"),
+    ("  London, GB \n", "London, GB"),
+    ("51.51,-0.13", (51.51, -0.13)),
+    ("-33.87, 151.21", (-33.87, 151.21)),
+    ("1.5, north", "1.5, north"),
+    ("", None),
+    ("   ", None),
+    ("# a comment", None),
+])
+def test_parse_query(line, expected):
+    assert parse_query(line) == expected
+
+
+def test_read_queries_is_lazy_and_skips_blanks():
+    lines = iter(["London\n", "\n", "# skip\n", "48.85,2.35\n"])
+    queries = read_queries(lines)
+    assert next(queries) == "London"
+    assert next(lines) == "\n"  # only what was needed has been read
+    assert list(queries) == [(48.85, 2.35)]
+
+
+def test_format_query():
+    assert format_query("Paris") == "Paris"
+    assert format_query((48.85, 2.35)) == "48.85,2.35"
+
+
+def test_run_streams_csv_rows():
+    async def scenario():
+        async with MockWeatherServer(latency=0) as server:
+            Config.BASE_URL = f"{server.base_url}/weather"
+            out = io.StringIO()
+            counts = await weather_cli.run(["London", "InvalidCity", (48.85, 2.35)], out)
+            return counts, out.getvalue()
+
+    counts, text = asyncio.run(scenario())
+    assert counts == {"ok": 2, "failed": 1}
+    rows = {row["query"]: row for row in csv.DictReader(io.StringIO(text))}
+    assert list(rows["London"]) == weather_cli.WEATHER_FIELDS
+    assert rows["London"]["city"] == "London" and not rows["London"]["error"]
+    assert rows["48.85,2.35"]["lat"] == "48.85"
+    assert "not found" in rows["InvalidCity"]["error"]
+
+
+def test_run_writes_forecast_jsonl_in_the_requested_units():
+    async def scenario():
+        async with MockWeatherServer(latency=0) as server:
+            Config.FORECAST_URL = f"{server.base_url}/forecast"
+            outputs = {}
+            for units in ("metric", "imperial"):
+                out = outputs[units] = io.StringIO()
+                await weather_cli.run(["Oslo"], out, fmt="jsonl", endpoint="forecast", units=units)
+            return {
+                units: [json.loads(line) for line in out.getvalue().splitlines()]
+                for units, out in outputs.items()
+            }
+
+    rows = asyncio.run(scenario())
+    metric, imperial = rows["metric"], rows["imperial"]
+    assert 5 <= len(metric) <= 6  # one row per local day
+    assert {row["city"] for row in metric} == {"Oslo"}
+    assert all(row["temp_min"] <= row["temp_mean"] <= row["temp_max"] for row in metric)
+    for c, f in zip(metric, imperial):
+        assert f["date"] == c["date"]
+        assert f["temp_max"] == pytest.approx(c["temp_max"] * 9 / 5 + 32, abs=0.02)
+
+
+@pytest.fixture
+def server_url():
+    """A mock server on its own loop, for code that calls asyncio.run itself."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    server = MockWeatherServer(latency=0)
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    yield server.base_url
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["weather_cli.py", *args])
+    with pytest.raises(SystemExit) as info:
+        weather_cli.main()
+    return info.value.code
+
+
+def test_main_exits_zero_when_every_query_succeeds(server_url, tmp_path, monkeypatch, capsys):
+    source = tmp_path / "cities.txt"
+    source.write_text("London\n# comment\n\n51.51,-0.13\n", encoding="utf-8")
+    output = tmp_path / "out.csv"
+
+    assert run_main(monkeypatch, str(source), "-o", str(output), "--url", server_url) == 0
+    assert len(output.read_text(encoding="utf-8").splitlines()) == 3
+    assert "2 ok, 0 failed" in capsys.readouterr().err
+    # Nothing persisted without --disk-cache / --record-observations
+    assert not os.path.exists(Config.DISK_CACHE_PATH)
+    assert not os.path.exists(Config.OBSERVATIONS_DIR)
+
+
+def test_main_exits_one_when_any_query_fails(server_url, tmp_path, monkeypatch, capsys):
+    source = tmp_path / "cities.txt"
+    source.write_text("London\nInvalidCity\n", encoding="utf-8")
+
+    code = run_main(
+        monkeypatch, str(source), "-o", str(tmp_path / "out.jsonl"),
+        "--format", "jsonl", "--url", server_url, "--disk-cache",
+    )
+    assert code == 1
+    assert "1 ok, 1 failed" in capsys.readouterr().err
+    assert os.path.exists(Config.DISK_CACHE_PATH)
+
+
+def test_main_rejects_bad_arguments(monkeypatch, capsys):
+    assert run_main(monkeypatch, "--format", "xml") == 2
+    assert "invalid choice" in capsys.readouterr().err
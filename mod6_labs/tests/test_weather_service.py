@@ -0,0 +1,336 @@
+# test_weather_service.py
+"""WeatherService against the local mock server: caching, coalescing,
+retries, the circuit breaker and the stale / offline fallbacks."""
+
+import asyncio
+import time
+
+import pytest
+
+import geohash
+from config import Config
+from resilience import CircuitBreaker
+from weather_service import ServiceUnavailableError, WeatherServiceError
+
+
+def fail_first(server, count, status=503):
+    """Make the next ``count`` requests to the mock server fail."""
+    route = server._route
+
+    async def flaky(target):
+        nonlocal count
+        if count > 0:
+            count -= 1
+            return status, {"cod": str(status), "message": "Internal error"}
+        return await route(target)
+
+    server._route = flaky
+
+
+# ------------------ CACHING AND COALESCING ------------------ #
+
+def test_concurrent_requests_share_one_fetch(mock_service):
+    async def scenario():
+        async with mock_service(latency=0.05) as (server, service):
+            results = await asyncio.gather(
+                *(service.get_weather("London") for _ in range(10))
+            )
+            assert all(data == results[0] for data in results)
+            assert server.requests == 1
+            assert service.coalesced_requests == 9
+            assert not service._inflight
+
+    asyncio.run(scenario())
+
+
+def test_equivalent_city_names_hit_the_memory_cache(mock_service):
+    async def scenario():
+        async with mock_service() as (server, service):
+            first = await service.get_weather("London")
+            again = await service.get_weather("  london ")
+            assert again == first
+            assert server.requests == 1
+
+            await service.get_weather("London", bypass_cache=True)
+            assert server.requests == 2
+
+    asyncio.run(scenario())
+
+
+def test_not_found_is_an_error_but_not_an_outage(mock_service):
+    async def scenario():
+        async with mock_service() as (server, service):
+            with pytest.raises(WeatherServiceError, match="not found") as info:
+                await service.get_weather("InvalidCity")
+            assert not isinstance(info.value, ServiceUnavailableError)
+            assert service.circuit_breaker.state == CircuitBreaker.CLOSED
+            assert server.requests == 1
+
+            with pytest.raises(WeatherServiceError):
+                await service.get_weather("   ")
+            assert server.requests == 1
+
+    asyncio.run(scenario())
+
+
+def test_batch_keeps_going_past_failures(mock_service):
+    async def scenario():
+        async with mock_service() as (server, service):
+            queries = ["London", "InvalidCity", (48.85, 2.35), "Paris"]
+            results = [r async for r in service.get_weather_many(queries, concurrency=2)]
+            assert sorted(map(str, (r.query for r in results))) == sorted(map(str, queries))
+            failed = [r.query for r in results if not r.ok]
+            assert failed == ["InvalidCity"]
+
+    asyncio.run(scenario())
+
+
+def test_one_broken_item_does_not_abort_the_batch(mock_service, monkeypatch):
+    async def scenario():
+        async with mock_service() as (server, service):
+            store = service._store
+
+            def failing_store(key, data, ttl):
+                if data.get("name") == "Paris":
+                    raise RuntimeError("disk on fire")
+                store(key, data, ttl)
+
+            monkeypatch.setattr(service, "_store", failing_store)
+            queries = ["London", (1.0, 2.0, 3.0), "Paris", None, "Tokyo"]
+            results = [r async for r in service.get_weather_many(queries, concurrency=2)]
+            assert len(results) == 5
+            ok = sorted(r.query for r in results if r.ok)
+            assert ok == ["London", "Tokyo"]
+            for result in results:
+                if not result.ok:
+                    assert isinstance(result.error, WeatherServiceError)
+            forecasts = [r async for r in service.get_forecast_many([(1.0,), "Rome"])]
+            assert {r.query: r.ok for r in forecasts} == {(1.0,): False, "Rome": True}
+
+    asyncio.run(scenario())
+
+
+# ------------------ RETRIES AND CIRCUIT BREAKER ------------------ #
+
+def test_transient_errors_are_retried(mock_service):
+    async def scenario():
+        async with mock_service() as (server, service):
+            fail_first(server, 2)
+            data = await service.get_weather("London")
+            assert data["name"] == "London"
+            assert server.requests == 3
+            assert service.retried_requests == 2
+
+    asyncio.run(scenario())
+
+
+def test_retries_give_up_after_max_retries(mock_service):
+    async def scenario():
+        async with mock_service(error_rate=1.0) as (server, service):
+            with pytest.raises(ServiceUnavailableError):
+                await service.get_weather("London")
+            assert server.requests == Config.MAX_RETRIES + 1
+
+    asyncio.run(scenario())
+
+
+def test_open_circuit_fails_fast_without_waiting(mock_service, monkeypatch):
+    monkeypatch.setattr(Config, "RETRY_BACKOFF_BASE", 5)
+    monkeypatch.setattr(Config, "RETRY_BACKOFF_MAX", 5)
+
+    async def scenario():
+        async with mock_service(error_rate=1.0) as (server, service):
+            service.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+
+            started = time.perf_counter()
+            with pytest.raises(ServiceUnavailableError):
+                await service.get_weather("London")
+            # The retry would be rejected by the open circuit, so no backoff sleep
+            assert time.perf_counter() - started < 1
+            assert server.requests == 1
+            assert service.circuit_breaker.state == CircuitBreaker.OPEN
+
+            with pytest.raises(ServiceUnavailableError) as info:
+                await service.get_weather("Paris")
+            assert info.value.retry_after > 0
+            assert server.requests == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_trial_frees_the_half_open_slot(mock_service, clock):
+    async def scenario():
+        async with mock_service() as (server, service):
+            breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+            service.circuit_breaker = breaker
+            breaker.record_failure()
+            clock.now = 10
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+
+            server.latency = 5
+            caller = asyncio.create_task(service.get_weather("London"))
+            await asyncio.sleep(0.1)
+            assert not breaker.would_allow()  # the trial is in flight
+
+            for task in list(service._inflight.values()):
+                task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert breaker.would_allow()
+
+            server.latency = 0
+            data = await service.get_weather("London")
+            assert data["name"] == "London"
+            assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())
+
+
+# ------------------ DISK CACHE FALLBACKS ------------------ #
+
+def saved_weather(name="London"):
+    return {"name": name, "dt": 1, "main": {"temp": 1.0}, "sys": {"country": "GB"}}
+
+
+def test_stale_entry_is_served_while_revalidating(mock_service):
+    async def scenario():
+        async with mock_service(latency=0.05) as (server, service):
+            key = service._city_key("weather", "London")
+            fetched_at = time.time() - Config.WEATHER_CACHE_TTL - 60
+            service.disk_cache.set(key, saved_weather("Old London"), fetched_at)
+
+            data = await service.get_weather("London")
+            assert data["name"] == "Old London"
+            assert data["_as_of"] == pytest.approx(fetched_at)
+            assert key in service._inflight  # refreshing in the background
+
+            await asyncio.gather(*service._inflight.values())
+            assert server.requests == 1
+            fresh = await service.get_weather("London")
+            assert fresh["name"] == "London"
+            assert "_as_of" not in fresh
+            assert server.requests == 1
+
+    asyncio.run(scenario())
+
+
+def test_fresh_disk_entry_is_served_without_a_request(mock_service):
+    async def scenario():
+        async with mock_service() as (server, service):
+            key = service._city_key("weather", "London")
+            service.disk_cache.set(key, saved_weather("Saved London"))
+
+            data = await service.get_weather("London")
+            assert data["name"] == "Saved London"
+            assert server.requests == 0
+            assert key in service.cache
+
+    asyncio.run(scenario())
+
+
+def test_offline_falls_back_to_the_last_saved_response(mock_service):
+    async def scenario():
+        async with mock_service(error_rate=1.0) as (server, service):
+            key = service._city_key("weather", "London")
+            fetched_at = (
+                time.time() - Config.WEATHER_CACHE_TTL - Config.STALE_WHILE_REVALIDATE - 60
+            )
+            service.disk_cache.set(key, saved_weather("Old London"), fetched_at)
+
+            data = await service.get_weather("London")
+            assert data["name"] == "Old London"
+            assert data["_as_of"] == pytest.approx(fetched_at)
+            assert server.requests == Config.MAX_RETRIES + 1
+
+            with pytest.raises(ServiceUnavailableError):
+                await service.get_weather("Paris")  # nothing saved
+
+    asyncio.run(scenario())
+
+
+def test_unreachable_server_falls_back_to_the_saved_response(mock_service):
+    async def scenario():
+        async with mock_service() as (server, service):
+            key = service._city_key("weather", "London")
+            fetched_at = time.time() - 2 * Config.STALE_WHILE_REVALIDATE
+            service.disk_cache.set(key, saved_weather("Old London"), fetched_at)
+            await server.close()  # nothing listens on the port any more
+
+            data = await service.get_weather("London")
+            assert data["name"] == "Old London"
+            assert "_as_of" in data
+
+    asyncio.run(scenario())
+
+
+# ------------------ SPATIAL CACHE ------------------ #
+
+def points_across_a_cell_edge(precision):
+    """Two points ~110 m apart on either side of a geohash cell edge."""
+    cell = geohash.encode(51.5, -0.12, precision)
+    _, min_lon, max_lat, max_lon = geohash.bounds(cell)
+    lon = (min_lon + max_lon) / 2
+    inside, outside = (max_lat - 0.0005, lon), (max_lat + 0.0005, lon)
+    assert geohash.encode(*outside, precision) != cell
+    return inside, outside
+
+
+def test_nearby_coordinates_reuse_a_neighbouring_cell(mock_service):
+    async def scenario():
+        async with mock_service() as (server, service):
+            inside, outside = points_across_a_cell_edge(service.geo_precision)
+
+            first = await service.get_weather_by_coordinates(*inside)
+            assert server.requests == 1
+
+            assert await service.get_weather_by_coordinates(*inside) == first
+            assert service.nearby_hits == 0  # same cell is a plain cache hit
+
+            assert await service.get_weather_by_coordinates(*outside) == first
+            assert server.requests == 1
+            assert service.nearby_hits == 1
+            # Neighbour data is only read, never copied into the point's own cell
+            assert service._coord_key("weather", *outside) not in service.cache
+
+    asyncio.run(scenario())
+
+
+def test_peeking_does_not_count_nearby_hits(mock_service):
+    async def scenario():
+        async with mock_service() as (server, service):
+            inside, outside = points_across_a_cell_edge(service.geo_precision)
+            first = await service.get_weather_by_coordinates(*inside)
+
+            assert service.peek_weather(outside) == first
+            assert service.nearby_hits == 0
+
+    asyncio.run(scenario())
+
+
+def test_fresh_fetches_are_stored_under_their_own_cell(mock_service):
+    async def scenario():
+        async with mock_service() as (server, service):
+            inside, outside = points_across_a_cell_edge(service.geo_precision)
+            await service.get_weather_by_coordinates(*inside)
+
+            data = await service.get_weather_by_coordinates(*outside, bypass_cache=True)
+            assert server.requests == 2
+            assert data["coord"]["lat"] == pytest.approx(outside[0], abs=0.01)
+            assert service.cache.get(service._coord_key("weather", *outside)) == data
+            # The neighbour's own entry is left alone
+            inside_data = service.cache.get(service._coord_key("weather", *inside))
+            assert inside_data["coord"]["lat"] == pytest.approx(inside[0], abs=0.01)
+
+    asyncio.run(scenario())
+
+
+def test_coordinates_beyond_the_tolerance_are_fetched(mock_service):
+    async def scenario():
+        async with mock_service() as (server, service):
+            await service.get_weather_by_coordinates(51.5, -0.12)
+            await service.get_weather_by_coordinates(51.55, -0.12)  # ~5.5 km away
+            assert server.requests == 2
+            assert service.nearby_hits == 0
+
+    asyncio.run(scenario())
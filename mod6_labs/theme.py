@@ -0,0 +1,154 @@
+# theme.py
+"""Weather moods, their color palettes and Flet themes."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import flet as ft
+
+MOODS = ("sunny", "cloudy", "rainy", "snowy", "stormy", "foggy", "default")
+
+
+@dataclass(frozen=True, slots=True)
+class Palette:
+    """Colors for one mood in one brightness."""
+
+    primary: str
+    secondary: str
+    text: str
+    sub_text: str
+    card: str
+    divider: str
+    background: str
+
+
+# mood -> (primary, secondary, {role: (dark, light)})
+_PALETTE_SPECS = {
+    "sunny": (ft.Colors.ORANGE_700, ft.Colors.AMBER_700, {
+        "text": (ft.Colors.WHITE, ft.Colors.BROWN_900),
+        "sub_text": (ft.Colors.ORANGE_200, ft.Colors.BROWN_700),
+        "card": (ft.Colors.ORANGE_800, ft.Colors.ORANGE_100),
+        "divider": (ft.Colors.ORANGE_400, ft.Colors.ORANGE_300),
+        "background": (ft.Colors.ORANGE_900, ft.Colors.ORANGE_50),
+    }),
+    "cloudy": (ft.Colors.BLUE_GREY_700, ft.Colors.GREY_700, {
+        "text": (ft.Colors.WHITE, ft.Colors.BLUE_GREY_900),
+        "sub_text": (ft.Colors.BLUE_GREY_300, ft.Colors.BLUE_GREY_700),
+        "card": (ft.Colors.BLUE_GREY_800, ft.Colors.BLUE_GREY_100),
+        "divider": (ft.Colors.BLUE_GREY_500, ft.Colors.BLUE_GREY_300),
+        "background": (ft.Colors.BLUE_GREY_900, ft.Colors.BLUE_GREY_50),
+    }),
+    "rainy": (ft.Colors.BLUE_700, ft.Colors.LIGHT_BLUE_700, {
+        "text": (ft.Colors.WHITE, ft.Colors.BLUE_900),
+        "sub_text": (ft.Colors.BLUE_200, ft.Colors.BLUE_700),
+        "card": (ft.Colors.BLUE_800, ft.Colors.BLUE_100),
+        "divider": (ft.Colors.BLUE_400, ft.Colors.BLUE_300),
+        "background": (ft.Colors.BLUE_900, ft.Colors.BLUE_100),
+    }),
+    "snowy": (ft.Colors.CYAN_700, ft.Colors.LIGHT_BLUE_400, {
+        "text": (ft.Colors.WHITE, ft.Colors.CYAN_900),
+        "sub_text": (ft.Colors.CYAN_200, ft.Colors.CYAN_700),
+        "card": (ft.Colors.CYAN_800, ft.Colors.CYAN_50),
+        "divider": (ft.Colors.CYAN_400, ft.Colors.CYAN_300),
+        "background": (ft.Colors.CYAN_900, ft.Colors.CYAN_50),
+    }),
+    "stormy": (ft.Colors.PURPLE_700, ft.Colors.DEEP_PURPLE_700, {
+        "text": (ft.Colors.WHITE, ft.Colors.PURPLE_900),
+        "sub_text": (ft.Colors.PURPLE_200, ft.Colors.PURPLE_700),
+        "card": (ft.Colors.PURPLE_800, ft.Colors.PURPLE_100),
+        "divider": (ft.Colors.PURPLE_400, ft.Colors.PURPLE_300),
+        "background": (ft.Colors.PURPLE_900, ft.Colors.PURPLE_50),
+    }),
+    "foggy": (ft.Colors.GREY_700, ft.Colors.BLUE_GREY_600, {
+        "text": (ft.Colors.WHITE, ft.Colors.GREY_900),
+        "sub_text": (ft.Colors.GREY_300, ft.Colors.GREY_700),
+        "card": (ft.Colors.GREY_800, ft.Colors.GREY_100),
+        "divider": (ft.Colors.GREY_500, ft.Colors.GREY_400),
+        "background": (ft.Colors.GREY_800, ft.Colors.GREY_200),
+    }),
+    "default": (ft.Colors.BLUE_700, ft.Colors.LIGHT_BLUE_700, {
+        "text": (ft.Colors.WHITE, ft.Colors.BLACK),
+        "sub_text": (ft.Colors.GREY_400, ft.Colors.GREY_700),
+        "card": (ft.Colors.BLUE_GREY_900, ft.Colors.BLUE_GREY_50),
+        "divider": (ft.Colors.GREY_700, ft.Colors.GREY_300),
+        "background": (ft.Colors.BLUE_900, ft.Colors.BLUE_50),
+    }),
+}
+
+# (mood, is_dark) -> Palette, built once at import
+PALETTES: Dict[Tuple[str, bool], Palette] = {
+    (mood, is_dark): Palette(
+        primary=primary,
+        secondary=secondary,
+        **{role: pair[0 if is_dark else 1] for role, pair in roles.items()},
+    )
+    for mood, (primary, secondary, roles) in _PALETTE_SPECS.items()
+    for is_dark in (True, False)
+}
+
+# Seed color of the Flet theme for each mood
+SEED_COLORS = {
+    "sunny": ft.Colors.ORANGE,
+    "cloudy": ft.Colors.BLUE_GREY,
+    "rainy": ft.Colors.BLUE,
+    "snowy": ft.Colors.CYAN,
+    "stormy": ft.Colors.PURPLE,
+    "foggy": ft.Colors.GREY,
+    "default": ft.Colors.BLUE,
+}
+
+# OpenWeatherMap condition id -> mood
+_MOOD_BY_ID = {
+    800: "sunny", 801: "sunny", 802: "sunny",  # clear, few/scattered clouds
+    803: "cloudy", 804: "cloudy",  # broken clouds, overcast
+    **dict.fromkeys(
+        (300, 301, 302, 310, 311, 312, 313, 314, 321,
+         500, 501, 502, 503, 504, 511, 520, 521, 522, 531),
+        "rainy",
+    ),
+    **dict.fromkeys(
+        (600, 601, 602, 611, 612, 613, 615, 616, 620, 621, 622), "snowy"
+    ),
+    **dict.fromkeys(
+        (200, 201, 202, 210, 211, 212, 221, 230, 231, 232), "stormy"
+    ),
+    **dict.fromkeys(
+        (701, 711, 721, 731, 741, 751, 761, 762, 771, 781), "foggy"
+    ),
+}
+
+# Fallback for unknown ids, checked in order against the description
+_MOOD_KEYWORDS = (
+    ("overcast", "cloudy"),
+    ("thunder", "stormy"),
+    ("drizzle", "rainy"),
+    ("rain", "rainy"),
+    ("snow", "snowy"),
+    ("fog", "foggy"),
+    ("mist", "foggy"),
+    ("cloud", "cloudy"),
+)
+
+
+def classify_mood(condition_id: int, description: str = "") -> str:
+    """Map a weather condition to a mood with a single table lookup."""
+    mood = _MOOD_BY_ID.get(condition_id)
+    if mood is not None:
+        return mood
+    description = description.lower()
+    for keyword, mood in _MOOD_KEYWORDS:
+        if keyword in description:
+            return mood
+    return "sunny"  # Default to sunny for unknown conditions
+
+
+def get_palette(mood: str, is_dark: bool) -> Palette:
+    """Return the precomputed palette for a mood and brightness."""
+    return PALETTES.get((mood, is_dark)) or PALETTES[("default", is_dark)]
+
+
+@lru_cache(maxsize=None)
+def get_theme(mood: str) -> ft.Theme:
+    """Return the Flet theme for a mood, created once per mood."""
+    return ft.Theme(color_scheme_seed=SEED_COLORS.get(mood, ft.Colors.BLUE))
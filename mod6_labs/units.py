@@ -0,0 +1,38 @@
+# units.py
+"""Unit conversion from the canonical metric values the app stores."""
+
+from typing import Union
+
+import numpy as np
+
+# Every value is fetched and stored in metric; other systems are derived
+CANONICAL_UNITS = "metric"
+UNIT_SYSTEMS = ("metric", "imperial", "standard")
+
+TEMP_SYMBOLS = {"metric": "°C", "imperial": "°F", "standard": "K"}
+SPEED_SYMBOLS = {"metric": "m/s", "imperial": "mph", "standard": "m/s"}
+
+MPS_TO_MPH = 2.2369362920544
+
+Number = Union[float, np.ndarray]
+
+
+def convert_temp(celsius: Number, units: str) -> Number:
+    """Convert Celsius (scalar or array) to the given unit system."""
+    if units == "imperial":
+        return celsius * 9 / 5 + 32
+    if units == "standard":
+        return celsius + 273.15
+    return celsius
+
+
+def convert_speed(mps: Number, units: str) -> Number:
+    """Convert metres per second (scalar or array) to the given unit system."""
+    if units == "imperial":
+        return mps * MPS_TO_MPH
+    return mps
+
+
+def next_units(units: str) -> str:
+    """Return the unit system after ``units`` in the toggle cycle."""
+    return UNIT_SYSTEMS[(UNIT_SYSTEMS.index(units) + 1) % len(UNIT_SYSTEMS)]
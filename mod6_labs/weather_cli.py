@@ -0,0 +1,227 @@
+# weather_cli.py
+"""Headless batch weather lookups with streaming CSV / JSON Lines output.
+
+Reads one location per line from a file or stdin: a city name ("London",
+"London, GB") or coordinates ("51.51,-0.13"). Blank lines and lines
+starting with ``#`` are skipped. Locations are fetched concurrently and
+each result is written as soon as it arrives (in completion order), so
+memory use stays flat however long the input is. Nothing is written to
+the app's disk cache or observation store unless ``--disk-cache`` or
+``--record-observations`` is given.
+
+Examples:
+    python weather_cli.py cities.txt --format csv -o report.csv
+    cat cities.txt | python weather_cli.py --endpoint forecast --format jsonl
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+from config import Config
+from forecast_model import ForecastModel
+from models import WeatherSnapshot
+from units import UNIT_SYSTEMS, convert_speed, convert_temp
+from weather_service import BatchResult, Query, WeatherService
+
+WEATHER_FIELDS = [
+    "query", "city", "country", "lat", "lon", "temp", "feels_like", "humidity",
+    "wind_speed", "condition_id", "description", "observed_at", "error",
+]
+FORECAST_FIELDS = [
+    "query", "city", "date", "temp_min", "temp_max", "temp_mean",
+    "humidity_mean", "wind_max", "condition_id", "description", "error",
+]
+
+
+def parse_query(line: str) -> Optional[Query]:
+    """Turn an input line into a city name or a (lat, lon) pair."""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    lat, sep, lon = line.partition(",")
+    if sep:
+        try:
+            return (float(lat), float(lon))
+        except ValueError:
+            pass  # "London, GB"
+    return line
+
+
+def read_queries(lines: Iterable[str]) -> Iterator[Query]:
+    """Lazily parse input lines, skipping blanks and comments."""
+    for line in lines:
+        query = parse_query(line)
+        if query is not None:
+            yield query
+
+
+def format_query(query: Query) -> str:
+    if isinstance(query, str):
+        return query
+    return f"{query[0]},{query[1]}"
+
+
+def weather_rows(result: BatchResult, units: str) -> List[Dict]:
+    """Flatten a current-weather result into one output row."""
+    if not result.ok:
+        return [{"query": format_query(result.query), "error": str(result.error)}]
+    snapshot = WeatherSnapshot.from_api(result.data)
+    return [{
+        "query": format_query(result.query),
+        "city": snapshot.city,
+        "country": snapshot.country,
+        "lat": snapshot.lat,
+        "lon": snapshot.lon,
+        "temp": round(convert_temp(snapshot.temp, units), 2),
+        "feels_like": round(convert_temp(snapshot.feels_like, units), 2),
+        "humidity": snapshot.humidity,
+        "wind_speed": round(convert_speed(snapshot.wind_speed, units), 2),
+        "condition_id": snapshot.condition_id,
+        "description": snapshot.description,
+        "observed_at": datetime.fromtimestamp(snapshot.observed_at, timezone.utc).isoformat(),
+    }]
+
+
+def forecast_rows(result: BatchResult, units: str) -> List[Dict]:
+    """Flatten a forecast result into one row per local day."""
+    if not result.ok:
+        return [{"query": format_query(result.query), "error": str(result.error)}]
+    model = ForecastModel.from_response(result.data)
+    daily = model.daily()
+    temp_min = convert_temp(daily.temp_min, units)
+    temp_max = convert_temp(daily.temp_max, units)
+    temp_mean = convert_temp(daily.temp_mean, units)
+    wind_max = convert_speed(daily.wind_max, units)
+    return [
+        {
+            "query": format_query(result.query),
+            "city": model.city,
+            "date": daily.dates[i].isoformat(),
+            "temp_min": round(float(temp_min[i]), 2),
+            "temp_max": round(float(temp_max[i]), 2),
+            "temp_mean": round(float(temp_mean[i]), 2),
+            "humidity_mean": round(float(daily.humidity_mean[i]), 1),
+            "wind_max": round(float(wind_max[i]), 2),
+            "condition_id": int(daily.condition_id[i]),
+            "description": daily.descriptions[i],
+        }
+        for i in range(len(daily))
+    ]
+
+
+class RowWriter:
+    """Writes rows as CSV (with a header) or JSON Lines."""
+
+    def __init__(self, out: TextIO, fmt: str, fields: List[str]):
+        self.out = out
+        self.fmt = fmt
+        if fmt == "csv":
+            self._csv = csv.DictWriter(out, fieldnames=fields, extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write(self, row: Dict):
+        if self.fmt == "csv":
+            self._csv.writerow(row)
+        else:
+            self.out.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+async def run(
+    queries: Iterable[Query],
+    out: TextIO,
+    fmt: str = "csv",
+    endpoint: str = "weather",
+    units: str = "metric",
+    concurrency: Optional[int] = None,
+    flush_every: int = 100,
+) -> Dict[str, int]:
+    """Fetch every query and stream the rows to ``out``; returns counts."""
+    if endpoint == "forecast":
+        fields, to_rows = FORECAST_FIELDS, forecast_rows
+    else:
+        fields, to_rows = WEATHER_FIELDS, weather_rows
+    writer = RowWriter(out, fmt, fields)
+    counts = {"ok": 0, "failed": 0}
+
+    async with WeatherService() as service:
+        if endpoint == "forecast":
+            results = service.get_forecast_many(queries, concurrency)
+        else:
+            results = service.get_weather_many(queries, concurrency)
+
+        async for result in results:
+            for row in to_rows(result, units):
+                writer.write(row)
+            counts["ok" if result.ok else "failed"] += 1
+            if (counts["ok"] + counts["failed"]) % flush_every == 0:
+                out.flush()
+    out.flush()
+    return counts
+
+
+async def main_async(args) -> int:
+    if args.url:
+        Config.BASE_URL = f"{args.url.rstrip('/')}/weather"
+        Config.FORECAST_URL = f"{args.url.rstrip('/')}/forecast"
+    if args.rate_limit is not None:
+        Config.RATE_LIMIT_PER_MINUTE = args.rate_limit
+    # One-off batch lookups stay out of the app's persistent stores unless asked
+    Config.DISK_CACHE_ENABLED = args.disk_cache
+    Config.OBSERVATIONS_ENABLED = args.record_observations
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    started = time.perf_counter()
+    try:
+        counts = await run(
+            read_queries(source),
+            out,
+            fmt=args.format,
+            endpoint=args.endpoint,
+            units=args.units,
+            concurrency=args.concurrency,
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"{counts['ok']} ok, {counts['failed']} failed in {elapsed:.1f}s",
+        file=sys.stderr,
+    )
+    return 1 if counts["failed"] else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch weather for many locations")
+    parser.add_argument("input", nargs="?", default="-", help="file with one location per line (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--endpoint", choices=["weather", "forecast"], default="weather")
+    parser.add_argument("--units", choices=UNIT_SYSTEMS, default=Config.UNITS)
+    parser.add_argument("--concurrency", type=int, default=Config.BATCH_CONCURRENCY, help="requests in flight")
+    parser.add_argument("--rate-limit", type=float, default=None, help="requests/min, 0 = off (default from config)")
+    parser.add_argument("--url", help="API base URL, e.g. a local mock server")
+    parser.add_argument("--disk-cache", action="store_true", help="read and write the app's disk cache")
+    parser.add_argument("--record-observations", action="store_true", help="append readings to the observation store")
+    args = parser.parse_args()
+    try:
+        sys.exit(asyncio.run(main_async(args)))
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into ``head``): stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
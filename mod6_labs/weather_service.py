@@ -1,9 +1,26 @@
 # weather_service.py
 """Weather API service layer."""
 
+import asyncio
+import importlib.util
+import time
 import httpx
-from typing import Dict
+import geohash
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Hashable,
+    Iterable, NamedTuple, Optional, Tuple, Union,
+)
+from cache import TTLCache
 from config import Config
+from disk_cache import DiskCache
+from forecast_model import ForecastModel
+from metrics import RequestMetrics, RequestTrace
+from models import WeatherSnapshot
+from observations import ObservationStore
+from resilience import (
+    CircuitBreaker, TokenBucket, backoff_delay, parse_retry_after,
+)
+from units import CANONICAL_UNITS
 
 
 class WeatherServiceError(Exception):
@@ -11,119 +28,749 @@ class WeatherServiceError(Exception):
     pass
 
 
+class ServiceUnavailableError(WeatherServiceError):
+    """The API could not be reached (timeout, network failure, 429 or 5xx).
+
+    ``retry_after`` holds the delay the server asked for, if any.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# A batch query is a city name or a (lat, lon) pair
+Query = Union[str, Tuple[float, float]]
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one item in a batch request."""
+
+    query: Any
+    data: Optional[Dict] = None
+    error: Optional[WeatherServiceError] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class WeatherService:
-    """Service for fetching weather data from OpenWeatherMap API."""
-    
-    def __init__(self):
+    """Service for fetching weather data from OpenWeatherMap API.
+
+    The service owns one long-lived ``httpx.AsyncClient`` so that repeated
+    searches reuse pooled keep-alive connections instead of paying TCP and
+    TLS setup on every call. Use it as an async context manager, or call
+    ``aclose()`` when the app shuts down.
+
+    Successful responses are kept in a bounded in-memory cache keyed by the
+    normalized query and units. Cached dictionaries are shared between
+    callers and must not be modified.
+
+    Responses are also written to a SQLite file. A recent-but-expired entry
+    is returned immediately while a fresh copy is fetched in the background,
+    and when the API is unreachable the last known response is returned.
+    Both kinds of saved data carry an ``"_as_of"`` key holding the Unix time
+    they were fetched.
+
+    Every fresh current-weather response is also appended to
+    ``observations``, a per-city columnar history for trend charts.
+
+    Coordinates are cached by geohash cell (``Config.GEO_CACHE_PRECISION``),
+    so nearby lookups share an entry. When a point's own cell has nothing
+    fresh in memory, the nearest entry in the eight surrounding cells is
+    reused if it lies within ``Config.GEO_CACHE_TOLERANCE`` metres; such
+    hits are counted in ``nearby_hits``. Fetched data is always stored
+    under the point's own cell, never a neighbour's.
+
+    Concurrent requests for the same key share a single upstream call; the
+    number of calls saved this way is counted in ``coalesced_requests``.
+
+    Upstream calls pass through a token-bucket rate limiter, transient
+    failures are retried with jittered exponential backoff, and a circuit
+    breaker fails fast while the API keeps failing.
+
+    Every upstream call is timed phase by phase (queueing for the rate
+    limiter, connect, TLS, send, server wait, body download, JSON parsing)
+    through httpx's trace extension. Timings, response sizes, cache
+    outcomes and error classes are kept in ``metrics``.
+    """
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.api_key = Config.API_KEY
         self.base_url = Config.BASE_URL
+        self.forecast_url = Config.FORECAST_URL
         self.timeout = Config.TIMEOUT
-    
-    async def get_weather(self, city: str) -> Dict:
+        self._client = client
+        self._owns_client = client is None
+        self.cache_enabled = Config.CACHE_ENABLED
+        self.cache = TTLCache(maxsize=Config.CACHE_MAX_ENTRIES)
+        self.disk_cache = (
+            DiskCache(Config.DISK_CACHE_PATH, max_age=Config.DISK_CACHE_MAX_AGE)
+            if Config.DISK_CACHE_ENABLED else None
+        )
+        self.observations = (
+            ObservationStore(Config.OBSERVATIONS_DIR)
+            if Config.OBSERVATIONS_ENABLED else None
+        )
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.geo_precision = Config.GEO_CACHE_PRECISION
+        self.geo_tolerance = Config.GEO_CACHE_TOLERANCE
+        self.upstream_requests = 0
+        self.nearby_hits = 0
+        self.coalesced_requests = 0
+        self.retried_requests = 0
+        self.metrics = RequestMetrics(window=Config.METRICS_WINDOW)
+        self.rate_limiter = TokenBucket(
+            rate=Config.RATE_LIMIT_PER_MINUTE / 60,
+            capacity=Config.RATE_LIMIT_BURST,
+        )
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=Config.CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=Config.CIRCUIT_RESET_TIMEOUT,
+        )
+
+    # ------------------ CLIENT LIFECYCLE ------------------ #
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+            self._owns_client = True
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Build a pooled client from the configured limits."""
+        limits = httpx.Limits(
+            max_connections=Config.MAX_CONNECTIONS,
+            max_keepalive_connections=Config.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=Config.KEEPALIVE_EXPIRY,
+        )
+        # HTTP/2 is optional: only enable it when the h2 package is installed
+        http2 = Config.HTTP2 and importlib.util.find_spec("h2") is not None
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=limits,
+            http2=http2,
+        )
+
+    async def aclose(self):
+        """Close the shared HTTP client and release pooled connections."""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+        if self.observations is not None:
+            self.observations.close()
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+        self._client = None
+
+    async def __aenter__(self) -> "WeatherService":
+        self.client  # open the pool eagerly
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    # ------------------ REQUESTS ------------------ #
+
+    async def _request(
+        self,
+        url: str,
+        params: Dict,
+        not_found_message: str = "Location not found.",
+    ) -> Dict:
         """
-        Fetch weather data for a given city.
-        
+        Send a GET request, retrying transient failures.
+
         Args:
-            city: Name of the city
-            
+            url: Endpoint to call
+            params: Query parameters (the API key is added here)
+            not_found_message: Message to use for a 404 response
+
         Returns:
-            Dictionary containing weather data
-            
+            Parsed JSON response
+
         Raises:
             WeatherServiceError: If the request fails
         """
-        if not city:
-            raise WeatherServiceError("City name cannot be empty")
-        
-        # Build request parameters
-        params = {
-            "q": city,
-            "appid": self.api_key,
-            "units": Config.UNITS,
-        }
-        
-        try:
-            # Make async HTTP request
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.base_url, params=params)
-                
-                # Check for HTTP errors
-                if response.status_code == 404:
-                    raise WeatherServiceError(
-                        f"City '{city}' not found. Please check the spelling."
-                    )
-                elif response.status_code == 401:
-                    raise WeatherServiceError(
-                        "Invalid API key. Please check your configuration."
-                    )
-                elif response.status_code >= 500:
-                    raise WeatherServiceError(
-                        "Weather service is currently unavailable. "
-                        "Please try again later."
-                    )
-                elif response.status_code != 200:
-                    raise WeatherServiceError(
-                        f"Error fetching weather data: {response.status_code}"
+        params = {**params, "appid": self.api_key, "units": CANONICAL_UNITS}
+
+        attempt = 0
+        while True:
+            is_trial = self.circuit_breaker.state == CircuitBreaker.HALF_OPEN
+            if not self.circuit_breaker.allow():
+                self.metrics.record_error("circuit_open")
+                raise ServiceUnavailableError(
+                    "Weather service is currently unavailable. "
+                    "Please try again later.",
+                    retry_after=self.circuit_breaker.retry_after(),
+                )
+
+            try:
+                data = await self._send(url, params, not_found_message)
+            except ServiceUnavailableError as e:
+                self.circuit_breaker.record_failure()
+                if attempt >= Config.MAX_RETRIES:
+                    raise
+                if not self.circuit_breaker.would_allow():
+                    raise  # the retry would be rejected anyway: don't wait for it
+                delay = e.retry_after
+                if delay is None:
+                    delay = backoff_delay(
+                        attempt, Config.RETRY_BACKOFF_BASE, Config.RETRY_BACKOFF_MAX
                     )
-                
-                # Parse JSON response
-                data = response.json()
+                elif delay > Config.RETRY_BACKOFF_MAX:
+                    raise  # the server wants us to wait longer than we will
+                attempt += 1
+                self.retried_requests += 1
+                await asyncio.sleep(delay)
+            except WeatherServiceError:
+                # The API answered (e.g. 404), so it is up
+                self.circuit_breaker.record_success()
+                raise
+            except BaseException:
+                # Cancelled (e.g. a superseded search): free the trial slot
+                if is_trial:
+                    self.circuit_breaker.release()
+                raise
+            else:
+                self.circuit_breaker.record_success()
                 return data
-                
+
+    async def _send(self, url: str, params: Dict, not_found_message: str) -> Dict:
+        """Send one GET request and map failures to WeatherServiceError."""
+        queued_at = time.perf_counter()
+        await self.rate_limiter.acquire()
+        started_at = time.perf_counter()
+        self.upstream_requests += 1
+
+        trace = RequestTrace()
+        phases = trace.phases
+        size = None
+        try:
+            response = await self.client.get(
+                url, params=params, extensions={"trace": trace.trace}
+            )
+            size = len(response.content)
+
+            # Check for HTTP errors
+            if response.status_code == 404:
+                raise WeatherServiceError(not_found_message)
+            elif response.status_code == 401:
+                raise WeatherServiceError(
+                    "Invalid API key. Please check your configuration."
+                )
+            elif response.status_code == 429:
+                raise ServiceUnavailableError(
+                    "Too many requests. Please try again later.",
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                )
+            elif response.status_code >= 500:
+                raise ServiceUnavailableError(
+                    "Weather service is currently unavailable. "
+                    "Please try again later.",
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                )
+            elif response.status_code != 200:
+                raise WeatherServiceError(
+                    f"Error fetching weather data: {response.status_code}"
+                )
+
+            # Parse JSON response
+            parse_started = time.perf_counter()
+            data = response.json()
+            phases["parse"] = (time.perf_counter() - parse_started) * 1000
+            return data
+
+        except WeatherServiceError:
+            self.metrics.record_error(self._error_kind(response.status_code))
+            raise
         except httpx.TimeoutException:
-            raise WeatherServiceError(
+            self.metrics.record_error("timeout")
+            raise ServiceUnavailableError(
                 "Request timed out. Please check your internet connection."
             )
         except httpx.NetworkError:
-            raise WeatherServiceError(
+            self.metrics.record_error("network")
+            raise ServiceUnavailableError(
                 "Network error. Please check your internet connection."
             )
         except httpx.HTTPError as e:
+            self.metrics.record_error("http")
             raise WeatherServiceError(f"HTTP error occurred: {str(e)}")
         except Exception as e:
+            self.metrics.record_error(type(e).__name__)
             raise WeatherServiceError(f"An unexpected error occurred: {str(e)}")
-    
+        finally:
+            finished_at = time.perf_counter()
+            phases["queue"] = (started_at - queued_at) * 1000
+            phases["total"] = (finished_at - started_at) * 1000
+            self.metrics.record_request(phases, size)
+
+    @staticmethod
+    def _error_kind(status_code: int) -> str:
+        """Group an HTTP error status for the metrics (e.g. "http_5xx")."""
+        if status_code >= 500:
+            return "http_5xx"
+        return f"http_{status_code}"
+
+    # ------------------ CACHING ------------------ #
+
+    @staticmethod
+    def normalize_city(city: str) -> str:
+        """Normalize a city name so equivalent queries share a cache key."""
+        return " ".join(city.split()).casefold()
+
+    def _city_key(self, kind: str, city: str) -> Hashable:
+        return (kind, "q", self.normalize_city(city), CANONICAL_UNITS)
+
+    def _cell_key(self, kind: str, cell: str) -> Hashable:
+        return (kind, "geo", cell, CANONICAL_UNITS)
+
+    def _coord_key(self, kind: str, lat: float, lon: float) -> Hashable:
+        """Cache key of the geohash cell containing a point."""
+        return self._cell_key(kind, geohash.encode(lat, lon, self.geo_precision))
+
+    def _nearby(self, kind: str, lat: float, lon: float) -> Optional[Dict]:
+        """A fresh response from a neighbouring cell, if one is close enough.
+
+        Only consulted when the point's own cell has nothing fresh in
+        memory. Among the neighbouring cells with a fresh entry, the one
+        fetched nearest to the point is returned if it lies within
+        ``geo_tolerance`` metres. Neighbour entries are only ever read;
+        fresh data is always stored under the point's own cell.
+        """
+        cell = geohash.encode(lat, lon, self.geo_precision)
+        if (
+            not self.cache_enabled
+            or self.geo_tolerance <= 0
+            or self._cell_key(kind, cell) in self.cache
+        ):
+            return None
+
+        best, best_distance = None, self.geo_tolerance
+        for neighbor in geohash.neighbors(cell):
+            data = self.cache.peek(self._cell_key(kind, neighbor))
+            where = self._coords_of(data) if data is not None else None
+            if where is None:
+                continue
+            d = geohash.distance(lat, lon, *where)
+            if d <= best_distance:
+                best, best_distance = data, d
+        return best
+
+    async def _coord_request(
+        self,
+        kind: str,
+        lat: float,
+        lon: float,
+        ttl: float,
+        url: str,
+        not_found_message: str,
+        bypass_cache: bool = False,
+    ) -> Dict:
+        """Serve a coordinate request from its own cell or a close neighbour."""
+        if not bypass_cache:
+            data = self._nearby(kind, lat, lon)
+            if data is not None:
+                self.nearby_hits += 1
+                self.metrics.record_cache("memory")
+                return data
+        return await self._cached_request(
+            self._coord_key(kind, lat, lon),
+            ttl,
+            url,
+            {"lat": lat, "lon": lon},
+            not_found_message,
+            bypass_cache,
+        )
+
+    @staticmethod
+    def _coords_of(data: Dict) -> Optional[Tuple[float, float]]:
+        """Where a weather or forecast response was fetched for."""
+        coord = data.get("coord") or data.get("city", {}).get("coord")
+        if not coord or "lat" not in coord or "lon" not in coord:
+            return None
+        return coord["lat"], coord["lon"]
+
+    async def _cached_request(
+        self,
+        key: Hashable,
+        ttl: float,
+        url: str,
+        params: Dict,
+        not_found_message: str,
+        bypass_cache: bool = False,
+    ) -> Dict:
+        """Serve a request from the caches, fetching and storing on a miss."""
+        use_cache = self.cache_enabled and not bypass_cache
+        if use_cache:
+            data = self.cache.get(key)
+            if data is not None:
+                self.metrics.record_cache("memory")
+                return data
+
+        saved = self.disk_cache.get(key) if self.disk_cache else None
+        if use_cache and saved is not None:
+            data, fetched_at = saved
+            age = time.time() - fetched_at
+            if age < ttl:
+                self.metrics.record_cache("disk")
+                self.cache.set(key, data, ttl - age)
+                return data
+            if age < ttl + Config.STALE_WHILE_REVALIDATE:
+                # Serve the stale copy now and refresh it in the background
+                self.metrics.record_cache("stale")
+                self._revalidate(key, ttl, url, params, not_found_message)
+                return self._mark_as_of(data, fetched_at)
+
+        self.metrics.record_cache("miss" if use_cache else "bypass")
+        try:
+            # Shield the shared fetch so one caller's cancellation
+            # does not cancel it for everyone else waiting on it
+            return await asyncio.shield(
+                self._fetch(key, ttl, url, params, not_found_message)
+            )
+        except ServiceUnavailableError:
+            if saved is None:
+                raise
+            # Offline: fall back to the last known response
+            self.metrics.record_cache("fallback")
+            return self._mark_as_of(*saved)
+
+    def _fetch(
+        self,
+        key: Hashable,
+        ttl: float,
+        url: str,
+        params: Dict,
+        not_found_message: str,
+    ) -> asyncio.Task:
+        """Return the in-flight fetch for a key, starting one if needed."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced_requests += 1
+            return task
+
+        async def fetch():
+            data = await self._request(url, params, not_found_message)
+            self._store(key, data, ttl)
+            return data
+
+        task = asyncio.create_task(fetch())
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._fetch_done(key, t))
+        return task
+
+    def _fetch_done(self, key: Hashable, task: asyncio.Task):
+        """Forget a finished fetch and mark its error as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def _store(self, key: Hashable, data: Dict, ttl: float):
+        """Save a fresh response in memory and on disk, and record observations."""
+        if self.cache_enabled:
+            self.cache.set(key, data, ttl)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, data)
+        if self.observations is not None and key[0] == "weather":
+            self.observations.append(data)
+
+    def _revalidate(
+        self,
+        key: Hashable,
+        ttl: float,
+        url: str,
+        params: Dict,
+        not_found_message: str,
+    ):
+        """Refresh a stale entry in the background (once per key)."""
+        # Failures are ignored; the saved copy keeps being served
+        if key not in self._inflight:
+            self._fetch(key, ttl, url, params, not_found_message)
+
+    @staticmethod
+    def _mark_as_of(data: Dict, fetched_at: float) -> Dict:
+        """Return a copy of saved data tagged with when it was fetched."""
+        return {**data, "_as_of": fetched_at}
+
+    def _query_key(self, kind: str, query: Query) -> Hashable:
+        if isinstance(query, str):
+            return self._city_key(kind, query)
+        lat, lon = query
+        return self._coord_key(kind, lat, lon)
+
+    def _peek(self, key: Hashable) -> Optional[Dict]:
+        """Return a saved response of any age without calling the API."""
+        if self.cache_enabled:
+            data = self.cache.get(key)
+            if data is not None:
+                return data
+        saved = self.disk_cache.get(key) if self.disk_cache else None
+        if saved is None:
+            return None
+        return self._mark_as_of(*saved)
+
+    def _peek_query(self, kind: str, query: Query) -> Optional[Dict]:
+        if not isinstance(query, str):
+            # A close neighbour's fresh data (not counted in nearby_hits)
+            data = self._nearby(kind, *query)
+            if data is not None:
+                return data
+        return self._peek(self._query_key(kind, query))
+
+    def peek_weather(self, query: Query) -> Optional[Dict]:
+        """Saved current weather for a city or (lat, lon), or None.
+
+        Never touches the network, so a view can show the last known data
+        at once while a fresh request is on its way. Data read from disk
+        carries ``"_as_of"``.
+        """
+        return self._peek_query("weather", query)
+
+    def peek_forecast(self, query: Query) -> Optional[Dict]:
+        """Saved forecast for a city or (lat, lon), or None; see peek_weather."""
+        return self._peek_query("forecast", query)
+
+    def clear_cache(self):
+        """Forget every cached response held in memory."""
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request counters together with the cache statistics."""
+        return {
+            "upstream_requests": self.upstream_requests,
+            "coalesced_requests": self.coalesced_requests,
+            "nearby_hits": self.nearby_hits,
+            "retried_requests": self.retried_requests,
+            "circuit_state": self.circuit_breaker.state,
+            "in_flight": len(self._inflight),
+            **{f"cache_{name}": value for name, value in self.cache.stats().items()},
+        }
+
+    # ------------------ PUBLIC API ------------------ #
+
+    async def get_weather(self, city: str, bypass_cache: bool = False) -> Dict:
+        """
+        Fetch weather data for a given city.
+
+        Args:
+            city: Name of the city
+            bypass_cache: Skip the cache lookup and always hit the API
+
+        Returns:
+            Dictionary containing weather data
+
+        Raises:
+            WeatherServiceError: If the request fails
+        """
+        if not city or not city.strip():
+            raise WeatherServiceError("City name cannot be empty")
+
+        return await self._cached_request(
+            self._city_key("weather", city),
+            Config.WEATHER_CACHE_TTL,
+            self.base_url,
+            {"q": city.strip()},
+            f"City '{city}' not found. Please check the spelling.",
+            bypass_cache,
+        )
+
     async def get_weather_by_coordinates(
-        self, 
-        lat: float, 
-        lon: float
+        self,
+        lat: float,
+        lon: float,
+        bypass_cache: bool = False,
     ) -> Dict:
         """
         Fetch weather data by coordinates.
-        
+
         Args:
             lat: Latitude
             lon: Longitude
-            
+            bypass_cache: Skip the cache lookup and always hit the API
+
         Returns:
             Dictionary containing weather data
         """
-        params = {
-            "lat": lat,
-            "lon": lon,
-            "appid": self.api_key,
-            "units": Config.UNITS,
-        }
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                return response.json()
-                
-        except Exception as e:
-            raise WeatherServiceError(f"Error fetching weather data: {str(e)}")
-        
-    async def get_forecast(self, city: str) -> Dict:
+        return await self._coord_request(
+            "weather",
+            lat,
+            lon,
+            Config.WEATHER_CACHE_TTL,
+            self.base_url,
+            f"No weather data found for ({lat}, {lon}).",
+            bypass_cache,
+        )
+
+    async def get_forecast(self, city: str, bypass_cache: bool = False) -> Dict:
         """Get 5-day weather forecast."""
-        forecast_url = "https://api.openweathermap.org/data/2.5/forecast"
-        params = {
-            "q": city,
-            "appid": self.api_key,
-            "units": Config.UNITS,
-        }
-            
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(forecast_url, params=params)
-            response.raise_for_status()
-            return response.json()
\ No newline at end of file
+        if not city or not city.strip():
+            raise WeatherServiceError("City name cannot be empty")
+
+        return await self._cached_request(
+            self._city_key("forecast", city),
+            Config.FORECAST_CACHE_TTL,
+            self.forecast_url,
+            {"q": city.strip()},
+            f"City '{city}' not found. Please check the spelling.",
+            bypass_cache,
+        )
+
+    async def get_forecast_by_coordinates(
+        self,
+        lat: float,
+        lon: float,
+        bypass_cache: bool = False,
+    ) -> Dict:
+        """Get 5-day weather forecast by coordinates."""
+        return await self._coord_request(
+            "forecast",
+            lat,
+            lon,
+            Config.FORECAST_CACHE_TTL,
+            self.forecast_url,
+            f"No forecast found for ({lat}, {lon}).",
+            bypass_cache,
+        )
+
+    # ------------------ TYPED RESULTS ------------------ #
+
+    async def get_weather_snapshot(
+        self, city: str, bypass_cache: bool = False
+    ) -> WeatherSnapshot:
+        """Fetch current weather for a city as a WeatherSnapshot."""
+        return WeatherSnapshot.from_api(await self.get_weather(city, bypass_cache))
+
+    async def get_weather_snapshot_by_coordinates(
+        self, lat: float, lon: float, bypass_cache: bool = False
+    ) -> WeatherSnapshot:
+        """Fetch current weather for coordinates as a WeatherSnapshot."""
+        return WeatherSnapshot.from_api(
+            await self.get_weather_by_coordinates(lat, lon, bypass_cache)
+        )
+
+    async def get_forecast_model(
+        self, city: str, bypass_cache: bool = False
+    ) -> ForecastModel:
+        """Fetch the 5-day forecast for a city as a columnar ForecastModel."""
+        return ForecastModel.from_response(await self.get_forecast(city, bypass_cache))
+
+    async def get_forecast_model_by_coordinates(
+        self, lat: float, lon: float, bypass_cache: bool = False
+    ) -> ForecastModel:
+        """Fetch the 5-day forecast for coordinates as a ForecastModel."""
+        return ForecastModel.from_response(
+            await self.get_forecast_by_coordinates(lat, lon, bypass_cache)
+        )
+
+    # ------------------ BATCH API ------------------ #
+
+    async def get_weather_many(
+        self,
+        queries: Union[Iterable[Query], AsyncIterable[Query]],
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Fetch current weather for many cities or coordinates.
+
+        Args:
+            queries: City names and/or (lat, lon) pairs; may be lazy
+            concurrency: Maximum requests in flight (default from Config)
+
+        Yields:
+            BatchResult for each query, in completion order. Failures
+            (including malformed queries) are reported in
+            ``BatchResult.error`` as WeatherServiceError instead of being
+            raised.
+        """
+        async def fetch(query: Query) -> Dict:
+            if isinstance(query, str):
+                return await self.get_weather(query)
+            lat, lon = query
+            return await self.get_weather_by_coordinates(lat, lon)
+
+        async for result in self._run_many(fetch, queries, concurrency):
+            yield result
+
+    async def get_forecast_many(
+        self,
+        queries: Union[Iterable[Query], AsyncIterable[Query]],
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BatchResult]:
+        """Fetch 5-day forecasts for many cities or coordinates; see ``get_weather_many``."""
+        async def fetch(query: Query) -> Dict:
+            if isinstance(query, str):
+                return await self.get_forecast(query)
+            lat, lon = query
+            return await self.get_forecast_by_coordinates(lat, lon)
+
+        async for result in self._run_many(fetch, queries, concurrency):
+            yield result
+
+    async def _run_many(
+        self,
+        fetch: Callable[[Any], Awaitable[Dict]],
+        queries: Union[Iterable, AsyncIterable],
+        concurrency: Optional[int],
+    ) -> AsyncIterator[BatchResult]:
+        """Run ``fetch`` over queries with at most ``concurrency`` in flight.
+
+        Queries are pulled from the input only as slots free up, so memory
+        use stays constant no matter how long the input is.
+        """
+        limit = max(1, concurrency or Config.BATCH_CONCURRENCY)
+
+        if hasattr(queries, "__aiter__"):
+            source = queries.__aiter__()
+            next_query = source.__anext__
+        else:
+            iterator = iter(queries)
+
+            async def next_query():
+                try:
+                    return next(iterator)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        async def run(query) -> BatchResult:
+            try:
+                return BatchResult(query, await fetch(query))
+            except WeatherServiceError as e:
+                return BatchResult(query, error=e)
+            except Exception as e:
+                # A bad query or a bug must not abort the rest of the batch
+                error = WeatherServiceError(f"An unexpected error occurred: {str(e)}")
+                error.__cause__ = e
+                return BatchResult(query, error=error)
+
+        pending = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < limit:
+                    try:
+                        query = await next_query()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.create_task(run(query)))
+
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # The caller stopped early (or failed): drop outstanding work
+            for task in pending:
+                task.cancel()
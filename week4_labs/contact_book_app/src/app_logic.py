@@ -7,6 +7,7 @@ from database import (
     add_contact_db,
     get_all_contacts_db,
 )
+from update_batcher import batcher_for
 
 def display_contacts(page, contacts_list_view, db_conn, search_term=""):
     """Fetches and displays contacts, with optional search filter."""
@@ -17,11 +18,14 @@ def display_contacts(page, contacts_list_view, db_conn, search_term=""):
         contact_id, name, phone, email = contact
 
         # helper functions that "freeze" the current contact values
+        # Handlers run on worker threads: batch() sends what they change at once
         def on_edit_click(e, c=contact):
-            open_edit_dialog(page, c, db_conn, contacts_list_view)
+            with batcher_for(page).batch():
+                open_edit_dialog(page, c, db_conn, contacts_list_view)
 
         def on_delete_click(e, cid=contact_id):
-            delete_contact(page, cid, db_conn, contacts_list_view)
+            with batcher_for(page).batch():
+                delete_contact(page, cid, db_conn, contacts_list_view)
 
         contact_card = ft.Card(
             content=ft.Container(
@@ -51,7 +55,7 @@ def display_contacts(page, contacts_list_view, db_conn, search_term=""):
 
         contacts_list_view.controls.append(contact_card)
 
-    page.update()
+    batcher_for(page).request()
 
 def add_contact(page, inputs, contacts_list_view, db_conn):
     """Adds a new contact and refreshes the list."""
@@ -76,7 +80,7 @@ def add_contact(page, inputs, contacts_list_view, db_conn):
 
     # If any errors then stop
     if has_error:
-        page.update()
+        batcher_for(page).request()
         return
 
     # If valid then save to DB
@@ -87,8 +91,8 @@ def add_contact(page, inputs, contacts_list_view, db_conn):
         field.value = ""
         field.error_text = None
 
+    # display_contacts sends the cleared inputs along with the new list
     display_contacts(page, contacts_list_view, db_conn)
-    page.update()
 
 
 def delete_contact(page, contact_id, db_conn, contacts_list_view):
@@ -96,13 +100,14 @@ def delete_contact(page, contact_id, db_conn, contacts_list_view):
 
     def confirm_delete(e):
         delete_contact_db(db_conn, contact_id)
-        dialog.open = False
-        page.update()
-        display_contacts(page, contacts_list_view, db_conn)
+        # Close the dialog and refresh the list in one update
+        with batcher_for(page).batch():
+            dialog.open = False
+            display_contacts(page, contacts_list_view, db_conn)
 
     def close_dialog(e=None):
         dialog.open = False
-        page.update()
+        batcher_for(page).request()
 
     dialog = ft.AlertDialog(
         modal=True,
@@ -125,7 +130,7 @@ def delete_contact(page, contact_id, db_conn, contacts_list_view):
         page.overlay.append(dialog)
 
     dialog.open = True
-    page.update()
+    batcher_for(page).request()
 
 
 def open_edit_dialog(page, contact, db_conn, contacts_list_view):
@@ -140,9 +145,10 @@ def open_edit_dialog(page, contact, db_conn, contacts_list_view):
     # Function to save changes
     def save_and_close(e):
         update_contact_db(db_conn, contact_id, edit_name.value, edit_phone.value, edit_email.value)
-        dialog.open = False
-        page.update()
-        display_contacts(page, contacts_list_view, db_conn)
+        # Close the dialog and refresh the list in one update
+        with batcher_for(page).batch():
+            dialog.open = False
+            display_contacts(page, contacts_list_view, db_conn)
 
     # Define the dialog
     dialog = ft.AlertDialog(
@@ -159,13 +165,13 @@ def open_edit_dialog(page, contact, db_conn, contacts_list_view):
     # Helper to close dialog
     def close_dialog():
         dialog.open = False
-        page.update()
+        batcher_for(page).request()
 
     # Attach to page properly
     if dialog not in page.overlay:
         page.overlay.append(dialog)
 
     dialog.open = True
-    page.update()
+    batcher_for(page).request()
     page.dialog = dialog
 
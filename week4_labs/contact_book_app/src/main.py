@@ -2,6 +2,7 @@
 import flet as ft
 from database import init_db
 from app_logic import display_contacts, add_contact
+from update_batcher import batcher_for
 
 def main(page: ft.Page):
     page.title = "Contact Book"
@@ -10,6 +11,7 @@ def main(page: ft.Page):
     page.window_height = 600
 
     db_conn = init_db()
+    updates = batcher_for(page)
 
     # Input fields with icons
     name_input = ft.TextField(
@@ -34,12 +36,21 @@ def main(page: ft.Page):
     # Contacts list
     contacts_list_view = ft.ListView(expand=1, spacing=10, auto_scroll=True)
 
+    # Handlers run on worker threads: batch() sends what they change at once
+    def on_add_click(e):
+        with updates.batch():
+            add_contact(
+                page, (name_input, phone_input, email_input), contacts_list_view, db_conn
+            )
+
+    def on_search_change(e):
+        with updates.batch():
+            display_contacts(page, contacts_list_view, db_conn, search_field.value)
+
     # Add button
     add_button = ft.ElevatedButton(
         text="Add Contact",
-        on_click=lambda e: add_contact(
-            page, (name_input, phone_input, email_input), contacts_list_view, db_conn
-        ),
+        on_click=on_add_click,
     )
 
     # Search field
@@ -47,19 +58,18 @@ def main(page: ft.Page):
         label="Search Contacts",
         width=350,
         prefix_icon=ft.Icons.SEARCH,   # 🔍 search icon
-        on_change=lambda e: display_contacts(
-            page, contacts_list_view, db_conn, search_field.value
-        ),
+        on_change=on_search_change,
     )
 
 
     # Dark mode switch
     def toggle_theme(e):
-        if theme_switch.value:
-            page.theme_mode = ft.ThemeMode.DARK
-        else:
-            page.theme_mode = ft.ThemeMode.LIGHT
-        page.update()
+        with updates.batch():
+            if theme_switch.value:
+                page.theme_mode = ft.ThemeMode.DARK
+            else:
+                page.theme_mode = ft.ThemeMode.LIGHT
+            updates.request()
 
     theme_switch = ft.Switch(label="Dark Mode", value=False, on_change=toggle_theme)
 
@@ -0,0 +1,95 @@
+# update_batcher.py
+"""Coalesce page.update() calls into fewer round-trips."""
+
+import threading
+import weakref
+from contextlib import contextmanager
+
+import flet as ft
+
+
+class UpdateBatcher:
+    """Merges update requests so the page is sent to the client once.
+
+    ``request()`` marks the page dirty. Requests made inside a ``batch()``
+    block are sent together when the outermost block exits; other requests
+    are sent on the next event-loop tick. Async handlers run on the event
+    loop, so everything one changes before its next ``await`` (or before it
+    returns) goes out in a single ``page.update()``.
+
+    Flet runs sync handlers on worker threads, where that tick can come
+    while the handler is still changing controls. A sync handler must wrap
+    its body in ``batch()`` to get the same guarantee.
+    ``saved`` counts the updates that were merged away.
+    """
+
+    def __init__(self, page: ft.Page):
+        self.page = page
+        self._lock = threading.Lock()
+        self._pending = False
+        self._scheduled = False
+        self._depth = 0
+        self.requested = 0
+        self.sent = 0
+
+    @property
+    def saved(self) -> int:
+        return self.requested - self.sent
+
+    def request(self):
+        """Ask for a page update; it is sent once per batch or loop tick."""
+        with self._lock:
+            self.requested += 1
+            self._pending = True
+            if self._depth or self._scheduled:
+                return
+            self._scheduled = True
+        # Safe from handler threads as well as from the event loop
+        self.page.loop.call_soon_threadsafe(self.flush)
+
+    def flush(self):
+        """Send a pending update now."""
+        with self._lock:
+            self._scheduled = False
+            if not self._pending or self._depth:
+                return
+            self._pending = False
+            self.sent += 1
+        self.page.update()
+
+    @contextmanager
+    def batch(self):
+        """Defer every request made inside the block until it exits."""
+        with self._lock:
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+            self.flush()
+
+
+_batchers = weakref.WeakKeyDictionary()
+
+
+def batcher_for(page: ft.Page) -> UpdateBatcher:
+    """Return the batcher shared by every handler of a page."""
+    batcher = _batchers.get(page)
+    if batcher is None:
+        batcher = _batchers[page] = UpdateBatcher(page)
+    return batcher
+
+
+def patch(control: ft.Control, **props) -> bool:
+    """Assign only the properties that differ; return True if any did.
+
+    Unchanged properties are left alone so the next update does not send
+    them again, and callers can skip the update when nothing changed.
+    """
+    changed = False
+    for name, value in props.items():
+        if getattr(control, name) != value:
+            setattr(control, name, value)
+            changed = True
+    return changed